@@ -0,0 +1,64 @@
+"""Benchmark of PhoneticTrie query latency against the number of indexed codes"""
+import argparse
+import os
+import random
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import load_words
+from phonetic_fr import PhoneticTrie, levenshtein, phonetic_many
+
+
+def mutated_codes(codes, count, seed=0):
+    """Derives count distinct codes from real ones by editing a letter"""
+    rnd = random.Random(seed)
+    result = set(codes)
+    while len(result) < count:
+        code = list(rnd.choice(codes) or 'A')
+        code[rnd.randrange(len(code))] = rnd.choice('ABDEFGIJKLMNOPRSTUVZ')
+        result.add(''.join(code))
+    return list(result)[:count]
+
+
+def scan(codes, query, max_distance):
+    """Returns the codes within max_distance of query by comparing them all"""
+    return [code for code in codes if levenshtein(query, code, max_distance) <= max_distance]
+
+
+def latency(func, queries):
+    """Returns the mean latency of func over queries, in microseconds"""
+    start = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Benchmark PhoneticTrie query latency')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Numbers of indexed codes')
+    parser.add_argument('-k', '--max-distance', type=int, default=1,
+                        help='Maximum edit distance of the queries')
+    parser.add_argument('-q', '--queries', type=int, default=100,
+                        help='Number of queries per size')
+    args = parser.parse_args()
+
+    codes = sorted(set(phonetic_many(load_words())))
+    queries = random.Random(1).sample(codes, args.queries)
+    max_distance = args.max_distance
+    print(f"max distance {max_distance}")
+    for size in args.sizes:
+        indexed = mutated_codes(codes, size)
+        trie = PhoneticTrie(indexed)
+        trie_latency = latency(partial(trie.search, max_distance=max_distance), queries)
+        scan_latency = latency(partial(scan, indexed, max_distance=max_distance), queries[:10])
+        print(f"{size:9,d} codes: trie {trie_latency:10,.0f} us/query, "
+              f"scan {scan_latency:12,.0f} us/query")
+
+
+if __name__ == '__main__':
+    main()
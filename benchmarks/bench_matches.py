@@ -0,0 +1,71 @@
+"""Benchmark of best_matches() latency against the number of candidates.
+
+Compares a PhoneticMatcher with NumPy, the same matcher searching a trie, and
+a scan calling levenshtein() on the code of every candidate, then measures
+distance_matrix() on a batch of queries.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_fuzzy import latency
+from bench_phonetic import load_words
+from phonetic_fr import PhoneticMatcher, levenshtein, phonetic, phonetic_many
+
+
+def candidate_words(words, count, seed=0):
+    """Returns count candidates drawn from words, some of them inflected"""
+    rnd = random.Random(seed)
+    return [rnd.choice(words) + rnd.choice(['', '', 'e', 's', 'x']) for _ in range(count)]
+
+
+def scan(codes, query, k, max_distance):
+    """Returns the k closest codes by comparing the code of query to all of them"""
+    code = phonetic(query)
+    distances = ((levenshtein(code, other, max_distance), index)
+                 for index, other in enumerate(codes))
+    return sorted(match for match in distances if match[0] <= max_distance)[:k]
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Benchmark best_matches() latency')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Numbers of candidates')
+    parser.add_argument('-d', '--max-distance', type=int, default=2,
+                        help='Maximum edit distance of the matches')
+    parser.add_argument('-k', type=int, default=5, help='Number of matches per query')
+    parser.add_argument('-q', '--queries', type=int, default=50,
+                        help='Number of queries per size')
+    args = parser.parse_args()
+
+    words = load_words()
+    queries = random.Random(1).sample(words, args.queries)
+    print(f"max distance {args.max_distance}, k {args.k}")
+    for size in args.sizes:
+        candidates = candidate_words(words, size)
+        vectorized = PhoneticMatcher(candidates)
+        trie = PhoneticMatcher(candidates, vectorized=False)
+        codes = phonetic_many(candidates)
+        results = {}
+        for name, func in (('numpy', vectorized.best_matches), ('trie', trie.best_matches),
+                           ('scan', partial(scan, codes))):
+            # le parcours complet est trop lent pour toutes les requêtes
+            sample = queries[:5] if name == 'scan' else queries
+            results[name] = latency(partial(func, k=args.k, max_distance=args.max_distance),
+                                    sample)
+        start = time.perf_counter()
+        vectorized.distance_matrix(queries, args.max_distance)
+        matrix = (time.perf_counter() - start) / len(queries) * 1e6
+        print(f"{size:9,d} candidates: " +
+              ", ".join(f"{name} {value:10,.0f} us/query" for name, value in results.items()) +
+              f", matrix {matrix:8,.0f} us/row")
+
+
+if __name__ == '__main__':
+    main()
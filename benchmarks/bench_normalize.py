@@ -0,0 +1,69 @@
+"""Benchmark of the normalization done before the rules of phonetic().
+
+Compares, on the corpora of the benchmark suite, the prelude of the reference
+implementation (filter, upper case and two translations with tables built on
+every call), the prelude of the engine before the single-pass table, and the
+current one: _normalize() followed by the accent folding, skipped for ASCII
+words.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import words_per_second
+from bench_suite import corpora
+from phonetic_fr.phonetic_fr import _FOLD_ACCENTS, _normalize, _translation_table
+from phonetic_fr.rules import ACCENTS, MIN_TO_MAJ
+
+_PREVIOUS_FOLD = _translation_table(MIN_TO_MAJ, ACCENTS)
+
+
+def reference_prelude(french_word):
+    """Normalization of the reference implementation"""
+    french_word = ''.join(char for char in french_word if char.isalpha()).upper()
+    saved_word = french_word.translate(str.maketrans(MIN_TO_MAJ))
+    saved_word = saved_word.translate(str.maketrans(ACCENTS))
+    french_word = french_word.translate(str.maketrans(MIN_TO_MAJ))
+    return saved_word, french_word.translate(str.maketrans(ACCENTS))
+
+
+def previous_prelude(french_word):
+    """Normalization of the engine with a filter and a prebuilt folding table"""
+    french_word = ''.join(filter(str.isalpha, french_word)).upper()
+    return french_word.translate(_PREVIOUS_FOLD), french_word.translate(_PREVIOUS_FOLD)
+
+
+def current_prelude(french_word):
+    """Normalization of the engine with the single-pass table and the ASCII fast path"""
+    french_word = _normalize(french_word)
+    if french_word.isascii():
+        return french_word, french_word
+    return french_word.translate(_FOLD_ACCENTS), french_word.translate(_FOLD_ACCENTS)
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Benchmark the normalization of words')
+    parser.add_argument('-n', '--words', type=int, default=20000,
+                        help='Number of words of each corpus')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='Number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    print(f"{'corpus':12} {'reference':>12} {'previous':>12} {'current':>12} {'speedup':>8}")
+    words_by_corpus = corpora(args.words)
+    # mots suivis d'une ponctuation, comme dans un texte
+    words_by_corpus['punctuated'] = [f"{word}," for word in words_by_corpus['names']]
+    for name, words in words_by_corpus.items():
+        reference = words_per_second(reference_prelude, words, args.repeat)
+        previous = words_per_second(previous_prelude, words, args.repeat)
+        current = words_per_second(current_prelude, words, args.repeat)
+        print(f"{name:12} {reference:12,.0f} {previous:12,.0f} {current:12,.0f} "
+              f"{current / previous:7.2f}x")
+    print("words/sec, speedup of the current prelude over the previous one")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark of phonetic_parallel() throughput against the number of workers"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import load_words
+from phonetic_fr import phonetic_parallel
+from phonetic_fr.parallel import DEFAULT_CHUNK_SIZE, _init_worker
+
+
+def main():
+    """Entrypoint"""
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark phonetic_parallel() scaling')
+    parser.add_argument('-w', '--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1))),
+                        help='Numbers of worker processes to measure')
+    parser.add_argument('-c', '--chunksize', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Number of words sent to a worker at once')
+    args = parser.parse_args()
+
+    # mots distincts pour que les caches des processus ne faussent pas la mesure
+    words = load_words()
+    print(f"{len(words)} words, {cpus} CPUs")
+    baseline = None
+    for workers in args.workers:
+        # le démarrage des processus n'est pas mesuré
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            list(executor.map(abs, range(workers)))
+            start = time.perf_counter()
+            phonetic_parallel(words, workers, args.chunksize, executor)
+            throughput = len(words) / (time.perf_counter() - start)
+        baseline = baseline or throughput
+        print(f"{workers:3d} workers: {throughput:12,.0f} words/sec "
+              f"({throughput / baseline:5.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
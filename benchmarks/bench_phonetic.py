@@ -0,0 +1,87 @@
+"""Benchmark of phonetic() against the frozen reference implementation"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import (phonetic, phonetic_many, phonetic_text,
+                         cache_clear, cache_info, set_cache_size)
+from phonetic_fr.cache import DEFAULT_CACHE_SIZE
+from phonetic_fr.reference import phonetic as reference_phonetic
+
+TEST_CASES = os.path.join(os.path.dirname(__file__), '../tests/test_cases.txt')
+
+
+def load_words(filename=TEST_CASES):
+    """Loads the input words of the test case file"""
+    words = []
+    with open(filename, 'r', encoding="utf-8") as file:
+        for line in file:
+            line = line.split('#')[0]
+            if line.strip():
+                words.append(line.split()[0])
+    return words
+
+
+def words_per_second(func, words, repeat):
+    """Returns the best throughput of func over words, in words/sec"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            func(word)
+        best = min(best, time.perf_counter() - start)
+    return len(words) / best
+
+
+def zipf_sample(words, count, seed=0):
+    """Draws count words following a Zipf distribution over words"""
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    return random.Random(seed).choices(words, weights, k=count)
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Benchmark phonetic() throughput')
+    parser.add_argument('-n', '--words', type=int, default=20000,
+                        help='Number of test case words to encode')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    words = load_words()[:args.words]
+    reference = words_per_second(reference_phonetic, words, args.repeat)
+    set_cache_size(0)
+    engine = words_per_second(phonetic, words, args.repeat)
+    print(f"reference: {reference:12,.0f} words/sec")
+    print(f"engine:    {engine:12,.0f} words/sec")
+    print(f"speedup:   {engine / reference:12.2f}x")
+
+    set_cache_size(DEFAULT_CACHE_SIZE)
+    cache_clear()
+    zipf = zipf_sample(words, len(words))
+    cached = words_per_second(phonetic, zipf, 1)
+    info = cache_info()
+    print(f"cached:    {cached:12,.0f} words/sec (zipf, hit rate "
+          f"{info.hits / (info.hits + info.misses):.0%})")
+
+    cache_clear()
+    start = time.perf_counter()
+    phonetic_many(zipf)
+    batch = len(zipf) / (time.perf_counter() - start)
+    print(f"batch:     {batch:12,.0f} words/sec (zipf, phonetic_many)")
+
+    # texte long, le cache est chaud pour ne mesurer que le découpage
+    text = ' '.join(zipf)
+    phonetic_text(text)
+    start = time.perf_counter()
+    phonetic_text(text)
+    chars = len(text) / (time.perf_counter() - start)
+    print(f"text:      {chars:12,.0f} chars/sec (phonetic_text)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""Benchmark suite of phonetic(), phonetic_text() and the command line tool.
+
+Every corpus is generated from a fixed seed, so runs are comparable across
+machines and commits without any download. Results are written as JSON and can
+be compared with a previous run, failing when a metric regresses by more than
+a threshold:
+
+    python benchmarks/bench_suite.py --output baseline.json
+    python benchmarks/bench_suite.py --compare baseline.json --threshold 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import load_words
+from phonetic_fr import (phonetic, phonetic_text, cache_clear, rules_fingerprint, set_cache_size,
+                         __version__)
+from phonetic_fr.cache import DEFAULT_CACHE_SIZE
+
+SCHEMA = 1
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+ONSETS = ['', 'b', 'c', 'ch', 'd', 'f', 'g', 'gu', 'j', 'l', 'm', 'n', 'p', 'qu', 'r', 's',
+          't', 'v', 'br', 'cl', 'cr', 'dr', 'fl', 'gr', 'pl', 'pr', 'tr', 'vr']
+NUCLEI = ['a', 'e', 'i', 'o', 'u', 'ou', 'ai', 'au', 'eau', 'ei', 'eu', 'oi', 'an', 'en', 'in',
+          'on', 'un', 'ain', 'ein', 'oin', 'ie', 'ille', 'ette']
+CODAS = ['', '', '', 'r', 'l', 's', 't', 'x', 'n', 'm', 'c', 'rt', 'st', 'sse', 'nne', 'lle']
+ACCENTED = ['é', 'è', 'ê', 'ë', 'à', 'â', 'î', 'ï', 'ô', 'ù', 'û', 'ü', 'ç', 'œ', 'æ']
+
+
+def syllable(rnd):
+    """Returns a random French-looking syllable"""
+    return rnd.choice(ONSETS) + rnd.choice(NUCLEI) + rnd.choice(CODAS)
+
+
+def short_names(count, seed=1):
+    """Capitalized names of one or two syllables"""
+    rnd = random.Random(seed)
+    return [''.join(syllable(rnd) for _ in range(rnd.randint(1, 2))).capitalize()
+            for _ in range(count)]
+
+
+def compound_words(count, seed=2):
+    """Long words of five to ten syllables, sometimes hyphenated"""
+    rnd = random.Random(seed)
+    words = []
+    for _ in range(count):
+        parts = [syllable(rnd) for _ in range(rnd.randint(5, 10))]
+        separator = rnd.choice(['', '', '-'])
+        words.append(separator.join(parts))
+    return words
+
+
+def accented_words(count, seed=3):
+    """Words of two to four syllables where some vowels carry accents"""
+    rnd = random.Random(seed)
+    words = []
+    for _ in range(count):
+        word = ''.join(syllable(rnd) for _ in range(rnd.randint(2, 4)))
+        chars = list(word)
+        for position in rnd.sample(range(len(chars)), min(len(chars), rnd.randint(1, 3))):
+            if chars[position] in 'aeiouc':
+                chars[position] = rnd.choice(ACCENTED)
+        words.append(''.join(chars))
+    return words
+
+
+def corpora(size):
+    """Returns the benchmark corpora by name, each of at most size words"""
+    return {
+        'names': short_names(size),
+        'compounds': compound_words(size),
+        'accented': accented_words(size),
+        'test_cases': load_words()[:size],
+    }
+
+
+def measure_words(words, repeat):
+    """Returns the best phonetic() throughput, in words/sec, and the p50/p99 latencies in us"""
+    set_cache_size(0)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            phonetic(word)
+        best = min(best, time.perf_counter() - start)
+
+    # meilleure latence de chaque mot sur les passes, pour réduire le bruit
+    clock = time.perf_counter_ns
+    latencies = [float('inf')] * len(words)
+    for _ in range(repeat):
+        for position, word in enumerate(words):
+            start = clock()
+            phonetic(word)
+            latencies[position] = min(latencies[position], clock() - start)
+    latencies.sort()
+    set_cache_size(DEFAULT_CACHE_SIZE)
+    return (len(words) / best, latencies[len(latencies) // 2] / 1000,
+            latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1000)
+
+
+def measure_text(words, repeat):
+    """Returns the best phonetic_text() throughput in chars/sec, starting with a cold cache"""
+    text = ' '.join(words)
+    best = float('inf')
+    for _ in range(repeat):
+        cache_clear()
+        start = time.perf_counter()
+        phonetic_text(text)
+        best = min(best, time.perf_counter() - start)
+    return len(text) / best
+
+
+def measure_memory(words):
+    """Returns the peak memory allocated while encoding the words with the cache, in KiB"""
+    cache_clear()
+    tracemalloc.start()
+    try:
+        for word in words:
+            phonetic(word)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+        cache_clear()
+
+
+def measure_cli(words, repeat):
+    """Returns the best throughput of the command line tool in lines/sec, startup included"""
+    rnd = random.Random(4)
+    lines = [' '.join(rnd.choices(words, k=rnd.randint(1, 8))) for _ in range(len(words))]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'lines.txt')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-m', 'phonetic_fr', path], cwd=ROOT, check=True,
+                           stdout=subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def run(size, repeat):
+    """Runs every measure, returns the metrics by name as (value, unit, higher_is_better)"""
+    metrics = {}
+    for name, words in corpora(size).items():
+        throughput, p50, p99 = measure_words(words, repeat)
+        metrics[f'{name}.phonetic'] = (throughput, 'words/sec', True)
+        metrics[f'{name}.latency_p50'] = (p50, 'us', False)
+        metrics[f'{name}.latency_p99'] = (p99, 'us', False)
+        metrics[f'{name}.phonetic_text'] = (measure_text(words, repeat), 'chars/sec', True)
+        metrics[f'{name}.peak_memory'] = (measure_memory(words), 'KiB', False)
+    metrics['cli.lines'] = (measure_cli(load_words()[:size], repeat), 'lines/sec', True)
+    return {name: {'value': value, 'unit': unit, 'higher_is_better': higher}
+            for name, (value, unit, higher) in metrics.items()}
+
+
+def regressions(results, baseline, threshold):
+    """
+    Returns the (name, baseline value, value, change) of the metrics worse than
+    the baseline by more than threshold, change being the relative loss.
+    """
+    worse = []
+    for name, metric in results['metrics'].items():
+        reference = baseline['metrics'].get(name)
+        if reference is None or not reference['value']:
+            continue
+        change = (metric['value'] - reference['value']) / reference['value']
+        if metric['higher_is_better']:
+            change = -change
+        if change > threshold:
+            worse.append((name, reference['value'], metric['value'], change))
+    return worse
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Benchmark suite with regression gates')
+    parser.add_argument('-n', '--words', type=int, default=5000,
+                        help='Number of words of each corpus')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='Number of runs, the best one is reported')
+    parser.add_argument('-o', '--output', help='JSON file to write the results to')
+    parser.add_argument('-c', '--compare', metavar='BASELINE',
+                        help='JSON results of a previous run to compare with')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='Relative regression tolerated by --compare (default: 0.1)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        if baseline.get('words') != args.words:
+            parser.error(f"{args.compare} was measured with --words {baseline.get('words')}")
+
+    results = {
+        'schema': SCHEMA,
+        'version': __version__,
+        'rules_fingerprint': rules_fingerprint(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'words': args.words,
+        'metrics': run(args.words, args.repeat),
+    }
+    for name, metric in results['metrics'].items():
+        print(f"{name:26} {metric['value']:14,.1f} {metric['unit']}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+            file.write('\n')
+
+    if baseline is not None:
+        worse = regressions(results, baseline, args.threshold)
+        for name, before, after, change in worse:
+            print(f"regression: {name} {before:,.1f} -> {after:,.1f} ({change:.0%} worse)",
+                  file=sys.stderr)
+        if worse:
+            sys.exit(1)
+        print(f"no metric regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
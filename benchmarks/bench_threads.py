@@ -0,0 +1,71 @@
+"""Benchmark of phonetic_threaded() against phonetic_parallel() and the number of workers.
+
+Run it with a standard and a free-threaded interpreter (python3.13t) to choose
+between threads and processes: with the GIL, threads do not scale beyond one
+core, without it they should scale like processes without their start-up and
+pickling costs.
+"""
+import argparse
+import os
+import sys
+import sysconfig
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import load_words
+from phonetic_fr import gil_enabled, phonetic_parallel, phonetic_threaded, set_cache_size
+from phonetic_fr.cache import DEFAULT_CACHE_SIZE
+from phonetic_fr.parallel import _init_worker
+
+
+def throughput(encode, words, workers, executor):
+    """Returns the words/sec of encode over words, the pool being warmed up first"""
+    list(executor.map(abs, range(workers)))
+    start = time.perf_counter()
+    encode(words, workers, executor=executor)
+    return len(words) / (time.perf_counter() - start)
+
+
+def main():
+    """Entrypoint"""
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark phonetic_threaded() scaling')
+    parser.add_argument('-w', '--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, 16, 32, cpus} & set(range(1, cpus + 1))),
+                        help='Numbers of threads and processes to measure')
+    parser.add_argument('--no-processes', action='store_true',
+                        help='Only measure threads')
+    parser.add_argument('--cache', action='store_true',
+                        help='Keep the phonetic() cache, shared by the threads')
+    args = parser.parse_args()
+
+    # mots distincts, sans cache: on mesure les règles, pas le cache
+    words = load_words()
+    if not args.cache:
+        set_cache_size(0)
+    free_threaded = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded}, "
+          f"GIL enabled: {gil_enabled()}, {cpus} CPUs, {len(words)} words")
+    print(f"{'workers':>7} {'threads':>12} {'speedup':>8} {'processes':>12} {'speedup':>8}")
+    baselines = {}
+    for workers in args.workers:
+        rates = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rates['threads'] = throughput(phonetic_threaded, words, workers, executor)
+        if not args.no_processes:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                rates['processes'] = throughput(phonetic_parallel, words, workers, executor)
+        line = f"{workers:7d}"
+        for kind in ('threads', 'processes'):
+            if kind in rates:
+                baselines.setdefault(kind, rates[kind])
+                line += f" {rates[kind]:12,.0f} {rates[kind] / baselines[kind]:7.2f}x"
+        print(line)
+    print("words/sec, speedup over one worker of the same kind")
+    set_cache_size(DEFAULT_CACHE_SIZE)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Reports which rules of phonetic() match and which ones cost the most on a corpus"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from bench_phonetic import TEST_CASES, load_words
+from phonetic_fr import RuleProfiler, phonetic, set_cache_size, trace
+
+
+def main():
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(description='Profile the rules of phonetic() on a corpus')
+    parser.add_argument('corpus', nargs='?',
+                        help='Text file of words, the test case words by default')
+    parser.add_argument('-s', '--sort', default='seconds',
+                        choices=('seconds', 'changed', 'evaluated', 'order'),
+                        help='Order of the report')
+    parser.add_argument('-l', '--limit', type=int, default=30,
+                        help='Number of rules reported, 0 for all')
+    parser.add_argument('-t', '--trace', metavar='WORD', nargs='+',
+                        help='Print the forms of these words instead of profiling')
+    args = parser.parse_args()
+
+    if args.trace:
+        for word in args.trace:
+            for step in trace(word):
+                rule = f"{step.pattern} -> {step.replacement}" if step.pattern else ''
+                print(f"{step.form:24} {step.section:12} {rule}")
+            print()
+        return
+
+    if args.corpus:
+        with open(args.corpus, 'r', encoding='utf-8') as file:
+            words = file.read().split()
+    else:
+        words = load_words(TEST_CASES)
+    # chaque occurrence passe par les règles
+    set_cache_size(0)
+    with RuleProfiler() as profiler:
+        for word in words:
+            phonetic(word)
+    stats = profiler.stats()
+    print(profiler.report(args.sort, args.limit or None))
+    dead = sum(1 for rule in stats if not rule.changed)
+    print(f"\n{len(words)} words, {len(stats)} rules, {dead} never changed a word, "
+          f"{sum(rule.seconds for rule in stats):.2f}s in the rules")
+
+
+if __name__ == '__main__':
+    main()
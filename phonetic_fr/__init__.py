@@ -1,3 +1,43 @@
 """Init File"""
 __version__ = '1.0.3'
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
 from .phonetic_fr import *
+from .index import PhoneticIndex
+from .storage import MappedPhoneticIndex, StaleIndexError, open_index, save_index
+from .fuzzy import (Match, PhoneticMatcher, PhoneticTrie, best_matches, distance_matrix,
+                    levenshtein)
+from .overrides import build_overrides, use_overrides
+from .lexicon import Lexicon, build_lexicon, use_lexicon
+from .profiling import RuleProfiler, trace
+from .columns import encode_column
+from .packing import pack_code, pack_codes, unpack_code, unpack_codes
+from .document import PhoneticDocument
+from .differential import check_engine
+from .cache import gil_enabled
+from .threads import phonetic_threaded
+
+# chargés au premier usage: asyncio et multiprocessing coûtent plus à importer
+# que le reste du paquet
+if _TYPE_CHECKING:
+    from .parallel import phonetic_parallel, phonetic_parallel_iter
+    from .aio import aphonetic_iter, aphonetic_lines, aphonetic_many, aphonetic_text
+_LAZY = {
+    'phonetic_parallel': 'parallel',
+    'phonetic_parallel_iter': 'parallel',
+    'aphonetic_iter': 'aio',
+    'aphonetic_lines': 'aio',
+    'aphonetic_many': 'aio',
+    'aphonetic_text': 'aio',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_import_module(f'.{_LAZY[name]}', __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,29 +1,96 @@
 """Command line tool to convert French words to a phonetic represnetation"""
 import sys
+import os
 import argparse
+import json
+from functools import partial
 from .__init__ import phonetic_text, __version__
+from .parallel import DEFAULT_CHUNK_SIZE, _imap_chunks
+from . import linkage
 
-def main():
+FORMATS = ('code', 'tsv', 'jsonl')
+
+
+def _format_line(output_format, line):
+    """Converts a line of text and formats it for the output"""
+    code = phonetic_text(line)
+    if output_format == 'tsv':
+        return f"{line}\t{code}\n"
+    if output_format == 'jsonl':
+        return json.dumps({'input': line, 'phonetic': code}, ensure_ascii=False) + '\n'
+    return code + '\n'
+
+
+def _format_lines(output_format, lines):
+    """Converts and formats a chunk of lines"""
+    return [_format_line(output_format, line) for line in lines]
+
+
+def _read_lines(filenames):
+    """Yields the lines of the files, or of stdin, without their line terminator"""
+    for filename in filenames or ['-']:
+        if filename == '-':
+            for line in sys.stdin:
+                yield line.rstrip('\r\n')
+        else:
+            with open(filename, 'r', encoding='utf-8') as file:
+                for line in file:
+                    yield line.rstrip('\r\n')
+
+
+def main(argv=None):
     """Entrypoint"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in linkage.COMMANDS:
+        linkage.main(argv)
+        return
+
     parser = argparse.ArgumentParser(
         description='French Soundex Phonetics Tool - Convert French words ' +
         'to phonetic representation while preserving whitespace.',
-        epilog='Input words can be provided through stdin. '+
-        'Example: echo "word1  word2" | python -m phonetic_fr.phonetic_fr')
+        epilog='Input words can be provided through stdin or files, one line at a time. '+
+        'Example: echo "word1  word2" | python -m phonetic_fr. ' +
+        'See phonetic_fr dedupe --help and phonetic_fr link --help to find rows of ' +
+        'CSV/TSV files sounding alike.')
     parser.add_argument(
-        '-v', '--version', action='version', version=f'%(prog)s {__version__}', 
+        '-v', '--version', action='version', version=f'%(prog)s {__version__}',
         help='Show the version number')
+    parser.add_argument(
+        'files', nargs='*', metavar='FILE',
+        help='Files to convert, stdin is read when omitted or when FILE is -')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of processes used to convert lines, the line order is preserved')
+    parser.add_argument(
+        '-f', '--format', choices=FORMATS, default='code',
+        help='Output the code only, the line and its code separated by a tab (tsv), ' +
+        'or a JSON object per line (jsonl)')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
 
-    lines = sys.stdin.readlines()
+    lines = _read_lines(args.files)
+    if args.jobs == 1:
+        output = map(partial(_format_line, args.format), lines)
+    else:
+        output = _imap_chunks(partial(_format_lines, args.format), lines,
+                              workers=args.jobs, chunksize=DEFAULT_CHUNK_SIZE)
 
-    if not lines:
-        print("Error: No input provided through stdin.")
-        parser.print_help()
+    count = 0
+    try:
+        for count, result_line in enumerate(output, 1):
+            sys.stdout.write(result_line)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # la sortie a été fermée (ex: head), on s'arrête sans erreur
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
         sys.exit(1)
 
-    for line in lines:
-        result_line = phonetic_text(line)
-        print(result_line.strip())
+    if not count and not args.files:
+        print("Error: No input provided through stdin.", file=sys.stderr)
+        parser.print_help(sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == '__main__':
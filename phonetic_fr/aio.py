@@ -0,0 +1,170 @@
+"""asyncio API: phonetic encoding offloaded to an executor, off the event loop."""
+import asyncio
+import os
+from collections import deque
+from typing import Any, NamedTuple, Optional
+
+from .parallel import _chunks, _for_executor
+from .phonetic_fr import phonetic_many, phonetic_text
+
+# taille des lots envoyés à l'exécuteur, assez petits pour garder une latence faible
+DEFAULT_CHUNK_SIZE = 500
+# en dessous, le passage par l'exécuteur coûte plus que l'encodage lui-même
+INLINE_THRESHOLD = 64
+
+
+class _Offload(NamedTuple):
+    """How chunks of a stream are sent to an executor"""
+    executor: Any
+    chunksize: int
+    max_in_flight: Optional[int]
+    inline_threshold: int
+
+
+def _phonetic_lines(lines):
+    """Converts a list of lines with phonetic_text()"""
+    return [phonetic_text(line) for line in lines]
+
+
+async def _achunks(items, chunksize):
+    """Splits a sync or async iterable into lists of at most chunksize items"""
+    if not hasattr(items, '__aiter__'):
+        for chunk in _chunks(items, chunksize):
+            yield chunk
+        return
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _amap_chunks(func, items, offload):
+    """
+    Applies func, which maps a list to a list of the same length, to chunks of
+    items in offload.executor and yields the results chunk by chunk in input
+    order.
+
+    At most offload.max_in_flight chunks are submitted at once: the input is
+    not read further until the oldest one is done. A short last chunk of at
+    most offload.inline_threshold items, with nothing in flight, is converted
+    directly on the event loop.
+    """
+    if offload.chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {offload.chunksize}")
+    max_in_flight = offload.max_in_flight or 2 * (os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    remote = _for_executor(func, offload.executor)
+    pending = deque()
+    try:
+        async for chunk in _achunks(items, offload.chunksize):
+            if (not pending and len(chunk) < offload.chunksize
+                    and len(chunk) <= offload.inline_threshold):
+                yield func(chunk)
+                continue
+            pending.append(loop.run_in_executor(offload.executor, remote, chunk))
+            if len(pending) >= max_in_flight:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def aphonetic_many(french_words, executor=None, chunksize=DEFAULT_CHUNK_SIZE,
+                         max_in_flight=None, inline_threshold=INLINE_THRESHOLD):
+    """
+    Converts many French words into their phonetic representations without
+    blocking the event loop.
+
+    Parameters:
+    - french_words (iterable of str): The input French words.
+    - executor (concurrent.futures.Executor): Where chunks are encoded, a
+      ThreadPoolExecutor or a ProcessPoolExecutor; defaults to the default
+      executor of the event loop.
+    - chunksize (int): Number of words sent to the executor at once.
+    - max_in_flight (int): Number of chunks submitted at once, defaults to
+      twice the number of CPUs.
+    - inline_threshold (int): Batches of at most this many words are encoded
+      directly on the event loop.
+
+    Returns:
+    list of str: The phonetic representations, in input order.
+
+    Example:
+    >>> await aphonetic_many(["Gilles", "Jill"])
+    ['JIL', 'JIL']
+    """
+    if not isinstance(french_words, (list, tuple)):
+        french_words = list(french_words)
+    if len(french_words) <= inline_threshold:
+        return phonetic_many(french_words)
+    codes = []
+    offload = _Offload(executor, chunksize, max_in_flight, inline_threshold)
+    async for chunk in _amap_chunks(phonetic_many, french_words, offload):
+        codes.extend(chunk)
+    return codes
+
+
+async def aphonetic_text(input_str, executor=None, inline_threshold=INLINE_THRESHOLD * 16):
+    """
+    Replaces each word of a text by its phonetic representation without
+    blocking the event loop; texts of at most inline_threshold characters are
+    converted directly.
+    """
+    if len(input_str) <= inline_threshold:
+        return phonetic_text(input_str)
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, _for_executor(phonetic_text, executor), input_str)
+
+
+async def _aflatten(func, items, offload):
+    """Yields the results of _amap_chunks one by one"""
+    chunks = _amap_chunks(func, items, offload)
+    try:
+        async for chunk in chunks:
+            for result in chunk:
+                yield result
+    finally:
+        await chunks.aclose()
+
+
+def aphonetic_iter(french_words, executor=None, chunksize=DEFAULT_CHUNK_SIZE,
+                   max_in_flight=None, inline_threshold=INLINE_THRESHOLD):
+    """
+    Converts a stream of French words, yielding their phonetic representations
+    in input order.
+
+    french_words may be an async iterable, read lazily: with max_in_flight
+    chunks being encoded, no more words are read until the oldest chunk is
+    done, so a fast producer is slowed down to the pace of the encoding.
+    Words are sent once a chunk is full or the input ends; use a smaller
+    chunksize for sparse streams. Other parameters are those of
+    aphonetic_many().
+
+    Returns:
+    async generator of str.
+
+    Example:
+    >>> async for code in aphonetic_iter(words_from_request()):
+    ...     print(code)
+    """
+    return _aflatten(phonetic_many, french_words,
+                     _Offload(executor, chunksize, max_in_flight, inline_threshold))
+
+
+def aphonetic_lines(lines, executor=None, chunksize=DEFAULT_CHUNK_SIZE, max_in_flight=None,
+                    inline_threshold=INLINE_THRESHOLD):
+    """
+    Converts a stream of lines with phonetic_text(), yielding them in input
+    order. Parameters are those of aphonetic_iter().
+
+    Returns:
+    async generator of str.
+    """
+    return _aflatten(_phonetic_lines, lines,
+                     _Offload(executor, chunksize, max_in_flight, inline_threshold))
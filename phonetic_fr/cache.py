@@ -0,0 +1,151 @@
+"""Bounded, thread-safe memoization of phonetic codes."""
+import os
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple
+
+DEFAULT_CACHE_SIZE = int(os.environ.get('PHONETIC_FR_CACHE_SIZE', 65536))
+DEFAULT_SHARDS = 16
+# en dessous, un segment de plus ne réduit plus l'attente mais fausse l'ordre LRU
+MIN_SHARD_SIZE = 1024
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a PhoneticCache"""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class PhoneticCache:
+    """
+    Least recently used cache mapping normalized words to phonetic codes.
+
+    All operations are protected by a lock so that a single cache can be shared
+    by concurrent threads. A cache with a ``maxsize`` of 0 stores nothing.
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be positive or 0, got {maxsize}")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, word):
+        """Returns the cached code of word, or None"""
+        with self._lock:
+            code = self._data.get(word)
+            if code is None:
+                self._misses += 1
+            else:
+                self._data.move_to_end(word)
+                self._hits += 1
+            return code
+
+    def put(self, word, code):
+        """Stores the code of word, evicting the least recently used entries"""
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            self._data[word] = code
+            self._data.move_to_end(word)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, maxsize):
+        """Changes the maximum number of entries, 0 disables the cache"""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be positive or 0, got {maxsize}")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Removes all entries and resets the statistics"""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self):
+        """Returns the statistics of the cache"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ShardedPhoneticCache:
+    """
+    PhoneticCache split into shards locked separately, the shard of a word
+    being chosen by its hash, so that threads running without the GIL seldom
+    wait for each other. Each shard evicts its own least recently used
+    entries; caches of less than MIN_SHARD_SIZE entries per shard use fewer
+    shards, down to one, which behaves exactly like a PhoneticCache.
+    """
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, shards=DEFAULT_SHARDS):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError(f"shards must be a power of two, got {shards}")
+        self._shards = tuple(PhoneticCache(0) for _ in range(shards))
+        self._mask = 0
+        self.maxsize = 0
+        self.resize(maxsize)
+
+    def get(self, word):
+        """Returns the cached code of word, or None"""
+        return self._shards[hash(word) & self._mask].get(word)
+
+    def put(self, word, code):
+        """Stores the code of word, evicting the least recently used entries of its shard"""
+        self._shards[hash(word) & self._mask].put(word, code)
+
+    def resize(self, maxsize):
+        """Changes the maximum number of entries, 0 disables the cache"""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be positive or 0, got {maxsize}")
+        count = len(self._shards)
+        while count > 1 and maxsize < count * MIN_SHARD_SIZE:
+            count >>= 1
+        size, extra = divmod(maxsize, count)
+        for index, shard in enumerate(self._shards):
+            shard.resize(size + (index < extra) if index < count else 0)
+        # les codes mis en cache restent justes quel que soit leur segment
+        self._mask = count - 1
+        self.maxsize = maxsize
+
+    def clear(self):
+        """Removes all entries and resets the statistics"""
+        for shard in self._shards:
+            shard.clear()
+
+    def info(self):
+        """Returns the statistics of the cache, summed over the shards"""
+        infos = [shard.info() for shard in self._shards]
+        return CacheInfo(sum(info.hits for info in infos), sum(info.misses for info in infos),
+                         sum(info.evictions for info in infos), self.maxsize,
+                         sum(info.currsize for info in infos))
+
+    def __len__(self):
+        return sum(map(len, self._shards))
+
+
+def gil_enabled():
+    """Tells whether the GIL is enabled, which is always the case before Python 3.13"""
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def new_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """Returns a PhoneticCache, sharded when threads run without the GIL"""
+    if gil_enabled():
+        return PhoneticCache(maxsize)
+    return ShardedPhoneticCache(maxsize)
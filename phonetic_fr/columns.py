@@ -0,0 +1,128 @@
+"""Encoding of NumPy, pandas and Arrow columns, each distinct value once.
+
+Columns are factorized into their distinct values and the indices of these
+values; only the distinct values go through phonetic(), and the result is
+rebuilt from the indices. NumPy, pandas and pyarrow are never imported here:
+a column of one of them can only exist once it has been imported.
+"""
+import sys
+
+from .phonetic_fr import phonetic_many
+
+
+def _encode_objects(values):
+    """Encodes a list of values, values which are not strings giving None"""
+    words = [value for value in values if isinstance(value, str)]
+    codes = dict(zip(words, phonetic_many(words)))
+    return [codes[value] if isinstance(value, str) else None for value in values]
+
+
+def _is_string_view(pyarrow, value_type):
+    """Tells whether an Arrow type is string_view, unknown to pyarrow < 16"""
+    return getattr(pyarrow.types, 'is_string_view', lambda _: False)(value_type)
+
+
+def _encode_dictionary(values):
+    """Encodes the values of an Arrow dictionary into an Arrow array of the same type"""
+    pyarrow = sys.modules['pyarrow']
+    if _is_string_view(pyarrow, values.type):
+        # take() n'a pas de noyau pour string_view: les codes sont en large_string
+        values = values.cast(pyarrow.large_string())
+    if not (pyarrow.types.is_string(values.type) or pyarrow.types.is_large_string(values.type)):
+        raise TypeError(f"expecting an Arrow column of strings, got {values.type}")
+    return pyarrow.array(_encode_objects(values.to_pylist()), type=values.type)
+
+
+def _encode_arrow(column, dictionary):
+    """Encodes an Arrow Array or ChunkedArray, through its dictionary encoding"""
+    pyarrow = sys.modules['pyarrow']
+    if _is_string_view(pyarrow, column.type):
+        codes = _encode_arrow(column.cast(pyarrow.large_string()), dictionary)
+        return codes if dictionary else codes.cast(column.type)
+    if isinstance(column, pyarrow.ChunkedArray):
+        if not pyarrow.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        # un seul dictionnaire pour tous les morceaux
+        column = column.unify_dictionaries()
+        if not column.num_chunks:
+            value_type = column.type if dictionary else column.type.value_type
+            return pyarrow.chunked_array([], type=value_type)
+        codes = _encode_dictionary(column.chunk(0).dictionary)
+        if dictionary:
+            return pyarrow.chunked_array(
+                [pyarrow.DictionaryArray.from_arrays(chunk.indices, codes)
+                 for chunk in column.chunks])
+        return pyarrow.chunked_array([codes.take(chunk.indices) for chunk in column.chunks],
+                                     type=codes.type)
+    if not isinstance(column, pyarrow.DictionaryArray):
+        column = column.dictionary_encode()
+    codes = _encode_dictionary(column.dictionary)
+    if dictionary:
+        return pyarrow.DictionaryArray.from_arrays(column.indices, codes)
+    return codes.take(column.indices)
+
+
+def _encode_pandas(series):
+    """Encodes a pandas Series, keeping its index, its name and Arrow storage"""
+    pandas = sys.modules['pandas']
+    if not isinstance(series, pandas.Series):
+        raise TypeError(f"expecting a pandas Series, got {type(series).__name__}")
+    if 'pyarrow' in sys.modules and hasattr(series.array, '__arrow_array__'):
+        # colonne Arrow: les chaînes restent dans leurs tampons
+        codes = _encode_arrow(sys.modules['pyarrow'].array(series.array), False)
+        values = pandas.array(codes, dtype=series.dtype)
+    else:
+        numpy = sys.modules['numpy']
+        indices, uniques = pandas.factorize(series)
+        # l'indice -1 des valeurs manquantes prend le None ajouté à la fin
+        values = numpy.array(_encode_objects(list(uniques)) + [None], dtype=object)[indices]
+        # dtype objet: pandas 3 convertirait les None en NaN d'une colonne str
+        return pandas.Series(values, index=series.index, name=series.name, dtype=object)
+    return pandas.Series(values, index=series.index, name=series.name)
+
+
+def _encode_numpy(array):
+    """Encodes a NumPy array of str or of objects"""
+    numpy = sys.modules['numpy']
+    if array.dtype.kind == 'U':
+        return phonetic_many(array)
+    if array.dtype != object:
+        raise TypeError(f"expecting a NumPy array of strings, got {array.dtype}")
+    codes = numpy.empty(array.shape, dtype=object)
+    codes.ravel()[:] = _encode_objects(array.ravel().tolist())
+    return codes
+
+
+def encode_column(column, dictionary=False):
+    """
+    Converts a column of French words into their phonetic representations,
+    encoding each distinct value once.
+
+    Parameters:
+    - column: A pyarrow Array or ChunkedArray of strings (dictionary encoded
+      or not), a pandas Series, a NumPy array of str or objects, or any
+      iterable of str.
+    - dictionary (bool): For Arrow columns, return a dictionary encoded column
+      sharing the indices of the input instead of a plain string column.
+
+    Returns:
+    A column of the same kind and length as the input. Values which are not
+    strings (None, NaN, pd.NA, Arrow nulls) give nulls.
+
+    Example:
+    >>> encode_column(pyarrow.array(["Gilles", None, "Jill"]))
+    <pyarrow.lib.StringArray object at ...>
+    [
+      "JIL",
+      null,
+      "JIL"
+    ]
+    """
+    library = type(column).__module__.split('.')[0]
+    if library == 'pyarrow':
+        return _encode_arrow(column, dictionary)
+    if library == 'pandas':
+        return _encode_pandas(column)
+    if library == 'numpy':
+        return _encode_numpy(column)
+    return _encode_objects(list(column))
@@ -0,0 +1,193 @@
+"""Differential checking of the engines of phonetic() against the reference engine.
+
+An engine giving other codes than the frozen reference implementation would
+silently change the codes stored as blocking keys, so an optimized engine is
+only selected once it encodes generated words, covering accents, ligatures,
+repeated letters and very short words, and the words of corpus files exactly
+like the reference does. The checker reports every mismatch and the speed
+ratio of the two engines:
+
+    phonetic_fr_check --engine compiled --words 2000000 corpus.txt
+    phonetic_fr_check --import my_engines --engine fast
+"""
+import argparse
+import importlib
+import random
+import sys
+import time
+import unicodedata
+from typing import NamedTuple
+
+from .phonetic_fr import _ENGINES, _normalize
+
+DEFAULT_WORDS = 1000000
+
+ONSETS = ('', 'b', 'c', 'ch', 'd', 'f', 'g', 'gu', 'gn', 'j', 'l', 'm', 'n', 'p', 'ph', 'qu',
+          'r', 's', 'sc', 't', 'th', 'v', 'w', 'x', 'z', 'br', 'cl', 'cr', 'dr', 'fl', 'gr',
+          'pl', 'pr', 'tr', 'vr')
+NUCLEI = ('a', 'e', 'i', 'o', 'u', 'y', 'ou', 'ai', 'au', 'eau', 'ei', 'eu', 'oi', 'an', 'en',
+          'in', 'on', 'un', 'ain', 'ein', 'oin', 'ie', 'ille', 'ette', 'oe', 'ue')
+CODAS = ('', '', '', 'r', 'l', 's', 't', 'x', 'n', 'm', 'c', 'd', 'g', 'rt', 'st', 'sse',
+         'nne', 'lle', 'ng', 'er', 'ez', 'ent')
+ACCENTED = 'àâäçéèêëîïôöùûüÿñ'
+LIGATURES = ('œ', 'æ', 'Œ', 'Æ', 'ß', 'ĳ', 'ﬁ', 'ﬂ')
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+# lettres, accents combinants, chiffres et séparateurs
+NOISE = LETTERS + LETTERS.upper() + ACCENTED + ''.join(LIGATURES) + " -'.,09\u0301\u0327"
+
+
+class EngineCheck(NamedTuple):
+    """Result of check_engine()"""
+    words: int
+    mismatches: list
+    seconds: float
+    reference_seconds: float
+
+    @property
+    def ratio(self):
+        """Speed of the engine relative to the reference, above 1 when faster"""
+        return self.reference_seconds / self.seconds if self.seconds else float('inf')
+
+
+def _syllables(rnd):
+    """A French-looking word of one to four syllables"""
+    return ''.join(rnd.choice(ONSETS) + rnd.choice(NUCLEI) + rnd.choice(CODAS)
+                   for _ in range(rnd.randint(1, 4)))
+
+
+def _accented(rnd):
+    """A word with accented vowels, sometimes decomposed into combining marks"""
+    word = ''.join(rnd.choice(ACCENTED) if char in 'aeiouc' and rnd.random() < 0.4 else char
+                   for char in _syllables(rnd))
+    return unicodedata.normalize('NFD', word) if rnd.random() < 0.2 else word
+
+
+def _ligature(rnd):
+    """A word with a ligature"""
+    word = _syllables(rnd)
+    position = rnd.randint(0, len(word))
+    return word[:position] + rnd.choice(LIGATURES) + word[position:]
+
+
+def _repeated(rnd):
+    """A word with letters repeated two to four times"""
+    return ''.join(char * rnd.choice((1, 1, 2, 3, 4)) for char in _syllables(rnd))
+
+
+def _short(rnd):
+    """A word of one to three letters"""
+    return ''.join(rnd.choice(LETTERS + ACCENTED) for _ in range(rnd.randint(1, 3)))
+
+
+def _noise(rnd):
+    """Random letters, marks, digits and separators"""
+    return ''.join(rnd.choice(NOISE) for _ in range(rnd.randint(0, 12)))
+
+
+FAMILIES = (_syllables, _accented, _ligature, _repeated, _short, _noise)
+
+
+def generated_words(count, seed=0):
+    """
+    Yields count random words, in turn from each family of FAMILIES: plain
+    syllables, accents, ligatures, repeated letters, very short words and
+    noise, in lower case, capitalized or in upper case.
+    """
+    rnd = random.Random(seed)
+    cases = (str, str, str.capitalize, str.upper)
+    for index in range(count):
+        yield rnd.choice(cases)(FAMILIES[index % len(FAMILIES)](rnd))
+
+
+def _engine(name):
+    """Returns the encoding function of a registered engine"""
+    try:
+        return _ENGINES[name]
+    except KeyError:
+        raise ValueError(f"unknown engine {name!r}, expecting one of "
+                         f"{', '.join(_ENGINES)}") from None
+
+
+def check_engine(words, engine='compiled', reference='reference'):
+    """
+    Encodes words with an engine and with the reference engine and compares the codes.
+
+    Each distinct normalized word is encoded once by each engine, without
+    going through the cache or the lexicon of phonetic().
+
+    Parameters:
+    - words (iterable of str): The words to check.
+    - engine (str): The name of the engine to check.
+    - reference (str): The name of the engine giving the expected codes.
+
+    Returns:
+    EngineCheck: the number of distinct words checked, the (word, expected,
+    code) of each mismatch and the time taken by each engine.
+    """
+    encode = _engine(engine)
+    expect = _engine(reference)
+    normalized = list(dict.fromkeys(map(_normalize, words)))
+
+    start = time.perf_counter()
+    codes = [encode(word) for word in normalized]
+    seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [expect(word) for word in normalized]
+    reference_seconds = time.perf_counter() - start
+
+    mismatches = [(word, expected_code, code)
+                  for word, expected_code, code in zip(normalized, expected, codes)
+                  if code != expected_code]
+    return EngineCheck(len(normalized), mismatches, seconds, reference_seconds)
+
+
+def _corpus_words(filenames):
+    """Yields the whitespace separated words of files, of stdin for -"""
+    for filename in filenames:
+        if filename == '-':
+            yield from (word for line in sys.stdin for word in line.split())
+            continue
+        with open(filename, 'r', encoding='utf-8') as file:
+            yield from (word for line in file for word in line.split())
+
+
+def main(argv=None):
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(
+        prog='phonetic_fr_check',
+        description='Check that an engine of phonetic() gives the codes of the reference engine')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='Corpus files whose words are checked too, - for stdin')
+    parser.add_argument('-e', '--engine', default='compiled', help='Engine to check')
+    parser.add_argument('-r', '--reference', default='reference',
+                        help='Engine giving the expected codes')
+    parser.add_argument('-n', '--words', type=int, default=DEFAULT_WORDS,
+                        help='Number of generated words')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='Seed of the generated words')
+    parser.add_argument('-i', '--import', dest='modules', action='append', default=[],
+                        metavar='MODULE', help='Module to import, registering more engines')
+    args = parser.parse_args(argv)
+
+    try:
+        for module in args.modules:
+            importlib.import_module(module)
+        words = list(generated_words(args.words, args.seed))
+        words.extend(_corpus_words(args.files))
+        result = check_engine(words, args.engine, args.reference)
+    except (ImportError, OSError, ValueError) as error:
+        parser.exit(2, f"phonetic_fr_check: error: {error}\n")
+
+    for word, expected, code in result.mismatches:
+        print(f"{word}: {code} [expecting {expected}]")
+    print(f"{result.words - len(result.mismatches)}/{result.words} distinct words give the "
+          f"codes of the {args.reference} engine")
+    print(f"{args.engine}: {result.words / max(result.seconds, 1e-9):,.0f} words/s, "
+          f"{args.reference}: {result.words / max(result.reference_seconds, 1e-9):,.0f} words/s, "
+          f"speed ratio {result.ratio:.2f}x")
+    if result.mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+"""Incremental phonetic encoding of documents edited in place.
+
+The text of a document is held in segments of about SEGMENT_SIZE characters,
+cut after a whitespace character so that no word spans two segments; each
+segment keeps its phonetic text and the spans of its words. The segments are
+grouped in blocks of about sqrt(n) segments, and Fenwick trees over the number
+of segments and the lengths of each block, in the text and in the phonetic
+text, find the segment of an offset in O(log n + sqrt(n)). An edit re-encodes
+only the segments it touches and splices them into their block, even when it
+splits or merges segments, so its cost depends on the size of the edit, not of
+the document. The blocks are cut again only when one of them has grown to
+twice their size, which happens at most once every sqrt(n) new segments.
+"""
+import re
+from bisect import bisect_right
+from itertools import chain
+from math import isqrt
+from os.path import commonprefix
+
+from .phonetic_fr import phonetic_text_iter
+
+# taille visée des segments, en caractères
+SEGMENT_SIZE = 256
+# nombre minimal de segments par bloc
+BLOCK_SIZE = 16
+
+_SPACE_SEARCH = re.compile(r'\s').search
+
+
+class _Fenwick:
+    """Prefix sums of a list of lengths, updated and searched in O(log n)"""
+    def __init__(self, lengths):
+        tree = [0]
+        tree.extend(lengths)
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self._tree = tree
+        self._top = 1 << (len(tree) - 1).bit_length() >> 1
+
+    def add(self, index, delta):
+        """Adds delta to the length at index"""
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def prefix(self, index):
+        """Returns the sum of the lengths before index"""
+        tree = self._tree
+        total = 0
+        while index:
+            total += tree[index]
+            index &= index - 1
+        return total
+
+    def find(self, offset):
+        """Returns the index of the length holding offset and the offset within it"""
+        tree = self._tree
+        index = 0
+        step = self._top
+        while step:
+            if index + step < len(tree) and tree[index + step] <= offset:
+                index += step
+                offset -= tree[index]
+            step >>= 1
+        return index, offset
+
+def _sizes(segments):
+    """Returns the number of segments and the lengths of their text and phonetic text"""
+    return (len(segments), sum(len(segment.text) for segment in segments),
+            sum(len(segment.code) for segment in segments))
+
+
+def _length(segment, code):
+    """Returns the length of the phonetic text of segment if code, else of its text"""
+    return len(segment.code if code else segment.text)
+
+
+class _Blocks:
+    """
+    The segments of a document in blocks of about sqrt(n) segments, with
+    Fenwick trees over the number of segments of each block and the lengths
+    of their text and phonetic text.
+    """
+    def __init__(self, segments):
+        self._regroup(segments)
+
+    def _regroup(self, segments):
+        """Cuts segments into blocks of the same size and rebuilds the trees, in O(n)"""
+        size = max(BLOCK_SIZE, isqrt(len(segments)))
+        blocks = [segments[index:index + size] for index in range(0, len(segments), size)]
+        blocks = blocks or [[]]
+        self._size = size
+        self._blocks = blocks
+        self._trees = tuple(_Fenwick(column) for column in zip(*map(_sizes, blocks)))
+        self._count = len(segments)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def _position(self, index):
+        """Returns the block of the segment at index and its index in the block"""
+        block, within = self._trees[0].find(index)
+        if block == len(self._blocks):
+            # la fin: après le dernier segment du dernier bloc
+            return block - 1, len(self._blocks[-1])
+        return block, within
+
+    def __getitem__(self, index):
+        block, within = self._position(index)
+        return self._blocks[block][within]
+
+    def slice(self, low, high):
+        """Returns the list of the segments low:high"""
+        block, within = self._position(low)
+        segments = self._blocks[block][within:within + high - low]
+        while len(segments) < high - low:
+            block += 1
+            segments.extend(self._blocks[block][:high - low - len(segments)])
+        return segments
+
+    def prefix(self, index, code=False):
+        """Returns the length of the text, or of the phonetic text, before the segment at index"""
+        block, within = self._position(index)
+        return self._trees[2 if code else 1].prefix(block) + sum(
+            _length(segment, code) for segment in self._blocks[block][:within])
+
+    def find(self, offset, code=False):
+        """
+        Returns the index of the segment holding an offset of the text, or of
+        the phonetic text, and the offset within it; len(self) past the end.
+        """
+        block, offset = self._trees[2 if code else 1].find(offset)
+        index = self._trees[0].prefix(block)
+        for segment in self._blocks[block] if block < len(self._blocks) else ():
+            if offset < _length(segment, code):
+                break
+            offset -= _length(segment, code)
+            index += 1
+        return index, offset
+
+    def replace(self, low, high, segments):
+        """Replaces the segments low:high by segments, updating only the blocks they span"""
+        blocks = self._blocks
+        first, start = self._position(low)
+        last, end = self._position(high)
+        if last > first and not end:
+            last -= 1
+            end = len(blocks[last])
+        spliced = blocks[first][:start] + segments + blocks[last][end:]
+        # les segments sont répartis également entre les blocs touchés
+        count = last - first + 1
+        for number, block in enumerate(range(first, last + 1)):
+            old = _sizes(blocks[block])
+            blocks[block] = spliced[len(spliced) * number // count:
+                                    len(spliced) * (number + 1) // count]
+            for tree, old_size, size in zip(self._trees, old, _sizes(blocks[block])):
+                tree.add(block, size - old_size)
+        self._count += len(segments) - (high - low)
+        if len(spliced) > 2 * self._size * count:
+            self._regroup(list(self))
+
+
+class _Segment:
+    """A piece of text ending at a word boundary, with its phonetic text and word spans"""
+    __slots__ = ('text', 'code', 'starts', 'code_starts', 'spans')
+
+    def __init__(self, text):
+        self.text = text
+        parts = []
+        # (début, fin, début du code, fin du code) de chaque mot
+        spans = []
+        position = code_position = 0
+        for start, end, _, code in phonetic_text_iter(text):
+            code_position += start - position
+            parts.append(text[position:start])
+            parts.append(code)
+            spans.append((start, end, code_position, code_position + len(code)))
+            code_position += len(code)
+            position = end
+        parts.append(text[position:])
+        self.code = ''.join(parts)
+        self.spans = spans
+        self.starts = [span[0] for span in spans]
+        self.code_starts = [span[2] for span in spans]
+
+    def to_phonetic(self, offset):
+        """Maps an offset of the text to the phonetic text, within a word to its code start"""
+        index = bisect_right(self.starts, offset) - 1
+        if index < 0:
+            return offset
+        _, end, code_start, code_end = self.spans[index]
+        return code_end + offset - end if offset >= end else code_start
+
+    def to_original(self, offset):
+        """Maps an offset of the phonetic text to the text, within a code to its word start"""
+        index = bisect_right(self.code_starts, offset) - 1
+        if index < 0:
+            return offset
+        start, end, _, code_end = self.spans[index]
+        return end + offset - code_end if offset >= code_end else start
+
+
+def _joined(left, right):
+    """Tells whether two pieces of text would join a word across their boundary"""
+    return bool(left) and bool(right) and not left[-1].isspace() and not right[0].isspace()
+
+
+def _split(text):
+    """Splits text into segments of about SEGMENT_SIZE characters, after whitespace"""
+    if len(text) <= 2 * SEGMENT_SIZE:
+        return [_Segment(text)] if text else []
+    segments = []
+    position = 0
+    while len(text) - position > 2 * SEGMENT_SIZE:
+        space = _SPACE_SEARCH(text, position + SEGMENT_SIZE)
+        if space is None:
+            break
+        segments.append(_Segment(text[position:space.end()]))
+        position = space.end()
+    if position < len(text):
+        segments.append(_Segment(text[position:]))
+    return segments
+
+
+class PhoneticDocument:
+    """
+    A text and its phonetic_text(), kept up to date through edits.
+
+    Each edit re-encodes only the segments of about SEGMENT_SIZE characters
+    it touches and returns the matching edit of the phonetic text, so that a
+    copy of it can be patched instead of rebuilt. Whitespace is kept exactly
+    as phonetic_text() keeps it.
+
+    Example:
+    >>> document = PhoneticDocument("Le ver vert")
+    >>> document.edit(3, 6, "python")
+    (2, 5, 'PITON')
+    >>> document.text, document.phonetic
+    ('Le python vert', 'L PITON VER')
+    """
+    def __init__(self, text=''):
+        self._segments = _Blocks(_split(text))
+        self._length = len(text)
+
+    @property
+    def text(self):
+        """The current text of the document"""
+        return ''.join(segment.text for segment in self._segments)
+
+    @property
+    def phonetic(self):
+        """The phonetic text of the document, equal to phonetic_text(self.text)"""
+        return ''.join(segment.code for segment in self._segments)
+
+    def __len__(self):
+        return self._length
+
+    def _locate(self, offset):
+        """Returns the index of the segment holding offset, the last one for the end"""
+        index, _ = self._segments.find(offset)
+        return min(index, len(self._segments) - 1)
+
+    def _affected(self, start, end):
+        """Returns the range of segments an edit of start:end re-encodes"""
+        if not self._segments:
+            return 0, 0
+        first = self._locate(start)
+        last = self._locate(max(start, end - 1))
+        return first, last + 1
+
+    def edit(self, start, end, replacement):
+        """
+        Replaces self.text[start:end] by replacement and re-encodes the words it touches.
+
+        Returns:
+        (start, end, replacement) of the matching edit of the phonetic text.
+        """
+        if not 0 <= start <= end <= self._length:
+            raise ValueError(f"invalid edit range {start}:{end} of a document of "
+                             f"{self._length} characters")
+        segments = self._segments
+        low, high = self._affected(start, end)
+        offset = segments.prefix(low)
+        text = ''.join(segment.text for segment in segments.slice(low, high))
+        text = text[:start - offset] + replacement + text[end - offset:]
+        # les mots ne doivent pas être coupés entre deux segments
+        if not text and high < len(segments):
+            text = segments[high].text
+            high += 1
+        while low > 0 and _joined(segments[low - 1].text, text):
+            low -= 1
+            text = segments[low].text + text
+        while high < len(segments) and (_joined(text, segments[high].text)
+                                        or len(text) < SEGMENT_SIZE // 4):
+            text += segments[high].text
+            high += 1
+
+        code_offset = segments.prefix(low, code=True)
+        old_segments = segments.slice(low, high)
+        new_segments = _split(text)
+        segments.replace(low, high, new_segments)
+        self._length += len(replacement) - (end - start)
+        return _difference(code_offset, ''.join(segment.code for segment in old_segments),
+                           ''.join(segment.code for segment in new_segments))
+
+    def to_phonetic(self, offset):
+        """
+        Maps an offset of the text to the phonetic text. Offsets within a word
+        map to the start of its code, whitespace maps one to one.
+        """
+        if not 0 <= offset <= self._length:
+            raise ValueError(f"offset {offset} outside of a document of {self._length} characters")
+        if not self._segments:
+            return 0
+        index, within = self._segments.find(offset)
+        if index == len(self._segments):
+            return self._segments.prefix(index, code=True)
+        return self._segments.prefix(index, code=True) + self._segments[index].to_phonetic(within)
+
+    def to_original(self, offset):
+        """
+        Maps an offset of the phonetic text to the text. Offsets within a code
+        map to the start of its word, whitespace maps one to one.
+        """
+        if not self._segments:
+            if offset:
+                raise ValueError(f"offset {offset} outside of an empty document")
+            return 0
+        index, within = self._segments.find(offset, code=True)
+        if index == len(self._segments):
+            if within:
+                raise ValueError(f"offset {offset} outside of the phonetic text")
+            return self._length
+        return self._segments.prefix(index) + self._segments[index].to_original(within)
+
+    def words(self):
+        """Yields the (start, end, original, code) of each word, like phonetic_text_iter()"""
+        offset = 0
+        for segment in self._segments:
+            for start, end, code_start, code_end in segment.spans:
+                yield (offset + start, offset + end, segment.text[start:end],
+                       segment.code[code_start:code_end])
+            offset += len(segment.text)
+
+
+def _difference(offset, old, new):
+    """Returns the smallest (start, end, replacement) turning old into new, shifted by offset"""
+    prefix = len(commonprefix([old, new]))
+    suffix = len(commonprefix([old[prefix:][::-1], new[prefix:][::-1]]))
+    return offset + prefix, offset + len(old) - suffix, new[prefix:len(new) - suffix]
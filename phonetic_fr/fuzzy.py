@@ -0,0 +1,368 @@
+"""Approximate matching of phonetic codes by edit distance."""
+import heapq
+from typing import Any, NamedTuple
+
+from .phonetic_fr import phonetic, phonetic_many
+
+_END = ''
+
+
+def levenshtein(source, target, max_distance=None):
+    """
+    Returns the Levenshtein distance between two strings.
+
+    When max_distance is given, the computation stops as soon as the distance
+    is known to exceed it and max_distance + 1 is returned instead.
+
+    Example:
+    >>> levenshtein(phonetic("drapeau"), phonetic("crapaud"))
+    1
+    """
+    if len(source) < len(target):
+        source, target = target, source
+    if max_distance is not None and len(source) - len(target) > max_distance:
+        return max_distance + 1
+    previous_row = list(range(len(target) + 1))
+    for row_index, source_char in enumerate(source, 1):
+        row = [row_index]
+        for column, target_char in enumerate(target, 1):
+            row.append(min(row[column - 1] + 1,
+                           previous_row[column] + 1,
+                           previous_row[column - 1] + (source_char != target_char)))
+        if max_distance is not None and min(row) > max_distance:
+            return max_distance + 1
+        previous_row = row
+    if max_distance is not None:
+        return min(previous_row[-1], max_distance + 1)
+    return previous_row[-1]
+
+
+class PhoneticTrie:
+    """
+    Set of phonetic codes searchable by edit distance.
+
+    Codes are stored in a trie. A search walks it depth first, computing one
+    row of the Levenshtein matrix per node, and stops descending as soon as no
+    code below a node can be within the requested distance. Codes sharing a
+    prefix share the corresponding rows, so a search only visits a small part
+    of the trie.
+
+    Example:
+    >>> trie = PhoneticTrie(phonetic(word) for word in ["drapeau", "crapaud", "python"])
+    >>> trie.search(phonetic("drapeaux"), 1)
+    [('DRAPO', 0), ('KRAPO', 1)]
+    """
+    def __init__(self, codes=None):
+        self._root = {}
+        self._size = 0
+        if codes is not None:
+            for code in codes:
+                self.add(code)
+
+    def add(self, code):
+        """Adds a code, returns False if it was already present"""
+        node = self._root
+        for char in code:
+            child = node.get(char)
+            if child is None:
+                child = node[char] = {}
+            node = child
+        if _END in node:
+            return False
+        node[_END] = code
+        self._size += 1
+        return True
+
+    def remove(self, code):
+        """Removes a code, raises KeyError if it is not present"""
+        path = [self._root]
+        for char in code:
+            node = path[-1].get(char)
+            if node is None:
+                raise KeyError(code)
+            path.append(node)
+        if _END not in path[-1]:
+            raise KeyError(code)
+        del path[-1][_END]
+        self._size -= 1
+        # on élague les noeuds devenus vides
+        for depth in range(len(code), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][code[depth - 1]]
+
+    def search(self, code, max_distance):
+        """
+        Returns the (code, distance) pairs of the codes within max_distance of
+        code, sorted by distance, then by code.
+        """
+        columns = len(code) + 1
+        first_row = list(range(columns))
+        results = []
+        if _END in self._root and len(code) <= max_distance:
+            results.append((self._root[_END], len(code)))
+        stack = [(char, child, first_row) for char, child in self._root.items() if char != _END]
+        while stack:
+            char, node, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, columns):
+                row.append(min(row[column - 1] + 1,
+                               previous_row[column] + 1,
+                               previous_row[column - 1] + (code[column - 1] != char)))
+            if row[-1] <= max_distance and _END in node:
+                results.append((node[_END], row[-1]))
+            if min(row) <= max_distance:
+                stack.extend((child_char, child, row)
+                             for child_char, child in node.items() if child_char != _END)
+        results.sort(key=lambda result: (result[1], result[0]))
+        return results
+
+    def neighbors(self, word, max_distance=1):
+        """Returns the (code, distance) pairs of the codes sounding close to word"""
+        return self.search(phonetic(word), max_distance)
+
+    def __contains__(self, code):
+        node = self._root
+        for char in code:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _END in node
+
+    def __len__(self):
+        return self._size
+
+
+class Match(NamedTuple):
+    """A candidate returned by best_matches(), with its position among the candidates"""
+    index: int
+    candidate: Any
+    distance: int
+
+
+def _numpy():
+    """Returns the numpy module, or None when it is not installed"""
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel,import-error
+    except ImportError:
+        return None
+    return numpy
+
+
+def _distance_dtype(numpy, too_far):
+    """Returns the smallest signed integer type holding too_far + 1"""
+    return numpy.int16 if too_far < numpy.iinfo(numpy.int16).max else numpy.int64
+
+
+def _banded_distances(numpy, chars, query, max_distance):
+    """
+    Returns the indexes of the rows of chars, a matrix of code points of codes
+    of the same length, within max_distance of query, and their distances.
+
+    The Levenshtein matrix is computed one query character at a time for all
+    codes at once, only within max_distance of its diagonal; the codes whose
+    row exceeds max_distance everywhere are dropped as soon as it does.
+    """
+    length = chars.shape[1]
+    too_far = max_distance + 1
+    indexes = numpy.arange(len(chars))
+    previous = numpy.minimum(numpy.arange(length + 1, dtype=_distance_dtype(numpy, too_far)),
+                             too_far)
+    previous = numpy.tile(previous, (len(chars), 1))
+    for row_index, char in enumerate(query, 1):
+        row = numpy.full_like(previous, too_far)
+        row[:, 0] = min(row_index, too_far)
+        for column in range(max(1, row_index - max_distance),
+                            min(length, row_index + max_distance) + 1):
+            row[:, column] = numpy.minimum(
+                numpy.minimum(previous[:, column], row[:, column - 1]) + 1,
+                previous[:, column - 1] + (chars[:, column - 1] != char))
+        close = row.min(axis=1) <= max_distance
+        if not close.all():
+            row, chars, indexes = row[close], chars[close], indexes[close]
+            if not indexes.size:
+                return indexes, row[:, 0]
+        previous = row
+    distances = previous[:, length]
+    close = distances <= max_distance
+    return indexes[close], distances[close]
+
+
+class PhoneticMatcher:
+    """
+    Candidate words encoded once, matched against queries by the edit distance
+    of their phonetic codes.
+
+    Only the distinct codes of the candidates are compared, and only those
+    whose length is within max_distance of the code of the query. With NumPy,
+    the codes of each length are compared to a query all at once, in a band
+    around the diagonal of the Levenshtein matrix, dropping codes as soon as
+    they exceed max_distance; without it, the codes are searched in a
+    PhoneticTrie. Words without letters match nothing.
+
+    Example:
+    >>> matcher = PhoneticMatcher(["drapeau", "crapaud", "python", "Drapaux"])
+    >>> matcher.best_matches("crapeaux", k=1)
+    [Match(index=1, candidate='crapaud', distance=0)]
+    >>> [match.index for match in matcher.best_matches("crapeaux", max_distance=1)]
+    [1, 0, 3]
+    """
+    def __init__(self, candidates, vectorized=None):
+        self.candidates = list(candidates)
+        codes = phonetic_many(self.candidates)
+        # positions des candidats de chaque code distinct
+        positions = {}
+        for index, code in enumerate(codes):
+            if code:
+                positions.setdefault(code, []).append(index)
+        self._positions = positions
+        self._numpy = _numpy() if vectorized in (None, True) else None
+        if vectorized and self._numpy is None:
+            raise ImportError("vectorized matching requires numpy")
+        if self._numpy is None:
+            self._trie = PhoneticTrie(positions)
+            return
+        numpy = self._numpy
+        # codes distincts groupés par longueur, en matrices de points de code
+        by_length = {}
+        for code_id, code in enumerate(positions):
+            by_length.setdefault(len(code), []).append((code_id, code))
+        self._groups = {}
+        for length, group in by_length.items():
+            chars = numpy.array([code for _, code in group], dtype=f'<U{length}')
+            self._groups[length] = (numpy.array([code_id for code_id, _ in group]),
+                                    chars.view(numpy.uint32).reshape(len(group), length))
+        # code distinct de chaque candidat, len(positions) pour les mots sans code
+        self._inverse = numpy.full(len(codes), len(positions))
+        for code_id, indexes in enumerate(positions.values()):
+            self._inverse[indexes] = code_id
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def _close_codes(self, code, max_distance):
+        """
+        Returns the distinct codes within max_distance of code with their
+        distances: as (code, distance) pairs without NumPy, as arrays of code
+        ids and of distances with it.
+        """
+        if self._numpy is None:
+            return self._trie.search(code, max_distance) if code else []
+        if not code:
+            return self._numpy.zeros(0, dtype=int), self._numpy.zeros(0, dtype=self._numpy.int16)
+        numpy = self._numpy
+        query = numpy.array([ord(char) for char in code], dtype=numpy.uint32)
+        code_ids = []
+        distances = []
+        for length in range(max(1, len(code) - max_distance), len(code) + max_distance + 1):
+            group = self._groups.get(length)
+            if group is None:
+                continue
+            indexes, group_distances = _banded_distances(numpy, group[1], query, max_distance)
+            code_ids.append(group[0][indexes])
+            distances.append(group_distances)
+        if not code_ids:
+            return self._close_codes('', max_distance)
+        return numpy.concatenate(code_ids), numpy.concatenate(distances)
+
+    def best_matches(self, query, k=5, max_distance=2):
+        """
+        Returns the k candidates whose codes are closest to the code of query.
+
+        Parameters:
+        - query (str): The word to match.
+        - k (int): The maximum number of matches, None for all of them.
+        - max_distance (int): The maximum edit distance between the codes.
+
+        Returns:
+        list of Match: (index, candidate, distance) tuples, sorted by distance,
+        then by index.
+        """
+        close = self._close_codes(phonetic(query), max_distance)
+        if self._numpy is None:
+            matches = ((distance, index) for code, distance in close
+                       for index in self._positions[code])
+            matches = sorted(matches) if k is None else heapq.nsmallest(k, matches)
+        else:
+            numpy = self._numpy
+            code_ids, distances = close
+            by_code = numpy.full(len(self._positions) + 1, max_distance + 1,
+                                 dtype=_distance_dtype(numpy, max_distance + 1))
+            by_code[code_ids] = distances
+            by_candidate = by_code[self._inverse]
+            indexes = numpy.flatnonzero(by_candidate <= max_distance)
+            indexes = indexes[numpy.argsort(by_candidate[indexes], kind='stable')][:k]
+            matches = zip(by_candidate[indexes].tolist(), indexes.tolist())
+        return [Match(index, self.candidates[index], distance) for distance, index in matches]
+
+    def _distance_row(self, close, too_far):
+        """Returns the distances of the candidates given the (code, distance) pairs of close"""
+        row = [too_far] * len(self.candidates)
+        for code, distance in close:
+            for index in self._positions[code]:
+                row[index] = distance
+        return row
+
+    def distance_matrix(self, queries, max_distance=2):
+        """
+        Returns the edit distances between the codes of queries and of the candidates.
+
+        Distances above max_distance, and those of words without letters, are
+        given as max_distance + 1.
+
+        Returns:
+        numpy.ndarray of shape (len(queries), len(candidates)) with NumPy, list
+        of lists otherwise.
+        """
+        queries = list(queries)
+        too_far = max_distance + 1
+        query_codes = phonetic_many(queries)
+        distinct = {code: self._close_codes(code, max_distance) for code in set(query_codes)}
+        if self._numpy is None:
+            rows = {code: self._distance_row(close, too_far) for code, close in distinct.items()}
+            return [list(rows[code]) for code in query_codes]
+        numpy = self._numpy
+        rows = {code: row for row, code in enumerate(distinct)}
+        dtype = numpy.uint8 if too_far < 256 else _distance_dtype(numpy, too_far)
+        by_code = numpy.full((len(distinct), len(self._positions) + 1), too_far, dtype=dtype)
+        for code, (code_ids, distances) in distinct.items():
+            by_code[rows[code], code_ids] = distances
+        query_rows = numpy.array([rows[code] for code in query_codes], dtype=int)
+        return by_code[numpy.ix_(query_rows, self._inverse)]
+
+
+def best_matches(query, candidates, k=5, max_distance=2):
+    """
+    Returns the k candidates sounding closest to query, within max_distance
+    edits of its phonetic code.
+
+    Parameters:
+    - query (str): The word to match.
+    - candidates (PhoneticMatcher or iterable of str): The candidate words. A
+      PhoneticMatcher keeps their codes, to be reused by every query.
+    - k (int): The maximum number of matches, None for all of them.
+    - max_distance (int): The maximum edit distance between the codes.
+
+    Returns:
+    list of Match: (index, candidate, distance) tuples, sorted by distance,
+    then by index.
+
+    Example:
+    >>> best_matches("Jill", ["Gilles", "Julie", "Paul"], k=2)
+    [Match(index=0, candidate='Gilles', distance=0), Match(index=1, candidate='Julie', distance=2)]
+    """
+    if not isinstance(candidates, PhoneticMatcher):
+        candidates = PhoneticMatcher(candidates)
+    return candidates.best_matches(query, k, max_distance)
+
+
+def distance_matrix(queries, candidates, max_distance=2):
+    """
+    Returns the N x M matrix of the edit distances between the phonetic codes
+    of N queries and M candidates, capped at max_distance + 1.
+
+    candidates is a PhoneticMatcher or an iterable of words, see best_matches().
+    """
+    if not isinstance(candidates, PhoneticMatcher):
+        candidates = PhoneticMatcher(candidates)
+    return candidates.distance_matrix(queries, max_distance)
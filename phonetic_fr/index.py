@@ -0,0 +1,147 @@
+"""In-memory inverted index from phonetic codes to the keys of the words having them."""
+from array import array
+from itertools import islice
+
+from .phonetic_fr import phonetic, phonetic_many
+from .storage import save_index
+
+BUILD_CHUNK_SIZE = 10000
+_MAX_KEY = 2 ** 63 - 1
+
+
+class PhoneticIndex:
+    """
+    Inverted index answering "which records sound like this word".
+
+    Each phonetic code maps to a compact posting list (``array('q')``) of the
+    keys of the words indexed under it. Keys which are non-negative integers,
+    such as record ids, are stored as is; other hashable keys are interned and
+    stored as negative numbers. A key indexed several times under the same code
+    appears once in lookups.
+
+    Example:
+    >>> index = PhoneticIndex([(1, "Gilles"), (2, "Jill"), (3, "Python")])
+    >>> index.lookup("gile")
+    [1, 2]
+    """
+    def __init__(self, items=None):
+        self._postings = {}
+        self._interned = {}
+        self._keys = []
+        self._refcounts = array('q')
+        self._free = []
+        self._size = 0
+        if items is not None:
+            self.update(items)
+
+    def _key_id(self, key):
+        """Returns the integer stored in posting lists for key, interning it if needed"""
+        if type(key) is int and 0 <= key <= _MAX_KEY:  # pylint: disable=unidiomatic-typecheck
+            return key
+        key_id = self._interned.get(key)
+        if key_id is None:
+            if self._free:
+                key_id = self._free.pop()
+                self._keys[key_id] = key
+            else:
+                key_id = len(self._keys)
+                self._keys.append(key)
+                self._refcounts.append(0)
+            self._interned[key] = key_id
+        self._refcounts[key_id] += 1
+        return -1 - key_id
+
+    def _release(self, key_id):
+        """Forgets an interned key once it is no longer in any posting list"""
+        if key_id >= 0:
+            return
+        key_id = -1 - key_id
+        self._refcounts[key_id] -= 1
+        if not self._refcounts[key_id]:
+            del self._interned[self._keys[key_id]]
+            self._keys[key_id] = None
+            self._free.append(key_id)
+
+    def _key(self, key_id):
+        """Returns the key stored as key_id"""
+        return key_id if key_id >= 0 else self._keys[-1 - key_id]
+
+    def _add_code(self, key, code):
+        """Adds key to the posting list of code"""
+        postings = self._postings.get(code)
+        if postings is None:
+            postings = self._postings[code] = array('q')
+        postings.append(self._key_id(key))
+        self._size += 1
+
+    def add(self, key, word):
+        """Indexes key under the phonetic code of word"""
+        self._add_code(key, phonetic(word))
+
+    def update(self, items):
+        """Indexes an iterable of (key, word) pairs, encoding the words in batches"""
+        iterator = iter(items)
+        chunk = list(islice(iterator, BUILD_CHUNK_SIZE))
+        while chunk:
+            codes = phonetic_many([word for _, word in chunk])
+            for (key, _), code in zip(chunk, codes):
+                self._add_code(key, code)
+            chunk = list(islice(iterator, BUILD_CHUNK_SIZE))
+
+    def remove(self, key, word):
+        """
+        Removes one occurrence of key from the posting list of the code of word.
+
+        Raises KeyError if key is not indexed under that code.
+        """
+        code = phonetic(word)
+        postings = self._postings.get(code)
+        if type(key) is int and 0 <= key <= _MAX_KEY:  # pylint: disable=unidiomatic-typecheck
+            key_id = key
+        else:
+            key_id = self._interned.get(key)
+            if key_id is not None:
+                key_id = -1 - key_id
+        try:
+            postings.remove(key_id)
+        except (AttributeError, TypeError, ValueError):
+            raise KeyError(f"{key!r} is not indexed under {code!r}") from None
+        if not postings:
+            del self._postings[code]
+        self._release(key_id)
+        self._size -= 1
+
+    def lookup_code(self, code):
+        """Returns the keys indexed under a phonetic code, in insertion order"""
+        postings = self._postings.get(code)
+        if postings is None:
+            return []
+        return list(dict.fromkeys(map(self._key, postings)))
+
+    def lookup(self, word):
+        """Returns the keys of the indexed words sounding like word"""
+        return self.lookup_code(phonetic(word))
+
+    def codes(self):
+        """Returns the indexed phonetic codes"""
+        return self._postings.keys()
+
+    def items(self):
+        """Yields (code, keys) pairs for every indexed code"""
+        for code in self._postings:
+            yield code, self.lookup_code(code)
+
+    def save(self, path):
+        """
+        Writes the index to a file which can be opened with open_index().
+
+        Keys must either all be 64 bit integers or all be strings.
+        """
+        save_index(self, path)
+
+    def __contains__(self, word):
+        return phonetic(word) in self._postings
+
+    def __len__(self):
+        """Number of indexed (key, word) pairs"""
+        return self._size
@@ -0,0 +1,213 @@
+"""Precomputed lexicon of phonetic codes, looked up before applying the rules.
+
+A lexicon file is built offline by running the rules over a word list. It holds
+a fixed size header followed by 8 byte aligned sections::
+
+    header            magic, package version, rules fingerprint, counts and
+                      absolute offsets of the sections below
+    word offsets      (words + 1) uint64, offsets of each word in the word blob
+    word blob         UTF-8 normalized words, sorted, concatenated
+    code offsets      (words + 1) uint64, offsets of each code in the code blob
+    code blob         UTF-8 codes, in the order of the words
+    slots             uint32 open addressing hash table, 1 + index of a word or 0
+
+Words are hashed with CRC-32 and probed linearly, so a lookup reads a couple
+of slots and one word. The file is read through mmap: it is loaded lazily and
+processes share its pages.
+
+Usage:
+    phonetic_fr_lexicon build WORDS_FILE LEXICON_FILE
+    phonetic_fr_lexicon verify LEXICON_FILE
+"""
+import argparse
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from .phonetic_fr import _RULES_FINGERPRINT, _encode, _normalize, set_lexicon
+from .storage import (_MappedFile, _align, _check_section, _last_offset, _little_endian,
+                      _map_table, _package_version, _write_atomically, _write_strings)
+
+MAGIC = b'PHFRLEX1'
+
+_HEADER = struct.Struct('<8s32s64s7Q')
+
+
+def _slot_count(count):
+    """Returns a power of two leaving at least half of the slots empty"""
+    slots = 8
+    while slots < 2 * count:
+        slots *= 2
+    return slots
+
+
+def _slot_table(words):
+    """Returns the hash slots of sorted words, holding 1 + the index of a word or 0"""
+    mask = _slot_count(len(words)) - 1
+    slots = array('I', bytes(4 * (mask + 1)))
+    for position, word in enumerate(words):
+        slot = zlib.crc32(word.encode('utf-8')) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = position + 1
+    return slots
+
+
+def _write_lexicon(file, words, codes):
+    """Writes the sections of a lexicon file, then its header"""
+    file.write(b'\0' * _HEADER.size)
+    word_offsets, word_blob = _write_strings(file, words)
+    code_offsets, code_blob = _write_strings(file, codes)
+    slots = _slot_table(words)
+    slots_position = _align(file)
+    file.write(_little_endian(slots))
+    file.seek(0)
+    file.write(_HEADER.pack(
+        MAGIC, _package_version().encode('utf-8'), _RULES_FINGERPRINT.encode('ascii'),
+        len(words), len(slots), word_offsets, word_blob, code_offsets, code_blob,
+        slots_position))
+
+
+def build_lexicon(words, path):
+    """
+    Encodes words with the rules and writes them to a lexicon file.
+
+    Words are normalized like phonetic() does, duplicates are ignored.
+    Returns the number of distinct words written.
+    """
+    codes = {}
+    for word in words:
+        normalized = _normalize(word)
+        if normalized not in codes:
+            codes[normalized] = _encode(normalized)
+    entries = sorted(codes.items())
+    _write_atomically(path, _write_lexicon, [word for word, _ in entries],
+                      [code for _, code in entries])
+    return len(entries)
+
+
+class Lexicon(_MappedFile):
+    """
+    Read-only lexicon opened from a file written by build_lexicon().
+
+    Opening a file built with other rules raises StaleIndexError unless
+    check_rules is False. Its codes come from the rules alone, so the overrides,
+    looked up before it, do not make it stale.
+
+    Example:
+    >>> build_lexicon(["Gilles", "python"], "words.lex")
+    2
+    >>> Lexicon("words.lex").get("PYTHON")
+    'PITON'
+    """
+    MAGIC = MAGIC
+    DESCRIPTION = 'phonetic lexicon'
+
+    def _open(self, path, check_rules):
+        """Parses the header and maps the sections"""
+        (self._count, slots, word_offsets, self._word_blob, code_offsets, self._code_blob,
+         slots_position) = self._check_header(path, _HEADER, check_rules, _RULES_FINGERPRINT)
+        if slots < 1 or slots & (slots - 1):
+            raise ValueError(f"{path} is corrupt: {slots} slots is not a power of 2")
+        data = self._mmap
+        _check_section(data, path, self._word_blob,
+                       _last_offset(data, path, word_offsets, self._count))
+        _check_section(data, path, self._code_blob,
+                       _last_offset(data, path, code_offsets, self._count))
+        _check_section(data, path, slots_position, 4 * slots)
+        view = memoryview(self._mmap)
+        self._word_offsets = _map_table(view, word_offsets, self._count + 1, 'Q')
+        self._code_offsets = _map_table(view, code_offsets, self._count + 1, 'Q')
+        self._slots = _map_table(view, slots_position, slots, 'I')
+        self._mask = slots - 1
+
+    def _word(self, position):
+        """Returns the UTF-8 bytes of the word at a sorted position"""
+        return self._mmap[self._word_blob + self._word_offsets[position]:
+                          self._word_blob + self._word_offsets[position + 1]]
+
+    def _code(self, position):
+        """Returns the code at a sorted position"""
+        return self._mmap[self._code_blob + self._code_offsets[position]:
+                          self._code_blob + self._code_offsets[position + 1]].decode('utf-8')
+
+    def get(self, word, default=None):
+        """Returns the code of a word filtered and converted to upper case, or default"""
+        encoded = word.encode('utf-8')
+        slot = zlib.crc32(encoded) & self._mask
+        position = self._slots[slot]
+        while position:
+            if self._word(position - 1) == encoded:
+                return self._code(position - 1)
+            slot = (slot + 1) & self._mask
+            position = self._slots[slot]
+        return default
+
+    def items(self):
+        """Yields the (word, code) pairs in sorted order"""
+        for position in range(self._count):
+            yield self._word(position).decode('utf-8'), self._code(position)
+
+    def verify(self):
+        """Returns the (word, stored code, code from the rules) entries which disagree"""
+        return [(word, code, _encode(word)) for word, code in self.items()
+                if _encode(word) != code]
+
+    def close(self):
+        """Unmaps the file"""
+        self._word_offsets = self._code_offsets = self._slots = None
+        super().close()
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self._count
+
+
+def use_lexicon(path):
+    """Makes phonetic() look words up in the lexicon file at path, None stops it"""
+    set_lexicon(None if path is None else Lexicon(path))
+
+
+def main(argv=None):
+    """Entrypoint"""
+    parser = argparse.ArgumentParser(
+        description='Build or verify a precomputed lexicon of phonetic codes')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='Encode a word list into a lexicon file')
+    build.add_argument('words', help='Text file of words, one or more per line')
+    build.add_argument('lexicon', help='Lexicon file to write')
+    verify = commands.add_parser('verify', help='Check a lexicon file against the rules')
+    verify.add_argument('lexicon', help='Lexicon file to check')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        with open(args.words, 'r', encoding='utf-8') as file:
+            count = build_lexicon((word for line in file for word in line.split()), args.lexicon)
+        print(f"{count} words written to {args.lexicon}")
+        return
+
+    try:
+        lexicon = Lexicon(args.lexicon, check_rules=False)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        sys.exit(2)
+    with lexicon:
+        if lexicon.fingerprint != _RULES_FINGERPRINT:
+            print(f"{args.lexicon} was built with other rules (phonetic_fr {lexicon.version})")
+        mismatches = lexicon.verify()
+        for word, stored, expected in mismatches:
+            print(f"{word}: {stored} [expecting {expected}]")
+        print(f"{len(lexicon) - len(mismatches)}/{len(lexicon)} words match the rules")
+    if mismatches:
+        sys.exit(1)
+
+
+if os.environ.get('PHONETIC_FR_LEXICON'):
+    use_lexicon(os.environ['PHONETIC_FR_LEXICON'])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+"""Deduplication and record linkage of CSV/TSV files, blocking rows on phonetic codes.
+
+Rows are read and encoded in chunks, then sorted by code with an external merge
+sort: sorted runs of at most buffer_size rows are spilled to temporary files
+and merged with heapq.merge, so memory stays bounded however large the inputs
+are. Rows sharing a code form a block, written as candidate pairs or as a
+cluster:
+
+    phonetic_fr dedupe names.csv --column name > pairs.csv
+    phonetic_fr link customers.tsv suppliers.tsv --column name --format clusters
+"""
+import argparse
+import contextlib
+import csv
+import heapq
+import json
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+from itertools import combinations, groupby, islice, product
+from operator import itemgetter
+
+from .parallel import DEFAULT_CHUNK_SIZE, _chunks, _imap_chunks
+from .phonetic_fr import phonetic_text
+
+COMMANDS = ('dedupe', 'link')
+FORMATS = ('pairs', 'clusters')
+
+# lignes triées en mémoire avant d'être écrites dans un fichier temporaire
+DEFAULT_BUFFER_SIZE = 1000000
+# au-delà, un bloc donnerait trop de paires pour être utile
+DEFAULT_MAX_BLOCK = 1000
+
+
+class _Progress:
+    """Reports counts and throughput on stderr, at most once per interval"""
+    def __init__(self, stream, interval=1.0):
+        self.stream = stream
+        self.interval = interval
+        self.start = time.perf_counter()
+        self.last = self.start
+
+    def rate(self, count):
+        """Returns count per second since the start"""
+        return count / max(time.perf_counter() - self.start, 1e-9)
+
+    def report(self, message, force=False):
+        """Writes the message with the elapsed time, unless one was written recently"""
+        now = time.perf_counter()
+        if self.stream is None or not force and now - self.last < self.interval:
+            return
+        self.last = now
+        print(f"phonetic_fr: {message} [{now - self.start:.1f} s]", file=self.stream, flush=True)
+
+
+def _column_index(header, column):
+    """Returns the index of a column given by name, or by number from 1"""
+    if header is not None and column in header:
+        return header.index(column)
+    if column.isdigit() and int(column) >= 1:
+        return int(column) - 1
+    raise ValueError(f"no column {column!r}" + (f" in {header}" if header is not None else ""))
+
+
+def _delimiter(filename, delimiter):
+    """Returns the delimiter of a file: the given one, else a tab for .tsv files and a comma"""
+    if delimiter is not None:
+        return delimiter
+    return '\t' if filename.endswith(('.tsv', '.tab')) else ','
+
+
+def _read_column(filename, column, delimiter, header=True):
+    """Yields the (row number, value) of a column of a CSV file, or of stdin for -"""
+    if filename == '-':
+        opened = contextlib.nullcontext(sys.stdin)
+    else:
+        opened = open(filename, 'r', encoding='utf-8', newline='')
+    with opened as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        index = _column_index(next(reader, []) if header else None, column)
+        for number, row in enumerate(reader, 1):
+            yield number, row[index] if index < len(row) else ''
+
+
+def _encode_rows(source, rows):
+    """Returns the (code, source, row, value) records of a chunk of (row, value) pairs"""
+    codes = {}
+    records = []
+    for row, value in rows:
+        code = codes.get(value)
+        if code is None:
+            # espaces normalisés: la clé ne dépend que des mots
+            code = codes[value] = ' '.join(phonetic_text(value).split())
+        records.append((code, source, row, value))
+    return records
+
+
+def _encoded_records(args, progress):
+    """Yields the records of every input, encoded in chunks, reporting the progress"""
+    columns = [args.column] * len(args.files)
+    if args.command == 'link' and args.right_column:
+        columns[1] = args.right_column
+    encoded = 0
+    for source, (filename, column) in enumerate(zip(args.files, columns)):
+        rows = _read_column(filename, column, _delimiter(filename, args.delimiter),
+                            not args.no_header)
+        encode = partial(_encode_rows, source)
+        if args.jobs == 1:
+            chunks = map(encode, _chunks(rows, DEFAULT_CHUNK_SIZE))
+        else:
+            chunks = _chunks(_imap_chunks(encode, rows, workers=args.jobs,
+                                          chunksize=DEFAULT_CHUNK_SIZE), DEFAULT_CHUNK_SIZE)
+        for chunk in chunks:
+            encoded += len(chunk)
+            progress.report(f"{encoded:,} rows encoded ({progress.rate(encoded):,.0f} rows/s)")
+            # les valeurs sans aucune lettre n'ont pas de code
+            yield from (record for record in chunk if record[0])
+    progress.report(f"{encoded:,} rows encoded ({progress.rate(encoded):,.0f} rows/s)",
+                    force=True)
+
+
+def _write_run(records, directory, number):
+    """Writes sorted records to a temporary file, returns its path"""
+    path = os.path.join(directory, f'run{number:06}.jsonl')
+    with open(path, 'w', encoding='utf-8') as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+    return path
+
+
+def _read_run(file):
+    """Yields the records of a run file as tuples"""
+    for line in file:
+        yield tuple(json.loads(line))
+
+
+def _sorted_records(records, buffer_size, directory):
+    """
+    Yields the records in sorted order. Runs of buffer_size records are sorted
+    in memory and written to files of directory, then merged with the last,
+    shorter run kept in memory.
+    """
+    runs = []
+    for chunk in _chunks(records, buffer_size):
+        chunk.sort()
+        if len(chunk) < buffer_size:
+            runs.append(chunk)
+        else:
+            runs.append(_write_run(chunk, directory, len(runs)))
+    with contextlib.ExitStack() as stack:
+        streams = [_read_run(stack.enter_context(open(run, 'r', encoding='utf-8')))
+                   if isinstance(run, str) else run for run in runs]
+        yield from heapq.merge(*streams)
+
+
+def _blocks(records, max_block):
+    """Yields the (code, records, size) of each code, records being None above max_block"""
+    for code, group in groupby(records, key=itemgetter(0)):
+        block = list(islice(group, max_block + 1))
+        if len(block) > max_block:
+            yield code, None, len(block) + sum(1 for _ in group)
+        else:
+            yield code, block, len(block)
+
+
+def _block_pairs(block, link):
+    """Returns the candidate pairs of records of a block, across sources when linking"""
+    if link:
+        return product([record for record in block if record[1] == 0],
+                       [record for record in block if record[1] == 1])
+    return combinations(block, 2)
+
+
+def _is_cluster(block, link):
+    """Tells whether a block has rows to match, on both sides when linking"""
+    if link:
+        # les lignes sont triées par source
+        return block[0][1] == 0 and block[-1][1] == 1
+    return len(block) > 1
+
+
+def _write_blocks(writer, blocks, args, progress):
+    """Writes the blocks as pairs or clusters, returns the counts of the run"""
+    counts = {'blocks': 0, 'rows': 0, 'skipped': 0}
+    link = args.command == 'link'
+    names = args.files
+    if args.format == 'pairs':
+        writer.writerow(['code', 'file1', 'row1', 'value1', 'file2', 'row2', 'value2'])
+    else:
+        writer.writerow(['cluster', 'code', 'file', 'row', 'value'])
+    for code, block, size in blocks:
+        if block is None:
+            counts['skipped'] += 1
+            progress.report(f"block {code!r} of {size:,} rows skipped", force=True)
+            continue
+        if not _is_cluster(block, link):
+            continue
+        counts['blocks'] += 1
+        if args.format == 'pairs':
+            for first, second in _block_pairs(block, link):
+                writer.writerow([code, names[first[1]], first[2], first[3],
+                                 names[second[1]], second[2], second[3]])
+                counts['rows'] += 1
+        else:
+            for _, source, row, value in block:
+                writer.writerow([counts['blocks'], code, names[source], row, value])
+                counts['rows'] += 1
+        progress.report(f"{counts['blocks']:,} blocks written")
+    return counts
+
+
+def _parse_args(argv):
+    """Returns the parser and the arguments of the dedupe and link subcommands"""
+    parser = argparse.ArgumentParser(
+        prog='phonetic_fr',
+        description='Find the rows of CSV/TSV files whose column sounds alike, '
+        'grouping rows by phonetic code with a sort spilling to disk')
+    commands = parser.add_subparsers(dest='command', required=True)
+    dedupe = commands.add_parser('dedupe', help='Find duplicate rows within the files')
+    dedupe.add_argument('files', nargs='+', metavar='FILE', help='CSV/TSV files, - for stdin')
+    link = commands.add_parser('link', help='Find the rows of a file matching another file')
+    link.add_argument('files', nargs=2, metavar='FILE', help='Left and right CSV/TSV files')
+    link.add_argument('--right-column', help='Column of the right file, --column by default')
+    for command in (dedupe, link):
+        command.add_argument('-c', '--column', required=True,
+                             help='Name of the column to encode, or its number from 1')
+        command.add_argument('-f', '--format', choices=FORMATS, default='pairs',
+                             help='Output a row per candidate pair, or a row per member '
+                             'of each cluster of rows sharing a code')
+        command.add_argument('-d', '--delimiter',
+                             help='Field delimiter, a tab for .tsv files and a comma otherwise; '
+                             'the output uses the delimiter of the first file')
+        command.add_argument('--no-header', action='store_true',
+                             help='The files have no header row, --column is a number')
+        command.add_argument('-o', '--output', help='File to write, stdout by default')
+        command.add_argument('-j', '--jobs', type=int, default=1,
+                             help='Number of processes used to encode rows')
+        command.add_argument('--buffer-size', type=int, default=DEFAULT_BUFFER_SIZE,
+                             help='Rows sorted in memory before spilling to disk')
+        command.add_argument('--max-block', type=int, default=DEFAULT_MAX_BLOCK,
+                             help='Blocks of more rows are skipped and reported')
+        command.add_argument('--temp-dir', help='Directory of the temporary files')
+        command.add_argument('-q', '--quiet', action='store_true',
+                             help='Do not report progress on stderr')
+    args = parser.parse_args(argv)
+    for name in ('jobs', 'buffer_size', 'max_block'):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+    if args.delimiter == '\\t':
+        args.delimiter = '\t'
+    if args.delimiter is not None and len(args.delimiter) != 1:
+        parser.error(f"--delimiter must be a single character, got {args.delimiter!r}")
+    return parser, args
+
+
+def main(argv=None):
+    """Entrypoint of the dedupe and link subcommands"""
+    parser, args = _parse_args(argv)
+    progress = _Progress(None if args.quiet else sys.stderr)
+    try:
+        if args.output:
+            opened = open(args.output, 'w', encoding='utf-8', newline='')
+        else:
+            opened = contextlib.nullcontext(sys.stdout)
+        with opened as output, tempfile.TemporaryDirectory(dir=args.temp_dir) as directory:
+            records = _sorted_records(_encoded_records(args, progress), args.buffer_size,
+                                      directory)
+            # fermé avant la suppression des fichiers temporaires qu'il lit
+            with contextlib.closing(records):
+                writer = csv.writer(output, delimiter=_delimiter(args.files[0], args.delimiter),
+                                    lineterminator='\n')
+                counts = _write_blocks(writer, _blocks(records, args.max_block), args, progress)
+    except (OSError, ValueError, csv.Error) as error:
+        parser.exit(2, f"phonetic_fr: error: {error}\n")
+    progress.report(f"{counts['blocks']:,} blocks, {counts['rows']:,} rows written, "
+                    f"{counts['skipped']:,} blocks of more than {args.max_block:,} rows skipped",
+                    force=True)
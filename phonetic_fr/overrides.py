@@ -0,0 +1,117 @@
+"""Fixed codes for domain words, returned by phonetic() without running the rules.
+
+Brands, place names and other words the rules encode badly are given their
+codes once, at startup, from a dict or a UTF-8 file of "word code" lines:
+
+    # marques
+    Citroën   SITROEN
+    Renault   RENO
+
+Words are normalized like phonetic() normalizes them and stored in a hash
+table looked up on every cache miss, before the lexicon and the rules, so a
+hit costs one dict lookup. Words may also be declared to keep their final R,
+like the words of ER_R_EXCEPTIONS; their codes are computed once by the rules.
+The overrides are part of rules_fingerprint(), so indexes built with other
+overrides are reported as stale; lexicons, holding codes of the rules alone,
+are not.
+"""
+import os
+
+from .phonetic_fr import _encode, _normalize, set_overrides
+
+
+def _read_codes(path):
+    """Returns the (word, code) pairs of a file of "word code" lines"""
+    pairs = []
+    with open(path, 'r', encoding='utf-8') as file:
+        for number, line in enumerate(file, 1):
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            if len(fields) != 2:
+                raise ValueError(f"{path}, line {number}: expecting a word and its code, "
+                                 f"got {line.strip()!r}")
+            pairs.append(tuple(fields))
+    return pairs
+
+
+def _read_words(path):
+    """Returns the words of a file, blank lines and lines starting with # being ignored"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return [word for line in file for word in line.split()[:1] if not word.startswith('#')]
+
+
+def _add(overrides, word, code):
+    """Adds the code of a word to overrides, refusing conflicting codes"""
+    normalized = _normalize(word)
+    if not normalized:
+        raise ValueError(f"{word!r} has no letter to override")
+    if not isinstance(code, str):
+        raise TypeError(f"the code of {word!r} must be a string, got {type(code).__name__}")
+    if overrides.get(normalized, code) != code:
+        raise ValueError(f"conflicting codes for {normalized!r}: "
+                         f"{overrides[normalized]!r} and {code!r}")
+    overrides[normalized] = code
+
+
+def build_overrides(codes=None, keep_final_r=None):
+    """
+    Returns the overrides of codes and keep_final_r, by normalized word.
+
+    Parameters:
+    - codes (dict, str or os.PathLike): Codes by word, or the path of a file
+      of "word code" lines.
+    - keep_final_r (iterable of str, str or os.PathLike): Words keeping their
+      final R, or the path of a file of words, one per line. A word also
+      given in codes gets the code of codes.
+
+    Returns:
+    dict: the codes by word filtered and converted to upper case.
+    """
+    if isinstance(codes, (str, os.PathLike)):
+        codes = _read_codes(codes)
+    elif codes is not None:
+        codes = codes.items()
+    if isinstance(keep_final_r, (str, os.PathLike)):
+        keep_final_r = _read_words(keep_final_r)
+
+    overrides = {}
+    for word, code in codes or ():
+        _add(overrides, word, code)
+    for word in keep_final_r or ():
+        normalized = _normalize(word)
+        if normalized not in overrides:
+            _add(overrides, word, _encode(normalized, keep_final_r=True))
+    return overrides
+
+
+def use_overrides(codes=None, keep_final_r=None):
+    """
+    Makes phonetic() return fixed codes for some words without running the rules.
+
+    Parameters:
+    - codes (dict, str or os.PathLike): Codes by word, or the path of a file
+      of "word code" lines, blank lines and lines starting with # being ignored.
+    - keep_final_r (iterable of str, str or os.PathLike): Words keeping their
+      final R like the words of ER_R_EXCEPTIONS, or the path of a file of
+      words, one per line.
+
+    Calling it again replaces the overrides, calling it without arguments
+    removes them.
+
+    Returns:
+    int: the number of words overridden.
+
+    Example:
+    >>> use_overrides({"Renault": "RENO"}, keep_final_r=["Docker"])
+    2
+    >>> phonetic("renault"), phonetic("docker")
+    ('RENO', 'DOKER')
+    """
+    overrides = build_overrides(codes, keep_final_r)
+    set_overrides(overrides)
+    return len(overrides)
+
+
+if os.environ.get('PHONETIC_FR_OVERRIDES'):
+    use_overrides(os.environ['PHONETIC_FR_OVERRIDES'])
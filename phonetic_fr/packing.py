@@ -0,0 +1,162 @@
+"""Packing of phonetic codes into 64-bit integers.
+
+Letters take 5 bits each, A being 1 and Z 26, the first letter in the highest
+bits, followed by as many zero bits as there are missing letters; the lowest
+4 bits hold the length. Packed codes of up to MAX_PACKED_LENGTH letters thus
+compare like the codes themselves, and two codes are equal if and only if
+their packed integers are.
+
+Longer codes are handled according to an overflow strategy:
+- 'truncate' keeps the first MAX_PACKED_LENGTH letters and TRUNCATED as the
+  length: codes sharing these letters share their packed integer, which still
+  sorts like the codes.
+- 'hash' stores a 60-bit hash of the whole code and HASHED as the length:
+  equality is kept except for unlikely collisions, order is not, and the code
+  cannot be unpacked.
+- 'error' raises a ValueError.
+"""
+import hashlib
+
+MAX_PACKED_LENGTH = 12
+TRUNCATED = 13
+HASHED = 14
+
+OVERFLOW_STRATEGIES = ('truncate', 'hash', 'error')
+
+# décalage de la première lettre: 12 lettres de 5 bits au-dessus de la longueur
+_FIRST_SHIFT = 4 + 5 * (MAX_PACKED_LENGTH - 1)
+_LETTER_OFFSET = ord('A') - 1
+
+
+def _check_overflow(overflow):
+    """Raises a ValueError for an unknown overflow strategy"""
+    if overflow not in OVERFLOW_STRATEGIES:
+        raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_STRATEGIES)}, "
+                         f"got {overflow!r}")
+
+
+def _hash_code(code):
+    """Returns the packed integer of a code with the 'hash' strategy"""
+    digest = hashlib.blake2b(code.encode('ascii'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') >> 4 << 4 | HASHED
+
+
+def pack_code(code, overflow='truncate'):
+    """
+    Packs a phonetic code into an integer of at most 64 bits.
+
+    Parameters:
+    - code (str): A code returned by phonetic(), made of letters A to Z.
+    - overflow (str): What to do with codes longer than MAX_PACKED_LENGTH
+      letters: 'truncate', 'hash' or 'error'.
+
+    Returns:
+    int: The packed code.
+
+    Example:
+    >>> hex(pack_code("JIL"))
+    '0x5258000000000003'
+    """
+    _check_overflow(overflow)
+    length = len(code)
+    if length > MAX_PACKED_LENGTH:
+        if overflow == 'error':
+            raise ValueError(f"{code!r} is longer than {MAX_PACKED_LENGTH} letters")
+        if overflow == 'hash':
+            return _hash_code(code)
+        code = code[:MAX_PACKED_LENGTH]
+        length = TRUNCATED
+    packed = 0
+    shift = _FIRST_SHIFT
+    for char in code:
+        letter = ord(char) - _LETTER_OFFSET
+        if not 0 < letter <= 26:
+            raise ValueError(f"{code!r} is not a phonetic code of letters A to Z")
+        packed |= letter << shift
+        shift -= 5
+    return packed | length
+
+
+def unpack_code(packed):
+    """
+    Returns the code packed by pack_code(), only its first MAX_PACKED_LENGTH
+    letters for a truncated code. Hashed codes raise a ValueError.
+    """
+    packed = int(packed)
+    length = packed & 15
+    if length == HASHED:
+        raise ValueError("a hashed code cannot be unpacked")
+    if length > TRUNCATED or not 0 <= packed < 1 << 64:
+        raise ValueError(f"{packed:#x} is not a packed code")
+    if length == TRUNCATED:
+        length = MAX_PACKED_LENGTH
+    letters = []
+    for shift in range(_FIRST_SHIFT, _FIRST_SHIFT - 5 * length, -5):
+        letter = packed >> shift & 31
+        if not 0 < letter <= 26:
+            raise ValueError(f"{packed:#x} is not a packed code")
+        letters.append(chr(letter + _LETTER_OFFSET))
+    return ''.join(letters)
+
+
+def pack_codes(codes, overflow='truncate'):
+    """
+    Packs many phonetic codes into a NumPy array of uint64, without a Python
+    loop over the codes, except for those hashed with the 'hash' strategy.
+    Requires NumPy.
+
+    Parameters:
+    - codes (iterable of str or numpy.ndarray): Codes returned by phonetic()
+      or phonetic_many().
+    - overflow (str): See pack_code().
+
+    Returns:
+    numpy.ndarray of uint64, one value per code and of the same shape for a
+    NumPy array.
+
+    Example:
+    >>> pack_codes(phonetic_many(["Gilles", "Jill", "Martin"]))
+    array([5933492509060628483, 5933492509060628483, 7522494309656952838], dtype=uint64)
+    """
+    import numpy  # pylint: disable=import-outside-toplevel,import-error
+    _check_overflow(overflow)
+    if not isinstance(codes, numpy.ndarray):
+        codes = list(codes)
+    strings = numpy.asarray(codes, dtype='S')
+    shape = strings.shape
+    strings = strings.ravel()
+    width = max(strings.dtype.itemsize, MAX_PACKED_LENGTH)
+    chars = numpy.zeros((len(strings), width), dtype=numpy.uint8)
+    chars[:, :strings.dtype.itemsize] = strings.view(numpy.uint8).reshape(
+        len(strings), strings.dtype.itemsize)
+
+    present = chars != 0
+    if (present & ((chars < ord('A')) | (chars > ord('Z')))).any():
+        raise ValueError("phonetic codes are made of letters A to Z")
+    lengths = present.sum(axis=1)
+    overflowing = lengths > MAX_PACKED_LENGTH
+    if overflow == 'error' and overflowing.any():
+        raise ValueError(f"codes are longer than {MAX_PACKED_LENGTH} letters")
+
+    letters = numpy.where(present, chars - _LETTER_OFFSET, 0)[:, :MAX_PACKED_LENGTH]
+    shifts = numpy.arange(_FIRST_SHIFT, 3, -5, dtype=numpy.uint64)
+    packed = numpy.bitwise_or.reduce(letters.astype(numpy.uint64) << shifts, axis=1)
+    packed |= numpy.where(overflowing, TRUNCATED, lengths).astype(numpy.uint64)
+    if overflow == 'hash' and overflowing.any():
+        positions = numpy.flatnonzero(overflowing)
+        packed[positions] = [_hash_code(strings[position].decode('ascii'))
+                             for position in positions]
+    return packed.reshape(shape)
+
+
+def unpack_codes(packed):
+    """Returns the list of the codes of an iterable of packed codes, see unpack_code()"""
+    unpacked = {}
+    codes = []
+    for value in packed:
+        value = int(value)
+        code = unpacked.get(value)
+        if code is None:
+            code = unpacked[value] = unpack_code(value)
+        codes.append(code)
+    return codes
@@ -0,0 +1,181 @@
+"""Multi-core encoding of French words with a pool of worker processes.
+
+Workers encode words with the engine, lexicon and overrides of the calling
+process, whatever their start method: pools started here receive them once,
+existing pools with every chunk. Engines given to register_engine() must then
+be picklable, like module-level functions, and lexicons opened from a file.
+"""
+import os
+import pickle
+import sys
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import Any, NamedTuple, Optional
+
+from .lexicon import Lexicon, use_lexicon
+from .phonetic_fr import (_ENGINES, _lookups, get_engine, phonetic_many, register_engine,
+                          set_engine, set_lexicon, set_overrides)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# moteurs présents dans tout processus qui importe phonetic_fr
+_BUILTIN_ENGINES = ('compiled', 'reference')
+
+
+class _WorkerState(NamedTuple):
+    """How phonetic() encodes words, in a form sent to worker processes"""
+    engine: str
+    # fonction d'un moteur ajouté par register_engine(), None pour les autres
+    encode: Optional[Any]
+    # chemin d'un Lexicon, ou l'objet donné à set_lexicon()
+    lexicon: Optional[Any]
+    overrides: Optional[dict]
+
+
+# état appliqué en dernier dans ce processus de travail
+_STATE = None
+
+
+def _worker_state():
+    """
+    Returns the engine, lexicon and overrides of phonetic(), which workers
+    started by spawn or forkserver do not inherit, and which may have changed
+    since a pool was started.
+    """
+    engine = get_engine()
+    encode = None if engine in _BUILTIN_ENGINES else _ENGINES[engine]
+    lexicon, overrides = _lookups()
+    if isinstance(lexicon, Lexicon):
+        lexicon = lexicon.path
+    elif encode is None and lexicon is None:
+        return _WorkerState(engine, None, None, overrides)
+    try:
+        pickle.dumps((encode, lexicon))
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise ValueError(f"the engine {engine!r} or the lexicon of phonetic() cannot be sent "
+                         f"to worker processes: {error}") from error
+    return _WorkerState(engine, encode, lexicon, overrides)
+
+
+def _use_state(state):
+    """Makes phonetic() encode words in a worker process like in the calling process"""
+    global _STATE  # pylint: disable=global-statement
+    if state == _STATE:
+        return
+    if state.encode is not None:
+        register_engine(state.engine, state.encode)
+    set_engine(state.engine)
+    if isinstance(state.lexicon, (str, os.PathLike)):
+        use_lexicon(state.lexicon)
+    else:
+        set_lexicon(state.lexicon)
+    set_overrides(state.overrides)
+    _STATE = state
+
+
+def _run_with_state(state, func, chunk):
+    """Applies func to a chunk once the state of the calling process is in use"""
+    _use_state(state)
+    return func(chunk)
+
+
+def _for_executor(func, executor):
+    """Returns func, carrying the state of phonetic() when executor runs it in other processes"""
+    # sans ce module chargé, aucun ProcessPoolExecutor n'existe
+    process = sys.modules.get('concurrent.futures.process')
+    if process is not None and isinstance(executor, process.ProcessPoolExecutor):
+        return partial(_run_with_state, _worker_state(), func)
+    return func
+
+
+def _init_worker(state=None):
+    """
+    Makes a worker process encode words like the calling process, then warms
+    it up so that the first chunk does not pay for it.
+    """
+    if state is not None:
+        _use_state(state)
+    phonetic_many(["initialisation"])
+
+
+def _chunks(items, chunksize):
+    """Splits an iterable into lists of at most chunksize items"""
+    iterator = iter(items)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+def _imap_chunks(func, items, workers=None, chunksize=DEFAULT_CHUNK_SIZE, executor=None):
+    """
+    Applies func, which maps a list to a list of the same length, to chunks of
+    items in executor and yields the results one by one in input order.
+
+    Without executor, a pool of workers processes is started and shut
+    down once done. A given executor, of processes or of threads, is left
+    running; workers is then only used to bound the chunks in flight.
+
+    At most two chunks per worker are in flight, so the input is consumed
+    lazily and memory stays bounded however long the input is.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    workers = workers or os.cpu_count() or 1
+    owned = executor is None
+    if owned:
+        # multiprocessing n'est importé qu'au premier pool
+        from concurrent.futures import ProcessPoolExecutor  # pylint: disable=import-outside-toplevel
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(_worker_state(),))
+    else:
+        func = _for_executor(func, executor)
+    pending = deque()
+    try:
+        for chunk in _chunks(items, chunksize):
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=True)
+
+
+def phonetic_parallel_iter(french_words, workers=None, chunksize=DEFAULT_CHUNK_SIZE,
+                           executor=None):
+    """
+    Converts French words into their phonetic representations on several cores,
+    yielding the codes in input order as soon as their chunk is encoded.
+
+    Parameters:
+    - french_words (iterable of str): The input French words, consumed lazily.
+    - workers (int): Number of worker processes, defaults to the number of CPUs.
+    - chunksize (int): Number of words sent to a worker at once.
+    - executor (concurrent.futures.Executor): An existing pool to reuse instead of
+      starting a new one; it is left running.
+
+    Returns:
+    generator of str: The phonetic representations.
+    """
+    return _imap_chunks(phonetic_many, french_words, workers, chunksize, executor)
+
+
+def phonetic_parallel(french_words, workers=None, chunksize=DEFAULT_CHUNK_SIZE, executor=None):
+    """
+    Converts French words into their phonetic representations on several cores.
+
+    Parameters are those of phonetic_parallel_iter().
+
+    Returns:
+    list of str: The phonetic representations, in input order.
+
+    Example:
+    >>> phonetic_parallel(["Gilles", "Jill"], workers=2)
+    ['JIL', 'JIL']
+    """
+    return list(phonetic_parallel_iter(french_words, workers, chunksize, executor))
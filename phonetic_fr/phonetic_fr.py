@@ -1,5 +1,33 @@
 """Module providing conversion of French words to a phonetic representation."""
+import hashlib
+import os
 import re
+import sys
+import unicodedata
+from bisect import bisect_left
+from functools import partial
+from operator import methodcaller
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse  # pylint: disable=deprecated-module
+
+from .cache import new_cache
+from .reference import encode as _reference_encode
+from .rules import (ACCENTS, MIN_TO_MAJ, COMPOSITION, DECOMPOSITION, ER_R_EXCEPTIONS,
+                    SPECIAL_CASES, ACRONYM_PATTERN, SHORT_WORD_PATTERN, PREPROCESS_RULES,
+                    REPETITION_RULES, OING_RULES, INFINITIVE_RULES, MAIN_RULES,
+                    TERMINATION_RULES, base_letters)
+
+__all__ = [
+    'phonetic', 'phonetic_many', 'phonetic_text', 'phonetic_text_iter',
+    'cache_info', 'cache_clear', 'set_cache_size',
+    'set_lexicon', 'set_overrides', 'rules_fingerprint',
+    'set_engine', 'get_engine', 'register_engine', 'engines',
+    # tables publiques depuis la première version
+    'ACCENTS', 'MIN_TO_MAJ', 'ER_R_EXCEPTIONS',
+]
 
 
 #
@@ -9,25 +37,360 @@ import re
 #	MIT licence
 #
 
-ACCENTS = {'É': 'E', 'È': 'E', 'Ë': 'E', 'Ê': 'E', 'Á': 'A', 'À': 'A', 'Ä': 'A', 'Â': 'A',
-            'Å': 'A', 'Ã': 'A', 'Æ': 'E', 'Ï': 'I', 'Î': 'I', 'Ì': 'I', 'Í': 'I',
-            'Ô': 'O', 'Ö': 'O', 'Ò': 'O', 'Ó': 'O', 'Õ': 'O', 'Ø': 'O', 'Œ': 'OEU',
-            'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U', 'Ñ': 'N', 'Ç': 'S', '¿': 'E'}
-MIN_TO_MAJ = {'é': 'É', 'è': 'È', 'ë': 'Ë', 'ê': 'Ê', 'á': 'Á', 'â': 'Â', 'à': 'À', 'Ä': 'A',
-            'Â': 'A', 'å': 'Å', 'ã': 'Ã', 'æ': 'Æ', 'ï': 'Ï', 'î': 'Î', 'ì': 'Ì', 'í': 'Í',
-            'ô': 'Ô', 'ö': 'Ö', 'ò': 'Ò', 'ó': 'Ó', 'õ': 'Õ', 'ø': 'Ø', 'œ': 'Œ',
-            'ú': 'Ú', 'ù': 'Ù', 'û': 'Û', 'ü': 'Ü', 'ç': 'Ç', 'ñ': 'Ñ', 'ß': 'S'}
-
-# Noms en -ER dont le R final est prononcé (contrairement aux infinitifs)
-ER_R_EXCEPTIONS = {
-    "AMER", "BUNKER", "BOOSTER", "BURGER", "CANCER", "CARTER", "ENFER",
-    "CHAPITER", "CLUSTER", "CONTAINER", "CUTTER", "DEALER", "DUMPSTER",
-    "ETHER", "FER", "GAMER", "HACKER", "HIVER", "JOKER", "LASER", "LEADER",
-    "MER", "MINSTER", "PARTERRE", "POKER", "PULLOVER", "ROCKER", "SCANNER",
-    "SPHINCTER", "STARTER", "SWEATER", "ULCERE", "VER", "VERS",
-}
-
-# pylint: disable=too-many-return-statements,too-many-branches,too-many-statements,too-many-locals
+# en dessous, des str.replace successifs sont plus rapides qu'une table
+_MIN_LITERAL_TABLE = 8
+
+
+def _substitute(pattern, replacement, word):
+    """re.sub that only expands a replacement template when the pattern matches"""
+    if pattern.search(word) is None:
+        return word
+    return pattern.sub(replacement, word)
+
+
+def _literal_runs(items, runs, run):
+    """
+    Collects in runs the literal strings found in every match of a parsed
+    pattern, returns the run still open at the end of items.
+    """
+    for operator, argument in items:
+        # les codes d'opération du module interne re sont comparés par leur nom
+        name = operator.name
+        if name == 'LITERAL':
+            run += chr(argument)
+        elif name == 'AT':
+            continue
+        elif name == 'SUBPATTERN':
+            run = _literal_runs(argument[-1], runs, run)
+        elif name == 'IN' and len(argument) == 1 and argument[0][0].name == 'LITERAL':
+            run += chr(argument[0][1])
+        else:
+            runs.append(run)
+            run = ''
+            if name in ('MAX_REPEAT', 'MIN_REPEAT') and argument[0] >= 1:
+                runs.append(_literal_runs(argument[2], runs, ''))
+    return run
+
+
+def _required_literal(pattern):
+    """Returns the longest string found in every match of a pattern, or ''"""
+    runs = []
+    runs.append(_literal_runs(_sre_parse.parse(pattern), runs, ''))
+    return max(runs, key=len)
+
+
+def _set_chars(members):
+    """Returns the characters of a parsed [...] set, or None for negated sets and categories"""
+    chars = set()
+    for member, value in members:
+        if member.name == 'LITERAL':
+            chars.add(chr(value))
+        elif member.name == 'RANGE':
+            chars.update(map(chr, range(value[0], value[1] + 1)))
+        else:
+            return None
+    return chars
+
+
+def _item_tail(name, argument):
+    """Returns the characters which can end a parsed item, and whether it consumes one"""
+    if name == 'LITERAL':
+        return {chr(argument)}, True
+    if name == 'IN':
+        return _set_chars(argument), True
+    if name in ('SUBPATTERN', 'MAX_REPEAT', 'MIN_REPEAT'):
+        tail, consumes = _tail_chars(argument[-1])
+        return tail, consumes and (name == 'SUBPATTERN' or argument[0] >= 1)
+    if name == 'BRANCH':
+        tails = [_tail_chars(branch) for branch in argument[1]]
+        if any(tail is None for tail, _ in tails):
+            return None, True
+        return set().union(*(tail for tail, _ in tails)), all(consumes for _, consumes in tails)
+    return None, True
+
+
+def _tail_chars(items):
+    """
+    Returns the characters which can end a match of parsed items, or None when
+    any character can, and whether the items always consume a character.
+    """
+    chars = set()
+    for operator, argument in reversed(items):
+        tail, consumes = _item_tail(operator.name, argument)
+        if tail is None:
+            return None, True
+        chars |= tail
+        if consumes:
+            return chars, True
+    return chars, False
+
+
+def _end_chars(pattern):
+    """
+    Returns the characters which can end a word matched by a pattern anchored
+    at the end by $, or None when the pattern is not anchored or when any
+    character, or an empty word, can match.
+    """
+    items = _sre_parse.parse(pattern)
+    branches = items[0][1][1] if len(items) == 1 and items[0][0].name == 'BRANCH' else [items]
+    chars = set()
+    for branch in branches:
+        if not branch or branch[-1][0].name != 'AT' or branch[-1][1].name != 'AT_END':
+            return None
+        tail, consumes = _tail_chars(branch[:-1])
+        if tail is None or not consumes:
+            return None
+        chars |= tail
+    return chars
+
+
+def _apply_by_suffix(buckets, default, word):
+    """
+    Applies a run of rules in order, trying only those which can match the
+    last character of the word. buckets maps a last character to the rule
+    positions and (required, step) pairs which can match it, default holds
+    those which can match any word.
+    """
+    start = 0
+    while True:
+        positions, steps = buckets.get(word[-1:], default)
+        for index in range(bisect_left(positions, start), len(positions)):
+            required, step = steps[index]
+            if required in word:
+                result = step(word)
+                if result != word:
+                    # la dernière lettre a pu changer, on reprend à la règle suivante
+                    word = result
+                    start = positions[index] + 1
+                    break
+        else:
+            return word
+
+
+def _suffix_dispatcher(run):
+    """Returns a step applying a run of (end chars, required, step) in order"""
+    endings = set()
+    for chars, _, _ in run:
+        endings.update(chars or ())
+    buckets = {}
+    for ending in endings | {None}:
+        selected = [(position, (required, step)) for position, (chars, required, step)
+                    in enumerate(run) if chars is None or ending in chars]
+        buckets[ending] = (tuple(position for position, _ in selected),
+                           tuple(pair for _, pair in selected))
+    default = buckets.pop(None)
+    return partial(_apply_by_suffix, buckets, default)
+
+
+def _trie_pattern(strings):
+    """
+    Returns a regular expression matching the strings, shaped as a trie and
+    matching the longest of them starting at a position.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for char in string:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def alternatives(node):
+        # les suites plus longues d'abord, la fin d'une chaîne en dernier
+        choices = [re.escape(char) + alternatives(child) for char, child in node.items() if char]
+        if '' in node:
+            choices.append('')
+        if len(choices) == 1:
+            return choices[0]
+        return '(?:' + '|'.join(choices) + ')'
+    return alternatives(trie)
+
+
+def _replace_literals(findall, prefixes, table, word):
+    """
+    Applies a table of literal replacements like successive str.replace calls.
+
+    findall returns the longest string of the table starting at each position
+    of the word; prefixes maps it to the indexes of the strings of the table
+    which start with it, the only others which can be found at that position.
+    The string with the lowest index found is replaced, then the word is
+    searched again for strings with a higher index.
+    """
+    start = 0
+    while True:
+        found = [index for match in findall(word) for index in prefixes[match] if index >= start]
+        if not found:
+            return word
+        index = min(found)
+        old, new = table[index]
+        word = word.replace(old, new)
+        start = index + 1
+
+
+def _literal_table(rules):
+    """Returns a step applying a run of literal rules in a few scans of the word"""
+    indexes = {}
+    for index, rule in enumerate(rules):
+        indexes.setdefault(rule.pattern, []).append(index)
+    prefixes = {string: sorted(index for prefix, prefix_indexes in indexes.items()
+                               if string.startswith(prefix) for index in prefix_indexes)
+                for string in indexes}
+    findall = re.compile('(?=(' + _trie_pattern(indexes) + '))').findall
+    return partial(_replace_literals, findall, prefixes,
+                   tuple((rule.pattern, rule.replacement) for rule in rules))
+
+
+def _compile_rule(rule):
+    """Compiles a rule into a (required, step) pair, step being skipped without required"""
+    if rule.literal:
+        # str.replace cherche déjà la chaîne, un filtre ne ferait que répéter la recherche
+        return '', methodcaller('replace', rule.pattern, rule.replacement)
+    if '\\' in rule.replacement:
+        # les gabarits avec références arrière sont coûteux à préparer
+        return (_required_literal(rule.pattern),
+                partial(_substitute, re.compile(rule.pattern), rule.replacement))
+    return _required_literal(rule.pattern), partial(re.compile(rule.pattern).sub, rule.replacement)
+
+
+def _compile_rules(rules):
+    """
+    Compiles a section of the rule table into a tuple of (required, step)
+    pairs, where step is skipped for words which do not contain required.
+
+    Consecutive rules anchored at the end of the word are grouped into a
+    single step trying only the rules which can match the last character.
+    A single other regular expression between two of them stays in the group
+    and is tried whatever the last character. Long runs of literal rules are
+    grouped into a single step as well.
+    """
+    ends = [None if rule.literal else _end_chars(rule.pattern) for rule in rules]
+    steps = []
+    anchored = []
+    literals = []
+    for position, rule in enumerate(rules):
+        if rule.literal:
+            steps.extend(_flush_anchored(anchored))
+            anchored = []
+            literals.append(rule)
+            continue
+        steps.extend(_flush_literals(literals))
+        literals = []
+        if ends[position] is not None or (anchored and position + 1 < len(rules)
+                                          and ends[position + 1] is not None):
+            anchored.append((ends[position],) + _compile_rule(rule))
+            continue
+        steps.extend(_flush_anchored(anchored))
+        anchored = []
+        steps.append(_compile_rule(rule))
+    steps.extend(_flush_anchored(anchored))
+    steps.extend(_flush_literals(literals))
+    return tuple(steps)
+
+
+def _flush_anchored(run):
+    """Returns the (required, step) pairs of a run of end anchored rules"""
+    if len(run) < 2:
+        return [(required, step) for _, required, step in run]
+    return [('', _suffix_dispatcher(run))]
+
+
+def _flush_literals(rules):
+    """Returns the (required, step) pairs of a run of literal rules"""
+    if len(rules) < _MIN_LITERAL_TABLE:
+        return [_compile_rule(rule) for rule in rules]
+    return [('', _literal_table(rules))]
+
+
+def _translation_table(*mappings):
+    """Merges successive str.translate mappings into a single table"""
+    chars = set()
+    for mapping in mappings:
+        chars.update(mapping)
+    table = {}
+    for char in chars:
+        translated = char
+        for mapping in mappings:
+            translated = translated.translate(str.maketrans(mapping))
+        table[ord(char)] = translated
+    return table
+
+
+# Latin-1 et Latin étendu, calculés dès l'import
+_PREFILLED = 0x250
+
+
+class _LetterTable(dict):
+    """
+    str.translate table of every character, computed on first use from
+    letter(char), which returns the translation of a character or None to
+    delete it.
+    """
+    def __init__(self, letter, table=(), prefill=_PREFILLED):
+        super().__init__(table)
+        self._letter = letter
+        for code in range(prefill):
+            if code not in self:
+                self[code] = letter(chr(code))
+
+    def __missing__(self, code):
+        # des threads concurrents peuvent calculer la même entrée, à l'identique
+        translated = self[code] = self._letter(chr(code))
+        return translated
+
+
+def _upper_letter(char):
+    """Returns a letter in upper case, None for other characters"""
+    return char.upper() if char.isalpha() else None
+
+
+# lettres seules, en majuscules, pour le filtrage des mots
+_UPPER_LETTERS = _LetterTable(_upper_letter)
+_ASCII_UPPER = bytes(range(256)).upper()
+_ASCII_NON_LETTERS = bytes(code for code in range(128) if not chr(code).isalpha())
+
+# minuscules et majuscules accentuées ou composées en majuscules simples, les
+# autres lettres accentuées en leurs lettres de base
+_FOLD_ACCENTS = _LetterTable(base_letters, _translation_table(MIN_TO_MAJ, ACCENTS))
+
+_PREPROCESS_STEPS = _compile_rules(PREPROCESS_RULES)
+_REPETITION_STEPS = _compile_rules(REPETITION_RULES)
+_OING_STEPS = _compile_rules(OING_RULES)
+_INFINITIVE_STEPS = _compile_rules(INFINITIVE_RULES)
+_MAIN_STEPS = _compile_rules(MAIN_RULES)
+_TERMINATION_STEPS = _compile_rules(TERMINATION_RULES)
+
+_ACRONYM_MATCH = re.compile(ACRONYM_PATTERN).match
+_SHORT_WORD_MATCH = re.compile(SHORT_WORD_PATTERN).match
+
+
+def _rules_digest():
+    """Hashes every table and rule which has an influence on the codes"""
+    digest = hashlib.sha256()
+    for table in (MIN_TO_MAJ, ACCENTS, COMPOSITION, DECOMPOSITION,
+                  sorted(ER_R_EXCEPTIONS), SPECIAL_CASES, ACRONYM_PATTERN, SHORT_WORD_PATTERN):
+        digest.update(repr(table).encode('utf-8'))
+    # le filtrage et le repli des lettres dépendent de la version d'Unicode de
+    # Python: les tables pré-calculées sont hachées plutôt que cette version
+    for table in (_UPPER_LETTERS, _FOLD_ACCENTS):
+        digest.update(repr([table[code] for code in range(_PREFILLED)]).encode('utf-8'))
+    for rules in (PREPROCESS_RULES, REPETITION_RULES, OING_RULES, INFINITIVE_RULES,
+                  MAIN_RULES, TERMINATION_RULES):
+        for rule in rules:
+            digest.update(repr((rule.pattern, rule.replacement, rule.literal)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+_RULES_FINGERPRINT = _rules_digest()
+_FINGERPRINT = _RULES_FINGERPRINT
+
+# mots séparés par des blancs (\s correspond exactement à str.isspace)
+_WORD_FINDITER = re.compile(r'\S+').finditer
+
+
+_CACHE = new_cache()
+_LEXICON = None
+_OVERRIDES = None
+
+
 def phonetic(french_word):
     """
     Converts a French word into its phonetic representation.
@@ -43,418 +406,246 @@ def phonetic(french_word):
     'PITON'
     """
 
-    # on garde uniquement les lettres de A à Z
-    french_word = ''.join(char for char in french_word if char.isalpha())
+    return _cached_encode(_normalize(french_word))
+
+
+def phonetic_many(french_words):
+    """
+    Converts many French words into their phonetic representations.
+
+    Each distinct normalized word is encoded only once, which makes this
+    function much faster than calling phonetic() in a loop over columns with
+    repeated values.
+
+    Parameters:
+    - french_words (iterable of str or numpy.ndarray): The input French words.
+
+    Returns:
+    list of str, or numpy.ndarray of the same shape when given a NumPy array:
+    the phonetic representations, in input order.
+
+    Example:
+    >>> phonetic_many(["Gilles", "Jill", "gilles"])
+    ['JIL', 'JIL', 'JIL']
+    """
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(french_words, numpy.ndarray):
+        uniques, inverse = numpy.unique(french_words.ravel(), return_inverse=True)
+        dtype = object if french_words.dtype == object else str
+        codes = numpy.array(phonetic_many(uniques.tolist()), dtype=dtype)
+        return codes[inverse.ravel()].reshape(french_words.shape)
+
+    if not isinstance(french_words, (list, tuple)):
+        french_words = list(french_words)
+    # mots distincts, puis mots normalisés distincts
+    codes = dict.fromkeys(french_words)
+    normalized_codes = {}
+    for french_word in codes:
+        normalized = _normalize(french_word)
+        code = normalized_codes.get(normalized)
+        if code is None:
+            code = normalized_codes[normalized] = _cached_encode(normalized)
+        codes[french_word] = code
+    return list(map(codes.__getitem__, french_words))
+
+
+def cache_info():
+    """Returns the hits, misses, evictions, maxsize and currsize of the phonetic() cache"""
+    return _CACHE.info()
+
+
+def cache_clear():
+    """Empties the phonetic() cache and resets its statistics"""
+    _CACHE.clear()
+
+
+def set_cache_size(maxsize):
+    """Sets the maximum number of words kept by the phonetic() cache, 0 disables it"""
+    _CACHE.resize(maxsize)
+
+
+def set_lexicon(lexicon):
+    """
+    Makes phonetic() look words up in a precomputed lexicon before applying the rules.
+
+    Parameters:
+    - lexicon: An object whose get(word) method returns the code of a word
+      filtered and converted to upper case, or None. Typically a Lexicon
+      opened from a file written by build_lexicon(). None disables the lookup.
+    """
+    global _LEXICON  # pylint: disable=global-statement
+    _LEXICON = lexicon
+    _CACHE.clear()
+
+
+def set_overrides(overrides):
+    """
+    Makes phonetic() return fixed codes for some words, before the lexicon and the rules.
+
+    Parameters:
+    - overrides (dict): Codes by word filtered and converted to upper case,
+      typically built by use_overrides(). The dict is copied, so later changes
+      have no effect. None or an empty dict removes the overrides.
+
+    The fingerprint returned by rules_fingerprint() depends on the overrides.
+    """
+    global _OVERRIDES, _FINGERPRINT  # pylint: disable=global-statement
+    _OVERRIDES = dict(overrides) if overrides else None
+    if _OVERRIDES is None:
+        _FINGERPRINT = _RULES_FINGERPRINT
+    else:
+        digest = hashlib.sha256(_RULES_FINGERPRINT.encode('ascii'))
+        digest.update(repr(sorted(_OVERRIDES.items())).encode('utf-8'))
+        _FINGERPRINT = digest.hexdigest()
+    _CACHE.clear()
+
+
+def _lookups():
+    """Returns the lexicon and the overrides looked up by phonetic()"""
+    return _LEXICON, _OVERRIDES
+
+
+def set_engine(name):
+    """
+    Makes phonetic() encode words with another engine.
+
+    Parameters:
+    - name (str): The name of a registered engine: 'compiled', the default
+      rule table engine, 'reference', the frozen reference implementation,
+      or a name given to register_engine(). The PHONETIC_FR_ENGINE environment
+      variable sets the engine when the package is imported.
+    """
+    global _ENGINE, _ENGINE_NAME  # pylint: disable=global-statement
+    if name not in _ENGINES:
+        raise ValueError(f"unknown engine {name!r}, expecting one of {', '.join(_ENGINES)}")
+    _ENGINE = _ENGINES[name]
+    _ENGINE_NAME = name
+    _CACHE.clear()
+
+
+def get_engine():
+    """Returns the name of the engine used by phonetic()"""
+    return _ENGINE_NAME
+
+
+def register_engine(name, encode):
+    """
+    Registers an engine that set_engine() and check_engine() can select.
+
+    Parameters:
+    - name (str): The name of the engine, 'reference' is reserved.
+    - encode (callable): A function returning the code of a word already
+      filtered and converted to upper case, as phonetic() passes it.
+    """
+    if name == 'reference':
+        raise ValueError("the reference engine cannot be replaced")
+    if not callable(encode):
+        raise TypeError(f"encode must be callable, got {type(encode).__name__}")
+    _ENGINES[name] = encode
+    if name == _ENGINE_NAME:
+        set_engine(name)
 
-    # on passe tout le reste en majuscules
-    french_word = french_word.upper()
+
+def engines():
+    """Returns the names of the registered engines"""
+    return tuple(_ENGINES)
+
+
+def rules_fingerprint():
+    """
+    Returns a hexadecimal digest of the rules and overrides used by phonetic().
+
+    Codes computed and stored with a different fingerprint may differ from
+    the codes phonetic() returns now.
+    """
+    return _FINGERPRINT
+
+
+def _normalize(french_word):
+    """Keeps only the letters of a word, in upper case, composing decomposed letters"""
+    # on garde uniquement les lettres, en majuscules, en une seule passe
+    if french_word.isascii():
+        if french_word.isalpha():
+            return french_word.upper()
+        return french_word.encode('ascii').translate(_ASCII_UPPER,
+                                                     _ASCII_NON_LETTERS).decode('ascii')
+    if not unicodedata.is_normalized(COMPOSITION, french_word):
+        french_word = unicodedata.normalize(COMPOSITION, french_word)
+    return french_word.translate(_UPPER_LETTERS)
+
+
+def _cached_encode(french_word):
+    """Encodes a normalized word, going through the cache"""
+    if not _CACHE.maxsize:
+        return _resolve(french_word)
+    code = _CACHE.get(french_word)
+    if code is None:
+        code = _resolve(french_word)
+        _CACHE.put(french_word, code)
+    return code
+
+
+def _resolve(french_word):
+    """Encodes a normalized word, from the overrides or the lexicon when they have it"""
+    if _OVERRIDES is not None:
+        code = _OVERRIDES.get(french_word)
+        if code is not None:
+            return code
+    if _LEXICON is not None:
+        code = _LEXICON.get(french_word)
+        if code is not None:
+            return code
+    return _ENGINE(french_word)
+
+
+# pylint: disable=too-many-return-statements,too-many-branches
+def _encode(french_word, keep_final_r=None):
+    """
+    Applies the rule table to a word already filtered and converted to upper case.
+    The final R is kept for the words of ER_R_EXCEPTIONS, or as keep_final_r says.
+    """
+
+    # les mots ASCII n'ont aucun accent à replier
+    ascii_word = french_word.isascii()
 
     # on sauve le code (utilisé pour les mots très courts)
-    saved_word = french_word
-    # minuscules accentuées ou composées en majuscules simples
-    saved_word = saved_word.translate(str.maketrans(MIN_TO_MAJ))
-    # majuscules accentuées ou composées en majuscules simples
-    saved_word = saved_word.translate(str.maketrans(ACCENTS))
-
-    keep_final_r = french_word in ER_R_EXCEPTIONS
-
-    # pré traitement: OO... -> OU
-    french_word = re.sub(r'O[O]+', 'OU', french_word)
-    # pré traitement: SAOU -> SOU
-    french_word = re.sub(r'SAOU', 'SOU', french_word)
-    # pré traitement: OES -> OS
-    french_word = re.sub(r'OES', 'OS', french_word)
-    # pré traitement: CCH -> K
-    french_word = re.sub(r'CCH', 'K', french_word)
-    # pré traitement: CCI CCY CCE
-    french_word = re.sub(r'CC([IYE])', r'KS\1', french_word)
-
-    # minuscules accentuées ou composées en majuscules simples
-    french_word = french_word.translate(str.maketrans(MIN_TO_MAJ))
-    # majuscules accentuées ou composées en majuscules simples
-    french_word = french_word.translate(str.maketrans(ACCENTS))
-
-    # supression des répétitions
-    conv_mapping = {
-        "DILLEM": "DIEM"
-    }
-    for conv_in, conv_out in conv_mapping.items():
-        french_word = french_word.replace(conv_in, conv_out)
-    french_word = re.sub(r'(.)\1', r'\1', french_word)
-
-    # quelques cas particuliers
-    special_cases = {
-        "CD": "CD",
-        "BD": "BD",
-        "BV": "BV",
-        "TABAC": "TABA",
-        "FEU": "FE",
-        "FE": "FE",
-        "FER": "FER",
-        "VER": "VER",
-        "FIEF": "FIEF",
-        "FJORD": "FJORD",
-        "GOAL": "GOL",
-        "FLEAU": "FLEO",
-        "HIER": "IER",
-        "HEU": "E",
-        "HE": "E",
-        "OS": "OS",
-        "RIZ": "RI",
-        "RAZ": "RA",
-    }
-
-    if french_word in special_cases:
-        return special_cases[french_word]
-
-    # pré-traitements
-    # Terminations OING -> OIN
-    french_word = re.sub(r'OIN[GT]$', 'OIN', french_word)
-    # Remove infinitive and plural participle endings
+    saved_word = french_word if ascii_word else french_word.translate(_FOLD_ACCENTS)
+
+    if keep_final_r is None:
+        keep_final_r = french_word in ER_R_EXCEPTIONS
+
+    for required, step in _PREPROCESS_STEPS:
+        if required in french_word:
+            french_word = step(french_word)
+
+    if not ascii_word:
+        french_word = french_word.translate(_FOLD_ACCENTS)
+
+    for required, step in _REPETITION_STEPS:
+        if required in french_word:
+            french_word = step(french_word)
+
+    special_case = SPECIAL_CASES.get(french_word)
+    if special_case is not None:
+        return special_case
+
+    for required, step in _OING_STEPS:
+        if required in french_word:
+            french_word = step(french_word)
     if not keep_final_r:
-        french_word = re.sub(r'E[RS]$', 'E', french_word)
-    # pré traitement OEU -> EU
-    french_word = re.sub(r'(C|CH)OEU', 'KE', french_word)
-    # pré traitement OEU -> EU
-    french_word = re.sub(r'MOEU', 'ME', french_word)
-    # pré traitement OEU OEI -> E
-    french_word = re.sub(r'OE([UI]+)([BCDFGHJKLMNPQRSTVWXZ])', r'E\1\2', french_word)
-    # pré traitement GEN -> JAN
-    french_word = re.sub(r'^GEN[TS]$', 'JAN', french_word)
-    # pré traitement accueil
-    french_word = re.sub(r'CUEI', 'KEI', french_word)
-    # pré traitement AE -> E
-    french_word = re.sub(r'([^AEIOUYC])AE([BCDFGHJKLMNPQRSTVWXZ])', r'\1E\2', french_word)
-    # pré traitement AE -> E
-    french_word = re.sub(r'AE([QS])', r'E\1', french_word)
-    # pré traitement AIE(consonne) -> AI
-    french_word = re.sub(r'AIE([BCDFGJKLMNPQRSTVWXZ])', r'AI\1', french_word)
-    # pré traitement NIEM -> NIM
-    french_word = re.sub(r'ANIEM', 'ANIM', french_word)
-    # P terminal muet
-    french_word = re.sub(r'(DRA|TRO|IRO)P$', r'\1', french_word)
-    # B terminal muet
-    french_word = re.sub(r'(LOM)B$', r'\1', french_word)
-    # C terminal muet
-    french_word = re.sub(r'(RON|POR)C$', r'\1', french_word)
-    # C terminal muet
-    french_word = re.sub(r'PECT$', 'PET', french_word)
-    # L terminal muet
-    french_word = re.sub(r'ECUL$', 'CU', french_word)
-    # P or PS terminal muet
-    french_word = re.sub(r'(CHA|CA|E)M(P|PS)$', r'\1N', french_word)
-    # G terminal muet
-    french_word = re.sub(r'(TAN|RAN)G$', r'\1', french_word)
-
-    # sons YEUX
-    french_word = re.sub(r'([^VO])ILAG', r'\1IAJ', french_word)
-    french_word = re.sub(r'([^TRH])UIL(AR|E)(.+)', r'\1UI\2\3', french_word)
-    french_word = re.sub(r'([G])UIL([AEO])', r'\1UI\2', french_word)
-    french_word = re.sub(r'([NSPM])AIL([AEO])', r'\1AI\2', french_word)
-
-    conv_mapping = {
-        "DILAI": "DIAI",
-        "DILON": "DION",
-        "DILER": "DIER",
-        "RILON": "RION",
-        "TAILE": "TAIE",
-        "GAILET": "GAIET",
-        "AILAI": "AIAI",
-        "AILAR": "AIAR",
-        "OUILA": "OUIA",
-        "EILAI": "AIAI",
-        "EILAR": "AIAR",
-        "EILER": "AIER",
-        "EILEM": "AIEM",
-        "REILET": "RAIET",
-        "EILET": "EIET",
-        "AILOL": "AIOL"
-    }
-
-    for conv_in, conv_out in conv_mapping.items():
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # IEM -> IAM
-    french_word = re.sub(r'([^AEIOUY])(SC|S)IEM([EA])', r'\1\2IAM\3', french_word)
-    # IEM -> IAM
-    french_word = re.sub(r'^(SC|S)IEM([EA])', r'\1IAM\2', french_word)
-
-    # MP MB -> NP NB
-    conv_m_in = ['OMB', 'AMB', 'OMP', 'AMP', 'IMB', 'EMP', 'GEMB', 'EMB', 'UMBL', 'CIEN']
-    conv_m_ou = ['ONB', 'ANB', 'ONP', 'ANP', 'INB', 'ANP', 'JANB', 'ANB', 'INBL', 'SIAN']
-
-    for conv_in, conv_out in zip(conv_m_in, conv_m_ou):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # Sons en K
-    # cas particulier: écho
-    french_word = re.sub(r'^ECHO$', 'EKO', french_word)
-    # cas particulier: écœuré
-    french_word = re.sub(r'^ECEUR', 'EKEUR', french_word)
-
-    # Choléra Chœur mais pas chocolat!
-    # En début de mot
-    french_word = re.sub(r'^CH(OG+|OL+|OR+|EU+|ARIS|M+|IRO|ONDR)', r'K\1', french_word)
-    # Ou devant une consonne
-    french_word = re.sub(r'(YN|RI)CH(OG+|OL+|OC+|OP+|OM+|ARIS|M+|IRO|ONDR)', r'\1K\2', french_word)
-    french_word = re.sub(r'CHS', 'CH', french_word)
-    french_word = re.sub(r'CH(AIQ)', r'K\1', french_word)
-    french_word = re.sub(r'^ECHO([^UIPY])', r'EKO\1', french_word)
-    french_word = re.sub(r'ISCH(I|E)', r'ISK\1', french_word)
-    french_word = re.sub(r'^ICHT', 'IKT', french_word)
-    french_word = re.sub(r'ORCHID', 'ORKID', french_word)
-    french_word = re.sub(r'ONCHIO', 'ONKIO', french_word)
-    # retouche ACHIA -> AKIA
-    french_word = re.sub(r'ACHIA', 'AKIA', french_word)
-    # ANICH -> ANIK  1/2
-    french_word = re.sub(r'([^C])ANICH', r'\1ANIK', french_word)
-    # cas particulier  2/2
-    french_word = re.sub(r'OMANIK', 'OMANICH', french_word)
-    french_word = re.sub(r'ACHY([^D])', r'AKI\1', french_word)
-    # voyelle, C, consonne sauf H
-    french_word = re.sub(r'([AEIOU])C([BDFGJKLMNPQRTVWXZ])', r'\1K\2', french_word)
-
-    conv_pr_in = ['EUCHA', 'YCHIA', 'YCHA', 'YCHO', 'YCHED', 'ACHEO', 'RCHEO', 'RCHES',
-                'ECHN', 'OCHTO', 'CHORA', 'CHONDR', 'CHORE', 'MACHM', 'BRONCHO', 'LICHOS', 'LICHOC']
-    conv_pr_out = ['EKA', 'IKIA', 'IKA', 'IKO', 'IKED', 'AKEO', 'RKEO', 'RKES',
-                 'EKN', 'OKTO', 'KORA', 'KONDR', 'KORE', 'MAKM', 'BRONKO', 'LIKOS', 'LIKOC']
-
-    for conv_in, conv_out in zip(conv_pr_in, conv_pr_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # Weuh (perfectible)
-    conv_pr_in = ['WA', 'WO', 'WI', 'WHI', 'WHY', 'WHA', 'WHO']
-    conv_pr_out = ['OI', 'O', 'OUI', 'OUI', 'OUI', 'OUA', 'OU']
-
-    for conv_in, conv_out in zip(conv_pr_in, conv_pr_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # Gueu, Gneu, Jeu et quelques autres
-    conv_pr_in = ['GNES', 'GNET', 'GNER', 'GNE', 'GI', 'GNI', 'GNA', 'GNOU', 'GNUR', 'GY', 'OUGAIN',
-                'AGEOL', 'AGEOT', 'GEOLO', 'GEOM', 'GEOP', 'GEOG', 'GEOS', 'GEORG', 'GEOR', 'NGEOT',
-                'UGEOT', 'GEOT', 'GEOD', 'GEOC', 'GEO', 'GEA', 'GE', 'QU', 'Q', 'CY', 'CI', 'CN',
-                'ICM', 'CEAT', 'CE', 'CR', 'CO', 'CUEI', 'CU', 'VENCA', 'CA', 'CS', 'CLEN', 'CL',
-                'CZ', 'CTIQ', 'CTIF', 'CTIC', 'CTIS', 'CTIL', 'CTIO', 'CTI', 'CTU', 'CTE', 'CTO',
-                'CTR', 'CT', 'PH', 'TH', 'OW', 'LH', 'RDL', 'CHLO', 'CHR', 'PTIA']
-
-    conv_pr_out = ['NIES', 'NIET', 'NIER', 'NE', 'JI', 'NI', 'NIA', 'NIOU', 'NIUR', 'JI', 'OUGIN',
-                 'AJOL', 'AJOT', 'JEOLO', 'JEOM', 'JEOP', 'JEOG', 'JEOS', 'JORJ', 'JEOR', 'NJOT',
-                 'UJOT', 'JEOT', 'JEOD', 'JEOC', 'JO', 'JA', 'JE', 'K', 'K', 'SI', 'SI', 'KN',
-                 'IKM', 'SAT', 'SE', 'KR', 'KO', 'KEI', 'KU', 'VANSA', 'KA', 'KS', 'KLAN', 'KL',
-                 'KZ', 'KTIK', 'KTIF', 'KTIS', 'KTIS', 'KTIL', 'KSIO', 'KTI', 'KTU', 'KTE', 'KTO',
-                 'KTR', 'KT', 'F', 'T', 'OU', 'L', 'RL', 'KLO', 'KR', 'PSIA']
-
-    for conv_in, conv_out in zip(conv_pr_in, conv_pr_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    french_word = re.sub(r'GU([^RLMBSTPZN])', r'G\1', french_word)  # Gueu!
-    french_word = re.sub(r'GNO([MLTNRKG])', r'NIO\1', french_word)  # GNO ! Tout sauf S pour gnos
-    french_word = re.sub(r'GNO([MLTNRKG])', r'NIO\1',
-                 french_word)  # bis -> gnognotte! Si quelqu'un sait le faire en une seule regexp...
-
-    # TI -> SI v2.0
-    conv_pr_in = ['BUTIE', 'BUTIA', 'BATIA', 'ANTIEL', 'RETION', 'ENTIEL', 'ENTIAL', 'ENTIO',
-                  'ENTIAI', 'UJETION', 'ATIEM', 'PETIEN', 'CETIE', 'OFETIE', 'IPETI', 'LBUTION',
-                   'BLUTION', 'LETION', 'LATION', 'SATIET']
-    conv_pr_out = ['BUSIE', 'BUSIA', 'BASIA', 'ANSIEL', 'RESION', 'ENSIEL', 'ENSIAL', 'ENSIO',
-                   'ENSIAI', 'UJESION', 'ASIAM', 'PESIEN', 'CESIE', 'OFESIE', 'IPESI', 'LBUSION',
-                   'BLUSION', 'LESION', 'LASION', 'SASIET']
-
-    for conv_in, conv_out in zip(conv_pr_in, conv_pr_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # sauf antialcoolique, antialbumine, antialarmer, ...
-    french_word = re.sub(r'(.+)ANTI(AL|O)', r'\1ANSI\2', french_word)
-    # sauf inutilité, inutilement, diminutive, ...
-    french_word = re.sub(r'(.+)INUTI([^V])', r'\1INUSI\2', french_word)
-    # sauf soutien, ...
-    french_word = re.sub(r'([^O])UTIEN', r'\1USIEN', french_word)
-
-    # sauf xxxxxcratique, ...
-    french_word = re.sub(r'([^DE])RATI[E]$', r'\1RASI', french_word)
-
-    # TIEN TION -> SIEN SION v3.1
-    french_word = re.sub(r'([^SNEU]|KU|KO|RU|LU|BU|TU|AU)T(IEN|ION)', r'\1S\2', french_word)
-
-    # H muet
-    french_word = re.sub(r'([^CS])H', r'\1', french_word)
-    french_word = french_word.replace("ESH", "ES")
-    french_word = french_word.replace("NSH", "NS")
-    # ou pas!
-    french_word = french_word.replace("SH", "CH")
-
-    # NASALES
-    conv_nas_in = ['OMT', 'IMB', 'IMP', 'UMD', 'TIENT', 'RIENT', 'DIENT', 'IEN', 'YMU', 'YMO',
-                 'YMA', 'YME', 'YMI', 'YMN', 'YM', 'AHO', 'FAIM', 'DAIM', 'SAIM', 'EIN', 'AINS']
-    con_nas_out = ['ONT', 'INB', 'INP', 'OND', 'TIANT', 'RIANT', 'DIANT', 'IN', 'IMU', 'IMO',
-                  'IMA', 'IME', 'IMI', 'IMN', 'IN', 'AO', 'FIN', 'DIN', 'SIN', 'AIN', 'INS']
-    for conv_in, conv_out in zip(conv_nas_in, con_nas_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # AIN -> IN v2.0
-    french_word = re.sub(r'AIN$', 'IN', french_word)
-    french_word = re.sub(r'AIN([BTDK])', r'IN\1', french_word)
-
-    # UN -> IN
-    french_word = re.sub(r'([^O])UND', r'\1IND', french_word)
-    french_word = re.sub(r'([JTVLFMRPSBD])UN([^IAE])', r'\1IN\2', french_word)
-    french_word = re.sub(r'([JTVLFMRPSBD])UN$', r'\1IN', french_word)
-    french_word = re.sub(r'RFUM$', 'RFIN', french_word)
-    french_word = re.sub(r'LUMB', 'LINB', french_word)
-
-    # EN -> AN
-    french_word = re.sub(r'([^BCDFGHJKLMNPQRSTVWXZ])EN', r'\1AN', french_word)
-    french_word = re.sub(r'([VTLJMRPDSBFKNG])EN([BRCTDKZSVN])', r'\1AN\2', french_word)
-    french_word = re.sub(r'([VTLJMRPDSBFKNG])EN([BRCTDKZSVN])', r'\1AN\2', french_word)
-    french_word = re.sub(r'^EN([BCDFGHJKLNPQRSTVXZ]|CH|IV|ORG|OB|UI|UA|UY)', r'AN\1', french_word)
-    french_word = re.sub(r'(^[JRVTH])EN([DRTFGSVJMP])', r'\1AN\2', french_word)
-    french_word = re.sub(r'SEN([ST])', r'SAN\1', french_word)
-    french_word = re.sub(r'^DESENIV', 'DESANIV', french_word)
-    french_word = re.sub(r'([^M])EN(UI)', r'\1AN\2', french_word)
-    french_word = re.sub(r'(.+[JTVLFMRPSBD])EN([JLFDSTG])', r'\1AN\2', french_word)
-
-    # EI -> AI
-    french_word = re.sub(r'([VSBSTNRLPM])E[IY]([ACDFRJLGZ])', r'\1AI\2', french_word)
-
-    # Histoire d'Ô
-    conv_nas_in = ['EAU', 'EU', 'Y', 'EOI', 'JEA', 'OIEM', 'OUANJ', 'OUA', 'OUENJ']
-    con_nas_out = ['O', 'E', 'I', 'OI', 'JA', 'OIM', 'OUENJ', 'OI', 'OUANJ']
-    for conv_in, conv_out in zip(conv_nas_in, con_nas_out):
-        french_word = french_word.replace(conv_in, conv_out)
-
-    # AU without a following E
-    french_word = re.sub(r'AU([^E])', r'O\1', french_word)
-
-    # Les retouches!
-    # Retouche BENJ -> BINJ
-    french_word = re.sub(r'^BENJ', 'BINJ', french_word)
-    # Retouche RTIEL -> RSIEL
-    french_word = re.sub(r'RTIEL', 'RSIEL', french_word)
-    # Retouche PINK -> PONK
-    french_word = re.sub(r'PINK', 'PONK', french_word)
-    # Retouche KIND -> KOND
-    french_word = re.sub(r'KIND', 'KOND', french_word)
-    # Retouche KUMN KUMP
-    french_word = re.sub(r'KUM(N|P)', r'KON\1', french_word)
-    # Retouche LKOU -> LKO
-    french_word = re.sub(r'LKOU', 'LKO', french_word)
-    # Retouche EDBE pied-bœuf
-    french_word = re.sub(r'EDBE', 'EBE', french_word)
-    # Retouche SCH -> CH
-    french_word = re.sub(r'ARCM', 'ARKM', french_word)
-    # Retouche SCH -> CH
-    french_word = re.sub(r'SCH', 'CH', french_word)
-    # Retouche début OINI -> ONI
-    french_word = re.sub(r'^OINI', 'ONI', french_word)
-    # Retouche APT -> AT
-    french_word = re.sub(r'([^NDCGRHKO])APT', r'\1AT', french_word)
-    # Retouche LPT -> LT
-    french_word = re.sub(r'([L]|KON)PT', r'\1T', french_word)
-    # Retouche OTB -> OB (hautbois)
-    french_word = re.sub(r'OTB', 'OB', french_word)
-    # Retouche IXA -> ISA
-    french_word = re.sub(r'IXA', 'ISA', french_word)
-    # Retouche TG -> G
-    french_word = re.sub(r'TG', 'G', french_word)
-    # Retouche début TZ -> TS
-    french_word = re.sub(r'^TZ', 'TS', french_word)
-    # Retouche PTIE -> TIE
-    french_word = re.sub(r'PTIE', 'TIE', french_word)
-    # Retouche GT -> T
-    french_word = re.sub(r'GT', 'T', french_word)
-    # Retouche tranquillement
-    french_word = french_word.replace("ANKIEM", "ANKILEM")
-    # Retouche KEMAN -> KAMAN
-    french_word = re.sub(r'(LO|RE)KEMAN', r'\1KAMAN', french_word)
-    # Retouche TB -> B  TM -> M
-    french_word = re.sub(r'NT(B|M)', r'N\1', french_word)
-    # Retouche GS -> SU
-    french_word = re.sub(r'GSU', 'SU', french_word)
-    # Retouche ESD -> ED
-    french_word = re.sub(r'ESD', 'ED', french_word)
-    # Retouche LESQUEL -> LEKEL
-    french_word = re.sub(r'LESKEL', 'LEKEL', french_word)
-    # Retouche CK -> K
-    french_word = re.sub(r'CK', 'K', french_word)
-
-    # Terminaisons
-    # Terminaisons USIL -> USI
-    french_word = re.sub(r'USIL$', 'USI', french_word)
-    # Terminaisons TS DS LS X T D S...  v2.0
-    french_word = re.sub(r'X$|[TD]S$|[DS]$', '', french_word)
-    # Sauf KT LT terminal
-    french_word = re.sub(r'([^KL]+)T$', r'\1', french_word)
-    # H pseudo muet en début de mot
-    french_word = re.sub(r'^[H]', '', french_word)
+        for required, step in _INFINITIVE_STEPS:
+            if required in french_word:
+                french_word = step(french_word)
+    for required, step in _MAIN_STEPS:
+        if required in french_word:
+            french_word = step(french_word)
 
     # On sauve le code (utilisé pour les mots très courts)
     saved_word2 = french_word
 
-    # Terminaisons TIL -> TI
-    french_word = re.sub(r'TIL$', 'TI', french_word)
-    # Terminaisons LC -> LK
-    french_word = re.sub(r'LC$', 'LK', french_word)
-    # Terminaisons LE LES -> L
-    french_word = re.sub(r'L[E]?[S]?$', 'L', french_word)
-    # Terminaisons NE NES -> N
-    french_word = re.sub(r'(.+)N[E]?[S]?$', r'\1N', french_word)
-    # Terminaisons EZ -> E
-    french_word = re.sub(r'EZ$', 'E', french_word)
-    # Terminaisons OIG -> OI
-    french_word = re.sub(r'OIG$', 'OI', french_word)
-    # Terminaisons OUP -> OU
-    french_word = re.sub(r'OUP$', 'OU', french_word)
-    # Terminaisons OM -> ON sauf ROM
-    french_word = re.sub(r'([^R])OM$', r'\1ON', french_word)
-    # Terminaisons LOP -> LO
-    french_word = re.sub(r'LOP$', 'LO', french_word)
-    # Terminaisons NTANP -> NTAN
-    french_word = re.sub(r'NTANP$', 'NTAN', french_word)
-    # Terminaisons TUN -> TIN
-    french_word = re.sub(r'TUN$', 'TIN', french_word)
-    # Terminaisons AU -> O
-    french_word = re.sub(r'AU$', 'O', french_word)
-    # Terminaisons EI -> AI
-    french_word = re.sub(r'EI$', 'AI', french_word)
-    # Terminaisons RD RG -> R
-    french_word = re.sub(r'R[DG]$', 'R', french_word)
-    # Terminaisons ANC -> AN
-    french_word = re.sub(r'ANC$', 'AN', french_word)
-    # Terminaisons C muet de CROC, ESCROC
-    french_word = re.sub(r'KROC$', 'KRO', french_word)
-    # Terminaisons C muet de CAOUTCHOUC
-    french_word = re.sub(r'HOUC$', 'HOU', french_word)
-    # Terminaisons C muet de ESTOMAC (mais pas HAMAC)
-    french_word = re.sub(r'OMAC$', 'OMA', french_word)
-    # Terminaisons C et G muet de OUC ONC OUG
-    french_word = re.sub(r'([J])O([NU])[CG]$', r'\1O\2', french_word)
-    # Terminaisons G muet ANG ONG sauf GANG GONG TANG TONG
-    french_word = re.sub(r'([^GTR])([AO])NG$', r'\1\2N', french_word)
-    # Terminaisons UC -> UK
-    french_word = re.sub(r'UC$', 'UK', french_word)
-    # Terminaisons AING -> IN
-    french_word = re.sub(r'AING$', 'IN', french_word)
-    # Terminaisons C -> K
-    french_word = re.sub(r'([EISOARN])C$', r'\1K', french_word)
-    # Terminaisons E ou H sauf pour C et N
-    french_word = re.sub(r'([ABD-MO-Z]+)[EH]+$', r'\1', french_word)
-    # Terminaisons EN -> AN (difficile à faire avant sans avoir des soucis)
-    french_word = re.sub(r'EN$', 'AN', french_word)
-    # Terminaisons EN -> AN
-    french_word = re.sub(r'(NJ)EN$', r'\1AN', french_word)
-    # PAIE -> PAI
-    french_word = re.sub(r'^PAIEM', 'PAIM', french_word)
-    # F muet en fin de mot
-    french_word = re.sub(r'([^NTB])EF$', r'\1', french_word)
-
-    # Suppression des répétitions (suite à certains remplacements)
-    french_word = re.sub(r'(.)\1', r'\1', french_word)
-
-    # Cas particuliers, bah au final, je n'en ai qu'un ici
-    conv_part_in = ['FUEL']
-    conv_part_out = ['FIOUL']
-    for conv_in, conv_out in zip(conv_part_in, conv_part_out):
-        french_word = french_word.replace(conv_in, conv_out)
+    for required, step in _TERMINATION_STEPS:
+        if required in french_word:
+            french_word = step(french_word)
 
     # Ce sera le seul code retourné à une seule lettre!
     if french_word == 'O':
@@ -463,15 +654,10 @@ def phonetic(french_word):
     # seconde chance sur les mots courts qui ont souffert de la simplification
     if len(french_word) < 2:
         # Sigles ou abréviations
-        if bool(re.match(
-                "[BCDFGHJKLMNPQRSTVWXYZ]"+
-                "[BCDFGHJKLMNPQRSTVWXYZ]"+
-                "[BCDFGHJKLMNPQRSTVWXYZ]"+
-                "[BCDFGHJKLMNPQRSTVWXYZ]*",
-                saved_word)):
+        if _ACRONYM_MATCH(saved_word):
             return saved_word
 
-        if bool(re.match("[RFMLVSPJDF][AEIOU]", saved_word)):
+        if _SHORT_WORD_MATCH(saved_word):
             if 2 <= len(saved_word) <= 4:
                 # mots de trois ou quatre lettres supposés simples
                 return saved_word[:len(saved_word) - 1]
@@ -479,27 +665,54 @@ def phonetic(french_word):
         if len(saved_word2) > 1:
             return saved_word2
 
-    elif len(french_word) > 1:
-        return french_word
+        return ''
+
+    return french_word
+
+
+# moteurs choisis par set_engine(), appelés sur les mots déjà normalisés
+_ENGINES = {'compiled': _encode, 'reference': _reference_encode}
+_ENGINE = _encode
+_ENGINE_NAME = 'compiled'
+
+if os.environ.get('PHONETIC_FR_ENGINE'):
+    set_engine(os.environ['PHONETIC_FR_ENGINE'])
+
+def phonetic_text_iter(input_str):
+    """
+    Yields the whitespace separated words of a text with their phonetic representation.
+
+    Parameters:
+    - input_str (str): The input French text.
+
+    Returns:
+    generator of (start, end, original, code) tuples, where input_str[start:end]
+    is the original word and code its phonetic representation.
+
+    Example:
+    >>> list(phonetic_text_iter("Le  python"))
+    [(0, 2, 'Le', 'L'), (4, 10, 'python', 'PITON')]
+    """
+    # les mots répétés du texte ne passent qu'une fois par phonetic()
+    codes = {}
+    for match in _WORD_FINDITER(input_str):
+        word = match.group()
+        code = codes.get(word)
+        if code is None:
+            code = codes[word] = phonetic(word)
+        yield match.start(), match.end(), word, code
 
-    return ''
 
 def phonetic_text(input_str):
     """replaces each words from a string by its equivalent phonetic representation"""
-    current_word = ""
-    result = ""
-    for char in input_str:
-        if char.isspace():
-            if current_word:
-                result += phonetic(current_word) + char
-                current_word = ""
-            else:
-                result += char
-        else:
-            current_word += char
-    if current_word:
-        result += phonetic(current_word)
-    return result
+    parts = []
+    position = 0
+    for start, end, _, code in phonetic_text_iter(input_str):
+        parts.append(input_str[position:start])
+        parts.append(code)
+        position = end
+    parts.append(input_str[position:])
+    return ''.join(parts)
 
 def main():
     """Sample usage"""
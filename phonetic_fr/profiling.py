@@ -0,0 +1,202 @@
+"""Per-rule counters, timings and traces of the phonetic() rule cascade.
+
+Profiling swaps the compiled steps of the engine for instrumented ones while it
+is active and restores them afterwards, so phonetic() runs exactly the same
+code as without this module when no profiler is active. Every rule is then
+evaluated on its own, which gives exact per-rule figures even where the engine
+would otherwise group rules together.
+"""
+import time
+from typing import NamedTuple
+
+from . import phonetic_fr as _engine
+from .phonetic_fr import _compile_rule, _encode, _normalize
+from .rules import (PREPROCESS_RULES, REPETITION_RULES, OING_RULES, INFINITIVE_RULES,
+                    MAIN_RULES, TERMINATION_RULES)
+
+# sections de la table, dans l'ordre, avec la variable du moteur qui les exécute
+SECTIONS = (
+    ('preprocess', PREPROCESS_RULES, '_PREPROCESS_STEPS'),
+    ('repetition', REPETITION_RULES, '_REPETITION_STEPS'),
+    ('oing', OING_RULES, '_OING_STEPS'),
+    ('infinitive', INFINITIVE_RULES, '_INFINITIVE_STEPS'),
+    ('main', MAIN_RULES, '_MAIN_STEPS'),
+    ('termination', TERMINATION_RULES, '_TERMINATION_STEPS'),
+)
+
+
+class RuleStats(NamedTuple):
+    """Counters of one rule of the table"""
+    section: str
+    index: int
+    pattern: str
+    replacement: str
+    comment: str
+    evaluated: int
+    changed: int
+    seconds: float
+
+
+class TraceStep(NamedTuple):
+    """A form taken by a word while it is encoded"""
+    section: str
+    index: int
+    pattern: str
+    replacement: str
+    form: str
+
+
+class RuleProfiler:
+    """
+    Counts, for every rule, how often it was evaluated, how often it changed
+    the word and the time spent in it, while the profiler is active. Rules
+    skipped because the word lacks a string they require are not evaluated.
+
+    Only the words actually going through the rules are counted: words served
+    by the cache or a lexicon, or repeated in a phonetic_many() batch, are not.
+    Disable the cache with set_cache_size(0) and call phonetic() on every word
+    to profile every occurrence of a corpus. A single profiler can be active at
+    a time; counts from concurrent threads may be slightly undercounted.
+
+    Example:
+    >>> with RuleProfiler() as profiler:
+    ...     phonetic_many(words)
+    >>> [rule for rule in profiler.stats() if not rule.changed]  # never matched
+    """
+    _active = None
+
+    def __init__(self):
+        self._sections = []
+        self._evaluated = []
+        self._changed = []
+        self._seconds = []
+        self._trace = None
+        self._saved = None
+        for section, rules, _ in SECTIONS:
+            steps = []
+            for index, rule in enumerate(rules):
+                steps.append(self._instrument(len(self._evaluated), section, index, rule))
+                self._evaluated.append(0)
+                self._changed.append(0)
+                self._seconds.append(0.0)
+            self._sections.append(tuple(steps))
+
+    def _instrument(self, position, section, index, rule):
+        """Returns the (required, step) pair of rule, its step updating the counters at position"""
+        required, step = _compile_rule(rule)
+        evaluated = self._evaluated
+        changed = self._changed
+        seconds = self._seconds
+        clock = time.perf_counter
+
+        def instrumented(word):
+            start = clock()
+            result = step(word)
+            seconds[position] += clock() - start
+            evaluated[position] += 1
+            if result != word:
+                changed[position] += 1
+                if self._trace is not None:
+                    self._record(word, TraceStep(section, index, rule.pattern,
+                                                 rule.replacement, result))
+            return result
+        return required, instrumented
+
+    def _record(self, word, step):
+        """Appends a step to the trace, with the changes made outside the rules"""
+        if word != self._trace[-1].form:
+            # seul changement hors des règles: la suppression des accents
+            self._trace.append(TraceStep('accents', -1, '', '', word))
+        self._trace.append(step)
+
+    def start(self):
+        """Installs the instrumented rules in the engine"""
+        if RuleProfiler._active is not None:
+            raise RuntimeError("another RuleProfiler is already active")
+        RuleProfiler._active = self
+        self._saved = [getattr(_engine, name) for _, _, name in SECTIONS]
+        for (_, _, name), steps in zip(SECTIONS, self._sections):
+            setattr(_engine, name, steps)
+
+    def stop(self):
+        """Restores the rules of the engine"""
+        if RuleProfiler._active is not self:
+            return
+        for (_, _, name), steps in zip(SECTIONS, self._saved):
+            setattr(_engine, name, steps)
+        self._saved = None
+        RuleProfiler._active = None
+
+    def reset(self):
+        """Sets every counter back to zero"""
+        # en place, les étapes instrumentées gardent une référence sur ces listes
+        count = len(self._evaluated)
+        self._evaluated[:] = [0] * count
+        self._changed[:] = [0] * count
+        self._seconds[:] = [0.0] * count
+
+    def stats(self):
+        """Returns the RuleStats of every rule, in the order of the table"""
+        results = []
+        position = 0
+        for section, rules, _ in SECTIONS:
+            for index, rule in enumerate(rules):
+                results.append(RuleStats(section, index, rule.pattern, rule.replacement,
+                                         rule.comment, self._evaluated[position],
+                                         self._changed[position], self._seconds[position]))
+                position += 1
+        return results
+
+    def report(self, sort='seconds', limit=None):
+        """Returns a text table of the rules, sorted by seconds, changed, evaluated or order"""
+        stats = self.stats()
+        if sort != 'order':
+            stats.sort(key=lambda rule: getattr(rule, sort), reverse=True)
+        lines = [f"{'section':12} {'#':>3} {'evaluated':>10} {'changed':>9} {'ms':>9}  rule"]
+        for rule in stats[:limit]:
+            lines.append(f"{rule.section:12} {rule.index:3} {rule.evaluated:10} "
+                         f"{rule.changed:9} {rule.seconds * 1000:9.2f}  "
+                         f"{rule.pattern} -> {rule.replacement}")
+        return '\n'.join(lines)
+
+    def trace(self, french_word):
+        """
+        Encodes a word with the rules only and returns every form it went through.
+
+        The first TraceStep holds the normalized word, the last one the code.
+        Rules which did not change the word are omitted; changes made outside
+        the rules are in the 'accents' (accent removal) or 'result' (special
+        cases and the handling of short words) sections.
+        """
+        normalized = _normalize(french_word)
+        self._trace = [TraceStep('input', -1, '', '', normalized)]
+        active = RuleProfiler._active is self
+        if not active:
+            self.start()
+        try:
+            code = _encode(normalized)
+        finally:
+            if not active:
+                self.stop()
+            steps, self._trace = self._trace, None
+        if code != steps[-1].form:
+            steps.append(TraceStep('result', -1, '', '', code))
+        return steps
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def trace(french_word):
+    """
+    Returns the forms a word goes through while it is encoded, as TraceStep.
+
+    Example:
+    >>> [step.form for step in trace("Gilles")]
+    ['GILLES', 'GILES', 'GILE', 'JILE', 'JIL']
+    """
+    return RuleProfiler().trace(french_word)
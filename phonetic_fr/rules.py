@@ -0,0 +1,338 @@
+"""Declarative rule table of the French phonetic algorithm.
+
+The rules are listed in the exact order in which :func:`phonetic_fr.phonetic`
+applies them. Each section is a tuple of :class:`Rule`; a rule is either a
+regular expression substitution or a literal ``str.replace``. The table holds
+no compiled object: the engine in :mod:`phonetic_fr.phonetic_fr` compiles it
+once at import.
+"""
+import unicodedata
+from typing import NamedTuple
+
+
+#
+#	SOUNDEX FR
+#	Édouard BERGÉ © 12.2007 v1.2
+#   Ported to Python by Gaspard PETIT
+#	MIT licence
+#
+
+ACCENTS = {'É': 'E', 'È': 'E', 'Ë': 'E', 'Ê': 'E', 'Á': 'A', 'À': 'A', 'Ä': 'A', 'Â': 'A',
+            'Å': 'A', 'Ã': 'A', 'Æ': 'E', 'Ï': 'I', 'Î': 'I', 'Ì': 'I', 'Í': 'I',
+            'Ô': 'O', 'Ö': 'O', 'Ò': 'O', 'Ó': 'O', 'Õ': 'O', 'Ø': 'O', 'Œ': 'OEU',
+            'Ú': 'U', 'Ù': 'U', 'Û': 'U', 'Ü': 'U', 'Ñ': 'N', 'Ç': 'S', '¿': 'E'}
+MIN_TO_MAJ = {'é': 'É', 'è': 'È', 'ë': 'Ë', 'ê': 'Ê', 'á': 'Á', 'â': 'Â', 'à': 'À', 'Ä': 'A',
+            'Â': 'A', 'å': 'Å', 'ã': 'Ã', 'æ': 'Æ', 'ï': 'Ï', 'î': 'Î', 'ì': 'Ì', 'í': 'Í',
+            'ô': 'Ô', 'ö': 'Ö', 'ò': 'Ò', 'ó': 'Ó', 'õ': 'Õ', 'ø': 'Ø', 'œ': 'Œ',
+            'ú': 'Ú', 'ù': 'Ù', 'û': 'Û', 'ü': 'Ü', 'ç': 'Ç', 'ñ': 'Ñ', 'ß': 'S'}
+
+# forme normale des mots avant les règles: les mots décomposés (NFD), "e" suivi
+# d'un accent combinant, sont d'abord recomposés
+COMPOSITION = 'NFC'
+# décomposition des lettres absentes de ACCENTS (Ć, Ž, Ĳ...) en lettres de A à Z
+DECOMPOSITION = 'NFKD'
+
+
+def base_letters(char):
+    """
+    Returns the letters A to Z a letter with diacritics or a ligature outside
+    ACCENTS decomposes into (Ć -> C, Ĳ -> IJ), or the letter itself.
+    """
+    letters = ''.join(part for part in unicodedata.normalize(DECOMPOSITION, char)
+                      if not unicodedata.combining(part))
+    if letters and letters != char and all('A' <= letter <= 'Z' for letter in letters):
+        return letters
+    return char
+
+
+# Noms en -ER dont le R final est prononcé (contrairement aux infinitifs)
+ER_R_EXCEPTIONS = {
+    "AMER", "BUNKER", "BOOSTER", "BURGER", "CANCER", "CARTER", "ENFER",
+    "CHAPITER", "CLUSTER", "CONTAINER", "CUTTER", "DEALER", "DUMPSTER",
+    "ETHER", "FER", "GAMER", "HACKER", "HIVER", "JOKER", "LASER", "LEADER",
+    "MER", "MINSTER", "PARTERRE", "POKER", "PULLOVER", "ROCKER", "SCANNER",
+    "SPHINCTER", "STARTER", "SWEATER", "ULCERE", "VER", "VERS",
+}
+
+# quelques cas particuliers
+SPECIAL_CASES = {
+    "CD": "CD",
+    "BD": "BD",
+    "BV": "BV",
+    "TABAC": "TABA",
+    "FEU": "FE",
+    "FE": "FE",
+    "FER": "FER",
+    "VER": "VER",
+    "FIEF": "FIEF",
+    "FJORD": "FJORD",
+    "GOAL": "GOL",
+    "FLEAU": "FLEO",
+    "HIER": "IER",
+    "HEU": "E",
+    "HE": "E",
+    "OS": "OS",
+    "RIZ": "RI",
+    "RAZ": "RA",
+}
+
+# Sigles ou abréviations
+ACRONYM_PATTERN = ("[BCDFGHJKLMNPQRSTVWXYZ]" +
+                   "[BCDFGHJKLMNPQRSTVWXYZ]" +
+                   "[BCDFGHJKLMNPQRSTVWXYZ]" +
+                   "[BCDFGHJKLMNPQRSTVWXYZ]*")
+# mots de trois ou quatre lettres supposés simples
+SHORT_WORD_PATTERN = "[RFMLVSPJDF][AEIOU]"
+
+
+class Rule(NamedTuple):
+    """A single rewrite step of the phonetic algorithm."""
+    pattern: str
+    replacement: str
+    literal: bool
+    comment: str
+
+
+def sub(pattern, replacement, comment=''):
+    """Declares a regular expression substitution (``re.sub``)"""
+    return Rule(pattern, replacement, False, comment)
+
+
+def replace(old, new, comment=''):
+    """Declares a literal substitution (``str.replace``)"""
+    return Rule(old, new, True, comment)
+
+
+def replace_all(olds, news, comment=''):
+    """Declares an ordered table of literal substitutions"""
+    assert len(olds) == len(news)
+    return tuple(replace(old, new, comment) for old, new in zip(olds, news))
+
+
+# Appliquées avant la suppression des accents
+PREPROCESS_RULES = (
+    sub(r'O[O]+', 'OU', "pré traitement: OO... -> OU"),
+    sub(r'SAOU', 'SOU', "pré traitement: SAOU -> SOU"),
+    sub(r'OES', 'OS', "pré traitement: OES -> OS"),
+    sub(r'CCH', 'K', "pré traitement: CCH -> K"),
+    sub(r'CC([IYE])', r'KS\1', "pré traitement: CCI CCY CCE"),
+)
+
+# supression des répétitions
+REPETITION_RULES = (
+    replace("DILLEM", "DIEM", "supression des répétitions"),
+    sub(r'(.)\1', r'\1', "supression des répétitions"),
+)
+
+# Appliquées après les cas particuliers
+OING_RULES = (
+    sub(r'OIN[GT]$', 'OIN', "Terminations OING -> OIN"),
+)
+
+# Non appliquées aux mots de ER_R_EXCEPTIONS
+INFINITIVE_RULES = (
+    sub(r'E[RS]$', 'E', "Remove infinitive and plural participle endings"),
+)
+
+MAIN_RULES = (
+    # pré-traitements
+    sub(r'(C|CH)OEU', 'KE', "pré traitement OEU -> EU"),
+    sub(r'MOEU', 'ME', "pré traitement OEU -> EU"),
+    sub(r'OE([UI]+)([BCDFGHJKLMNPQRSTVWXZ])', r'E\1\2', "pré traitement OEU OEI -> E"),
+    sub(r'^GEN[TS]$', 'JAN', "pré traitement GEN -> JAN"),
+    sub(r'CUEI', 'KEI', "pré traitement accueil"),
+    sub(r'([^AEIOUYC])AE([BCDFGHJKLMNPQRSTVWXZ])', r'\1E\2', "pré traitement AE -> E"),
+    sub(r'AE([QS])', r'E\1', "pré traitement AE -> E"),
+    sub(r'AIE([BCDFGJKLMNPQRSTVWXZ])', r'AI\1', "pré traitement AIE(consonne) -> AI"),
+    sub(r'ANIEM', 'ANIM', "pré traitement NIEM -> NIM"),
+    sub(r'(DRA|TRO|IRO)P$', r'\1', "P terminal muet"),
+    sub(r'(LOM)B$', r'\1', "B terminal muet"),
+    sub(r'(RON|POR)C$', r'\1', "C terminal muet"),
+    sub(r'PECT$', 'PET', "C terminal muet"),
+    sub(r'ECUL$', 'CU', "L terminal muet"),
+    sub(r'(CHA|CA|E)M(P|PS)$', r'\1N', "P or PS terminal muet"),
+    sub(r'(TAN|RAN)G$', r'\1', "G terminal muet"),
+
+    # sons YEUX
+    sub(r'([^VO])ILAG', r'\1IAJ', "sons YEUX"),
+    sub(r'([^TRH])UIL(AR|E)(.+)', r'\1UI\2\3', "sons YEUX"),
+    sub(r'([G])UIL([AEO])', r'\1UI\2', "sons YEUX"),
+    sub(r'([NSPM])AIL([AEO])', r'\1AI\2', "sons YEUX"),
+) + replace_all(
+    ["DILAI", "DILON", "DILER", "RILON", "TAILE", "GAILET", "AILAI", "AILAR",
+     "OUILA", "EILAI", "EILAR", "EILER", "EILEM", "REILET", "EILET", "AILOL"],
+    ["DIAI", "DION", "DIER", "RION", "TAIE", "GAIET", "AIAI", "AIAR",
+     "OUIA", "AIAI", "AIAR", "AIER", "AIEM", "RAIET", "EIET", "AIOL"],
+    "sons YEUX") + (
+    sub(r'([^AEIOUY])(SC|S)IEM([EA])', r'\1\2IAM\3', "IEM -> IAM"),
+    sub(r'^(SC|S)IEM([EA])', r'\1IAM\2', "IEM -> IAM"),
+) + replace_all(
+    ['OMB', 'AMB', 'OMP', 'AMP', 'IMB', 'EMP', 'GEMB', 'EMB', 'UMBL', 'CIEN'],
+    ['ONB', 'ANB', 'ONP', 'ANP', 'INB', 'ANP', 'JANB', 'ANB', 'INBL', 'SIAN'],
+    "MP MB -> NP NB") + (
+
+    # Sons en K
+    sub(r'^ECHO$', 'EKO', "cas particulier: écho"),
+    sub(r'^ECEUR', 'EKEUR', "cas particulier: écœuré"),
+    # Choléra Chœur mais pas chocolat!
+    sub(r'^CH(OG+|OL+|OR+|EU+|ARIS|M+|IRO|ONDR)', r'K\1', "CH -> K en début de mot"),
+    sub(r'(YN|RI)CH(OG+|OL+|OC+|OP+|OM+|ARIS|M+|IRO|ONDR)', r'\1K\2',
+        "CH -> K devant une consonne"),
+    sub(r'CHS', 'CH', "Sons en K"),
+    sub(r'CH(AIQ)', r'K\1', "Sons en K"),
+    sub(r'^ECHO([^UIPY])', r'EKO\1', "Sons en K"),
+    sub(r'ISCH(I|E)', r'ISK\1', "Sons en K"),
+    sub(r'^ICHT', 'IKT', "Sons en K"),
+    sub(r'ORCHID', 'ORKID', "Sons en K"),
+    sub(r'ONCHIO', 'ONKIO', "Sons en K"),
+    sub(r'ACHIA', 'AKIA', "retouche ACHIA -> AKIA"),
+    sub(r'([^C])ANICH', r'\1ANIK', "ANICH -> ANIK  1/2"),
+    sub(r'OMANIK', 'OMANICH', "cas particulier  2/2"),
+    sub(r'ACHY([^D])', r'AKI\1', "Sons en K"),
+    sub(r'([AEIOU])C([BDFGJKLMNPQRTVWXZ])', r'\1K\2', "voyelle, C, consonne sauf H"),
+) + replace_all(
+    ['EUCHA', 'YCHIA', 'YCHA', 'YCHO', 'YCHED', 'ACHEO', 'RCHEO', 'RCHES',
+     'ECHN', 'OCHTO', 'CHORA', 'CHONDR', 'CHORE', 'MACHM', 'BRONCHO', 'LICHOS', 'LICHOC'],
+    ['EKA', 'IKIA', 'IKA', 'IKO', 'IKED', 'AKEO', 'RKEO', 'RKES',
+     'EKN', 'OKTO', 'KORA', 'KONDR', 'KORE', 'MAKM', 'BRONKO', 'LIKOS', 'LIKOC'],
+    "Sons en K") + replace_all(
+    ['WA', 'WO', 'WI', 'WHI', 'WHY', 'WHA', 'WHO'],
+    ['OI', 'O', 'OUI', 'OUI', 'OUI', 'OUA', 'OU'],
+    "Weuh (perfectible)") + replace_all(
+    ['GNES', 'GNET', 'GNER', 'GNE', 'GI', 'GNI', 'GNA', 'GNOU', 'GNUR', 'GY', 'OUGAIN',
+     'AGEOL', 'AGEOT', 'GEOLO', 'GEOM', 'GEOP', 'GEOG', 'GEOS', 'GEORG', 'GEOR', 'NGEOT',
+     'UGEOT', 'GEOT', 'GEOD', 'GEOC', 'GEO', 'GEA', 'GE', 'QU', 'Q', 'CY', 'CI', 'CN',
+     'ICM', 'CEAT', 'CE', 'CR', 'CO', 'CUEI', 'CU', 'VENCA', 'CA', 'CS', 'CLEN', 'CL',
+     'CZ', 'CTIQ', 'CTIF', 'CTIC', 'CTIS', 'CTIL', 'CTIO', 'CTI', 'CTU', 'CTE', 'CTO',
+     'CTR', 'CT', 'PH', 'TH', 'OW', 'LH', 'RDL', 'CHLO', 'CHR', 'PTIA'],
+    ['NIES', 'NIET', 'NIER', 'NE', 'JI', 'NI', 'NIA', 'NIOU', 'NIUR', 'JI', 'OUGIN',
+     'AJOL', 'AJOT', 'JEOLO', 'JEOM', 'JEOP', 'JEOG', 'JEOS', 'JORJ', 'JEOR', 'NJOT',
+     'UJOT', 'JEOT', 'JEOD', 'JEOC', 'JO', 'JA', 'JE', 'K', 'K', 'SI', 'SI', 'KN',
+     'IKM', 'SAT', 'SE', 'KR', 'KO', 'KEI', 'KU', 'VANSA', 'KA', 'KS', 'KLAN', 'KL',
+     'KZ', 'KTIK', 'KTIF', 'KTIS', 'KTIS', 'KTIL', 'KSIO', 'KTI', 'KTU', 'KTE', 'KTO',
+     'KTR', 'KT', 'F', 'T', 'OU', 'L', 'RL', 'KLO', 'KR', 'PSIA'],
+    "Gueu, Gneu, Jeu et quelques autres") + (
+    sub(r'GU([^RLMBSTPZN])', r'G\1', "Gueu!"),
+    sub(r'GNO([MLTNRKG])', r'NIO\1', "GNO ! Tout sauf S pour gnos"),
+    sub(r'GNO([MLTNRKG])', r'NIO\1', "bis -> gnognotte!"),
+) + replace_all(
+    ['BUTIE', 'BUTIA', 'BATIA', 'ANTIEL', 'RETION', 'ENTIEL', 'ENTIAL', 'ENTIO',
+     'ENTIAI', 'UJETION', 'ATIEM', 'PETIEN', 'CETIE', 'OFETIE', 'IPETI', 'LBUTION',
+     'BLUTION', 'LETION', 'LATION', 'SATIET'],
+    ['BUSIE', 'BUSIA', 'BASIA', 'ANSIEL', 'RESION', 'ENSIEL', 'ENSIAL', 'ENSIO',
+     'ENSIAI', 'UJESION', 'ASIAM', 'PESIEN', 'CESIE', 'OFESIE', 'IPESI', 'LBUSION',
+     'BLUSION', 'LESION', 'LASION', 'SASIET'],
+    "TI -> SI v2.0") + (
+    sub(r'(.+)ANTI(AL|O)', r'\1ANSI\2', "sauf antialcoolique, antialbumine, antialarmer, ..."),
+    sub(r'(.+)INUTI([^V])', r'\1INUSI\2', "sauf inutilité, inutilement, diminutive, ..."),
+    sub(r'([^O])UTIEN', r'\1USIEN', "sauf soutien, ..."),
+    sub(r'([^DE])RATI[E]$', r'\1RASI', "sauf xxxxxcratique, ..."),
+    sub(r'([^SNEU]|KU|KO|RU|LU|BU|TU|AU)T(IEN|ION)', r'\1S\2', "TIEN TION -> SIEN SION v3.1"),
+
+    # H muet
+    sub(r'([^CS])H', r'\1', "H muet"),
+    replace("ESH", "ES", "H muet"),
+    replace("NSH", "NS", "H muet"),
+    replace("SH", "CH", "ou pas!"),
+) + replace_all(
+    ['OMT', 'IMB', 'IMP', 'UMD', 'TIENT', 'RIENT', 'DIENT', 'IEN', 'YMU', 'YMO',
+     'YMA', 'YME', 'YMI', 'YMN', 'YM', 'AHO', 'FAIM', 'DAIM', 'SAIM', 'EIN', 'AINS'],
+    ['ONT', 'INB', 'INP', 'OND', 'TIANT', 'RIANT', 'DIANT', 'IN', 'IMU', 'IMO',
+     'IMA', 'IME', 'IMI', 'IMN', 'IN', 'AO', 'FIN', 'DIN', 'SIN', 'AIN', 'INS'],
+    "NASALES") + (
+    sub(r'AIN$', 'IN', "AIN -> IN v2.0"),
+    sub(r'AIN([BTDK])', r'IN\1', "AIN -> IN v2.0"),
+
+    sub(r'([^O])UND', r'\1IND', "UN -> IN"),
+    sub(r'([JTVLFMRPSBD])UN([^IAE])', r'\1IN\2', "UN -> IN"),
+    sub(r'([JTVLFMRPSBD])UN$', r'\1IN', "UN -> IN"),
+    sub(r'RFUM$', 'RFIN', "UN -> IN"),
+    sub(r'LUMB', 'LINB', "UN -> IN"),
+
+    sub(r'([^BCDFGHJKLMNPQRSTVWXZ])EN', r'\1AN', "EN -> AN"),
+    sub(r'([VTLJMRPDSBFKNG])EN([BRCTDKZSVN])', r'\1AN\2', "EN -> AN"),
+    sub(r'([VTLJMRPDSBFKNG])EN([BRCTDKZSVN])', r'\1AN\2', "EN -> AN"),
+    sub(r'^EN([BCDFGHJKLNPQRSTVXZ]|CH|IV|ORG|OB|UI|UA|UY)', r'AN\1', "EN -> AN"),
+    sub(r'(^[JRVTH])EN([DRTFGSVJMP])', r'\1AN\2', "EN -> AN"),
+    sub(r'SEN([ST])', r'SAN\1', "EN -> AN"),
+    sub(r'^DESENIV', 'DESANIV', "EN -> AN"),
+    sub(r'([^M])EN(UI)', r'\1AN\2', "EN -> AN"),
+    sub(r'(.+[JTVLFMRPSBD])EN([JLFDSTG])', r'\1AN\2', "EN -> AN"),
+
+    sub(r'([VSBSTNRLPM])E[IY]([ACDFRJLGZ])', r'\1AI\2', "EI -> AI"),
+) + replace_all(
+    ['EAU', 'EU', 'Y', 'EOI', 'JEA', 'OIEM', 'OUANJ', 'OUA', 'OUENJ'],
+    ['O', 'E', 'I', 'OI', 'JA', 'OIM', 'OUENJ', 'OI', 'OUANJ'],
+    "Histoire d'Ô") + (
+    sub(r'AU([^E])', r'O\1', "AU without a following E"),
+
+    # Les retouches!
+    sub(r'^BENJ', 'BINJ', "Retouche BENJ -> BINJ"),
+    sub(r'RTIEL', 'RSIEL', "Retouche RTIEL -> RSIEL"),
+    sub(r'PINK', 'PONK', "Retouche PINK -> PONK"),
+    sub(r'KIND', 'KOND', "Retouche KIND -> KOND"),
+    sub(r'KUM(N|P)', r'KON\1', "Retouche KUMN KUMP"),
+    sub(r'LKOU', 'LKO', "Retouche LKOU -> LKO"),
+    sub(r'EDBE', 'EBE', "Retouche EDBE pied-bœuf"),
+    sub(r'ARCM', 'ARKM', "Retouche ARCM -> ARKM"),
+    sub(r'SCH', 'CH', "Retouche SCH -> CH"),
+    sub(r'^OINI', 'ONI', "Retouche début OINI -> ONI"),
+    sub(r'([^NDCGRHKO])APT', r'\1AT', "Retouche APT -> AT"),
+    sub(r'([L]|KON)PT', r'\1T', "Retouche LPT -> LT"),
+    sub(r'OTB', 'OB', "Retouche OTB -> OB (hautbois)"),
+    sub(r'IXA', 'ISA', "Retouche IXA -> ISA"),
+    sub(r'TG', 'G', "Retouche TG -> G"),
+    sub(r'^TZ', 'TS', "Retouche début TZ -> TS"),
+    sub(r'PTIE', 'TIE', "Retouche PTIE -> TIE"),
+    sub(r'GT', 'T', "Retouche GT -> T"),
+    replace("ANKIEM", "ANKILEM", "Retouche tranquillement"),
+    sub(r'(LO|RE)KEMAN', r'\1KAMAN', "Retouche KEMAN -> KAMAN"),
+    sub(r'NT(B|M)', r'N\1', "Retouche TB -> B  TM -> M"),
+    sub(r'GSU', 'SU', "Retouche GS -> SU"),
+    sub(r'ESD', 'ED', "Retouche ESD -> ED"),
+    sub(r'LESKEL', 'LEKEL', "Retouche LESQUEL -> LEKEL"),
+    sub(r'CK', 'K', "Retouche CK -> K"),
+
+    # Terminaisons
+    sub(r'USIL$', 'USI', "Terminaisons USIL -> USI"),
+    sub(r'X$|[TD]S$|[DS]$', '', "Terminaisons TS DS LS X T D S...  v2.0"),
+    sub(r'([^KL]+)T$', r'\1', "Sauf KT LT terminal"),
+    sub(r'^[H]', '', "H pseudo muet en début de mot"),
+)
+
+# Appliquées après la sauvegarde du code utilisé pour les mots très courts
+TERMINATION_RULES = (
+    sub(r'TIL$', 'TI', "Terminaisons TIL -> TI"),
+    sub(r'LC$', 'LK', "Terminaisons LC -> LK"),
+    sub(r'L[E]?[S]?$', 'L', "Terminaisons LE LES -> L"),
+    sub(r'(.+)N[E]?[S]?$', r'\1N', "Terminaisons NE NES -> N"),
+    sub(r'EZ$', 'E', "Terminaisons EZ -> E"),
+    sub(r'OIG$', 'OI', "Terminaisons OIG -> OI"),
+    sub(r'OUP$', 'OU', "Terminaisons OUP -> OU"),
+    sub(r'([^R])OM$', r'\1ON', "Terminaisons OM -> ON sauf ROM"),
+    sub(r'LOP$', 'LO', "Terminaisons LOP -> LO"),
+    sub(r'NTANP$', 'NTAN', "Terminaisons NTANP -> NTAN"),
+    sub(r'TUN$', 'TIN', "Terminaisons TUN -> TIN"),
+    sub(r'AU$', 'O', "Terminaisons AU -> O"),
+    sub(r'EI$', 'AI', "Terminaisons EI -> AI"),
+    sub(r'R[DG]$', 'R', "Terminaisons RD RG -> R"),
+    sub(r'ANC$', 'AN', "Terminaisons ANC -> AN"),
+    sub(r'KROC$', 'KRO', "Terminaisons C muet de CROC, ESCROC"),
+    sub(r'HOUC$', 'HOU', "Terminaisons C muet de CAOUTCHOUC"),
+    sub(r'OMAC$', 'OMA', "Terminaisons C muet de ESTOMAC (mais pas HAMAC)"),
+    sub(r'([J])O([NU])[CG]$', r'\1O\2', "Terminaisons C et G muet de OUC ONC OUG"),
+    sub(r'([^GTR])([AO])NG$', r'\1\2N', "Terminaisons G muet ANG ONG sauf GANG GONG TANG TONG"),
+    sub(r'UC$', 'UK', "Terminaisons UC -> UK"),
+    sub(r'AING$', 'IN', "Terminaisons AING -> IN"),
+    sub(r'([EISOARN])C$', r'\1K', "Terminaisons C -> K"),
+    sub(r'([ABD-MO-Z]+)[EH]+$', r'\1', "Terminaisons E ou H sauf pour C et N"),
+    sub(r'EN$', 'AN', "Terminaisons EN -> AN (difficile à faire avant sans avoir des soucis)"),
+    sub(r'(NJ)EN$', r'\1AN', "Terminaisons EN -> AN"),
+    sub(r'^PAIEM', 'PAIM', "PAIE -> PAI"),
+    sub(r'([^NTB])EF$', r'\1', "F muet en fin de mot"),
+
+    sub(r'(.)\1', r'\1', "Suppression des répétitions (suite à certains remplacements)"),
+
+    # Cas particuliers, bah au final, je n'en ai qu'un ici
+    replace('FUEL', 'FIOUL', "Cas particuliers"),
+)
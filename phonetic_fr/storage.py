@@ -0,0 +1,315 @@
+"""Compact on-disk format for phonetic indexes, read through mmap.
+
+A file holds a fixed size header followed by 8 byte aligned sections::
+
+    header            magic, package version, rules fingerprint, key kind,
+                      counts and absolute offsets of the sections below
+    code offsets      (codes + 1) uint64, offsets of each code in the code blob
+    code blob         UTF-8 codes, sorted, concatenated
+    posting offsets   (codes + 1) uint64, index of each posting list
+    postings          int64 keys, or indexes in the key table for string keys
+    key offsets       (keys + 1) uint64, string keys only
+    key blob          UTF-8 keys, string keys only
+
+All integers are little-endian. Codes are sorted so that lookups are a binary
+search over pages mapped in memory; several processes opening the same file
+share those pages.
+"""
+import abc
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+from .phonetic_fr import phonetic, rules_fingerprint
+
+MAGIC = b'PHFRIDX1'
+KEY_INT = 0
+KEY_STR = 1
+
+_HEADER = struct.Struct('<8s32s64sB7x9Q')
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+class StaleIndexError(ValueError):
+    """The index file was built with rules different from the current ones"""
+
+
+def _align(file):
+    """Pads the file with zeros up to the next multiple of 8 bytes"""
+    padding = -file.tell() % 8
+    file.write(b'\0' * padding)
+    return file.tell()
+
+
+def _little_endian(values):
+    """Returns the bytes of an array in little-endian order"""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _write_strings(file, strings):
+    """Writes an offset table followed by the concatenated UTF-8 strings"""
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = array('Q', [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    offsets_position = _align(file)
+    file.write(_little_endian(offsets))
+    blob_position = file.tell()
+    file.write(b''.join(encoded))
+    return offsets_position, blob_position
+
+
+def _check_section(data, path, position, size):
+    """Raises ValueError when size bytes from position do not fit in the mapped file"""
+    if position + size > len(data):
+        raise ValueError(f"{path} is truncated or corrupt: a section ends at byte "
+                         f"{position + size}, past the end of the file ({len(data)} bytes)")
+
+
+def _last_offset(data, path, position, count):
+    """Checks that a table of count + 1 offsets fits in the mapped file, returns its last one"""
+    _check_section(data, path, position, 8 * (count + 1))
+    return struct.unpack_from('<Q', data, position + 8 * count)[0]
+
+
+def _map_table(view, position, count, typecode):
+    """Returns an integer table of a mapped file, without copy on little-endian hosts"""
+    table = view[position:position + array(typecode).itemsize * count].cast(typecode)
+    if sys.byteorder != 'little':
+        table = array(typecode, table)
+        table.byteswap()
+    return table
+
+
+def _key_kind(keys):
+    """Returns KEY_INT or KEY_STR according to the type of every key"""
+    if all(type(key) is int and _INT64_MIN <= key <= _INT64_MAX  # pylint: disable=unidiomatic-typecheck
+           for key in keys):
+        return KEY_INT
+    if all(isinstance(key, str) for key in keys):
+        return KEY_STR
+    raise TypeError("index keys must either all be 64 bit integers or all be strings")
+
+
+def _package_version():
+    """Returns the __version__ of the phonetic_fr package"""
+    return sys.modules[__package__].__version__
+
+
+def _write_atomically(path, write, *args):
+    """Calls write(file, *args) on a temporary file, then moves it to path"""
+    # propre au processus et au thread: deux écritures du même fichier ne se mélangent pas
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, 'wb') as file:
+            write(file, *args)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _write_index(file, codes, posting_offsets, postings, keys):
+    """Writes the sections of an index file, then its header"""
+    file.write(b'\0' * _HEADER.size)
+    code_offsets, code_blob = _write_strings(file, codes)
+    posting_offsets_position = _align(file)
+    file.write(_little_endian(posting_offsets))
+    postings_position = file.tell()
+    file.write(_little_endian(postings))
+    key_offsets = key_blob = 0
+    if keys is not None:
+        key_offsets, key_blob = _write_strings(file, keys)
+    file.seek(0)
+    file.write(_HEADER.pack(
+        MAGIC, _package_version().encode('utf-8'), rules_fingerprint().encode('ascii'),
+        KEY_INT if keys is None else KEY_STR, len(codes), len(postings),
+        0 if keys is None else len(keys), code_offsets, code_blob, posting_offsets_position,
+        postings_position, key_offsets, key_blob))
+
+
+def save_index(index, path):
+    """
+    Writes a PhoneticIndex to path, replacing the file atomically.
+
+    Keys must either all be 64 bit integers or all be strings.
+    """
+    items = sorted(index.items())
+    keys = {}
+    for _, code_keys in items:
+        keys.update(dict.fromkeys(code_keys))
+    kind = _key_kind(keys)
+    if kind == KEY_STR:
+        keys = {key: position for position, key in enumerate(keys)}
+
+    posting_offsets = array('Q', [0])
+    postings = array('q')
+    for _, code_keys in items:
+        postings.extend(code_keys if kind == KEY_INT else [keys[key] for key in code_keys])
+        posting_offsets.append(len(postings))
+
+    _write_atomically(path, _write_index, [code for code, _ in items], posting_offsets, postings,
+                      keys if kind == KEY_STR else None)
+
+
+class _MappedFile(abc.ABC):
+    """Read-only file mapped in memory, whose header records the rules it was built with"""
+    MAGIC = None
+    DESCRIPTION = None
+
+    def __init__(self, path, check_rules=True):
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.path = path
+        self.version = self.fingerprint = None
+        try:
+            self._open(path, check_rules)
+        except Exception:
+            self._mmap.close()
+            raise
+
+    @abc.abstractmethod
+    def _open(self, path, check_rules):
+        """Parses the header and maps the sections"""
+
+    def _check_header(self, path, header, check_rules, expected):
+        """Checks the magic and the expected rules fingerprint, returns the other header fields"""
+        if len(self._mmap) < header.size:
+            raise ValueError(f"{path} is not a {self.DESCRIPTION} file")
+        magic, version, fingerprint, *fields = header.unpack_from(self._mmap)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a {self.DESCRIPTION} file")
+        self.version = version.rstrip(b'\0').decode('utf-8')
+        self.fingerprint = fingerprint.decode('ascii')
+        if check_rules and self.fingerprint != expected:
+            raise StaleIndexError(
+                f"{path} was built by phonetic_fr {self.version} with other rules, "
+                "it must be rebuilt")
+        return fields
+
+    def close(self):
+        """Unmaps the file"""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class MappedPhoneticIndex(_MappedFile):  # pylint: disable=too-many-instance-attributes
+    """
+    Read-only phonetic index opened from a file written by save_index().
+
+    Only the pages touched by lookups are read from disk. Opening a file built
+    with other rules raises StaleIndexError unless check_rules is False.
+
+    Example:
+    >>> save_index(PhoneticIndex([(1, "Gilles"), (2, "Jill")]), "names.idx")
+    >>> with MappedPhoneticIndex("names.idx") as index:
+    ...     index.lookup("gile")
+    [1, 2]
+    """
+    MAGIC = MAGIC
+    DESCRIPTION = 'phonetic index'
+
+    def _open(self, path, check_rules):
+        """Parses the header and maps the sections"""
+        (self.key_kind, self._count, self._postings_count, keys_count, code_offsets,
+         self._code_blob, posting_offsets, postings, key_offsets,
+         self._key_blob) = self._check_header(path, _HEADER, check_rules, rules_fingerprint())
+        # les sections sont vérifiées avant d'être projetées: une vue empêcherait la fermeture
+        data = self._mmap
+        _check_section(data, path, self._code_blob,
+                       _last_offset(data, path, code_offsets, self._count))
+        if _last_offset(data, path, posting_offsets, self._count) > self._postings_count:
+            raise ValueError(f"{path} is corrupt: its posting lists end past the postings")
+        _check_section(data, path, postings, 8 * self._postings_count)
+        if self.key_kind == KEY_STR:
+            _check_section(data, path, self._key_blob,
+                           _last_offset(data, path, key_offsets, keys_count))
+        view = memoryview(self._mmap)
+        self._code_offsets = _map_table(view, code_offsets, self._count + 1, 'Q')
+        self._posting_offsets = _map_table(view, posting_offsets, self._count + 1, 'Q')
+        self._postings = _map_table(view, postings, self._postings_count, 'q')
+        self._key_offsets = None
+        if self.key_kind == KEY_STR:
+            self._key_offsets = _map_table(view, key_offsets, keys_count + 1, 'Q')
+
+    def _code(self, position):
+        """Returns the UTF-8 bytes of the code at a sorted position"""
+        start = self._code_blob + self._code_offsets[position]
+        end = self._code_blob + self._code_offsets[position + 1]
+        return self._mmap[start:end]
+
+    def _find(self, code):
+        """Returns the sorted position of code, or -1"""
+        encoded = code.encode('utf-8')
+        position = bisect_left(_CodeView(self), encoded)
+        if position < self._count and self._code(position) == encoded:
+            return position
+        return -1
+
+    def _key(self, value):
+        """Returns the key stored in a posting list"""
+        if self._key_offsets is None:
+            return value
+        start = self._key_blob + self._key_offsets[value]
+        end = self._key_blob + self._key_offsets[value + 1]
+        return self._mmap[start:end].decode('utf-8')
+
+    def lookup_code(self, code):
+        """Returns the keys indexed under a phonetic code"""
+        position = self._find(code)
+        if position < 0:
+            return []
+        start = self._posting_offsets[position]
+        end = self._posting_offsets[position + 1]
+        return [self._key(value) for value in self._postings[start:end]]
+
+    def lookup(self, word):
+        """Returns the keys of the indexed words sounding like word"""
+        return self.lookup_code(phonetic(word))
+
+    def codes(self):
+        """Yields the indexed phonetic codes in sorted order"""
+        for position in range(self._count):
+            yield self._code(position).decode('utf-8')
+
+    def close(self):
+        """Unmaps the file"""
+        self._code_offsets = self._posting_offsets = self._postings = self._key_offsets = None
+        super().close()
+
+    def __contains__(self, word):
+        return self._find(phonetic(word)) >= 0
+
+    def __len__(self):
+        """Number of indexed (key, code) pairs"""
+        return self._postings_count
+
+
+class _CodeView:  # pylint: disable=too-few-public-methods
+    """Sequence of the sorted codes of a MappedPhoneticIndex, for bisect"""
+    def __init__(self, index):
+        self._index = index
+
+    def __getitem__(self, position):
+        return self._index._code(position)  # pylint: disable=protected-access
+
+    def __len__(self):
+        return self._index._count  # pylint: disable=protected-access
+
+
+def open_index(path, check_rules=True):
+    """Opens an index file written by save_index()"""
+    return MappedPhoneticIndex(path, check_rules)
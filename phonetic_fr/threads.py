@@ -0,0 +1,65 @@
+"""Batch encoding of French words with a pool of threads.
+
+On free-threaded builds of CPython (3.13t and later, with the GIL disabled),
+threads run phonetic() in parallel without pickling words and codes to worker
+processes or starting them. With the GIL, they take turns on a single core and
+phonetic_parallel() remains the way to use several cores;
+benchmarks/bench_threads.py measures both on the running interpreter.
+
+The rules share no mutable state: they are tuples of compiled steps built at
+import, and the translation tables only gain entries that any thread computes
+identically. The cache is locked, and split into shards locked separately
+when the GIL is disabled.
+"""
+import os
+
+from .parallel import DEFAULT_CHUNK_SIZE, _imap_chunks
+from .phonetic_fr import phonetic_many
+
+# en dessous, un lot coûte plus en synchronisation qu'en encodage
+MIN_CHUNK_SIZE = 256
+# quelques lots par thread équilibrent la charge entre les threads
+CHUNKS_PER_WORKER = 4
+
+
+def _auto_chunksize(count, workers):
+    """Returns a chunk size giving each worker a few chunks of count words"""
+    chunksize = -(-count // (workers * CHUNKS_PER_WORKER))
+    return max(MIN_CHUNK_SIZE, min(DEFAULT_CHUNK_SIZE, chunksize))
+
+
+def phonetic_threaded(french_words, workers=None, chunksize=None, executor=None):
+    """
+    Converts French words into their phonetic representations in a pool of threads.
+
+    Parameters:
+    - french_words (iterable of str): The input French words.
+    - workers (int): Number of threads, defaults to the number of CPUs.
+    - chunksize (int): Number of words given to a thread at once. By default,
+      each thread gets about CHUNKS_PER_WORKER chunks, of MIN_CHUNK_SIZE to
+      DEFAULT_CHUNK_SIZE words; inputs of a single chunk are encoded in the
+      calling thread.
+    - executor (concurrent.futures.Executor): An existing pool to reuse instead of
+      starting a new one; it is left running.
+
+    Returns:
+    list of str: The phonetic representations, in input order.
+
+    Example:
+    >>> phonetic_threaded(["Gilles", "Jill"], workers=2)
+    ['JIL', 'JIL']
+    """
+    if not isinstance(french_words, (list, tuple)):
+        french_words = list(french_words)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = _auto_chunksize(len(french_words), workers)
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    if len(french_words) <= chunksize:
+        return phonetic_many(french_words)
+    if executor is not None:
+        return list(_imap_chunks(phonetic_many, french_words, workers, chunksize, executor))
+    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(_imap_chunks(phonetic_many, french_words, workers, chunksize, pool))
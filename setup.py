@@ -26,6 +26,8 @@ setup(
     entry_points={
         'console_scripts': [
             'phonetic_fr = phonetic_fr.__main__:main',
+            'phonetic_fr_lexicon = phonetic_fr.lexicon:main',
+            'phonetic_fr_check = phonetic_fr.differential:main',
         ],
     },
     install_requires=requirements,
@@ -0,0 +1,97 @@
+"""Unit tests for the asyncio API"""
+import asyncio
+import multiprocessing
+import unittest
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import WORDS
+from phonetic_fr import (aphonetic_iter, aphonetic_lines, aphonetic_many, aphonetic_text,
+                         phonetic, phonetic_text, use_overrides)
+
+
+async def produce(items, consumed=None):
+    """Async iterable over items, counting the items read"""
+    for item in items:
+        if consumed is not None:
+            consumed.append(item)
+        await asyncio.sleep(0)
+        yield item
+
+
+class TestAio(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for aphonetic_many, aphonetic_iter and aphonetic_lines"""
+    async def test_many(self):
+        """Codes are returned in input order, through the executor for large batches"""
+        expected = [phonetic(word) for word in WORDS]
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+                mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+            self.assertEqual(await aphonetic_many(WORDS, executor, chunksize=7), expected)
+            self.assertEqual(submit.call_count, 29)
+
+    async def test_inline(self):
+        """Small batches and texts are converted without the executor"""
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                mock.patch.object(executor, 'submit') as submit:
+            self.assertEqual(await aphonetic_many(WORDS[:8], executor), [phonetic(word) for
+                                                                         word in WORDS[:8]])
+            self.assertEqual(await aphonetic_text("Le ver vert", executor),
+                             phonetic_text("Le ver vert"))
+            submit.assert_not_called()
+
+    async def test_process_executor(self):
+        """Chunks can be encoded in worker processes"""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            codes = await aphonetic_many(WORDS, executor, chunksize=50)
+            text = ' '.join(WORDS)
+            self.assertEqual(await aphonetic_text(text, executor, inline_threshold=0),
+                             phonetic_text(text))
+        self.assertEqual(codes, [phonetic(word) for word in WORDS])
+
+    async def test_process_overrides(self):
+        """Worker processes started by spawn use the overrides of the event loop's process"""
+        use_overrides({"Renault": "RENO"})
+        self.addCleanup(use_overrides)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            self.assertEqual(await aphonetic_many(["Renault"] * 100, executor, chunksize=50),
+                             ['RENO'] * 100)
+            self.assertEqual(await aphonetic_text("Renault " * 100, executor, inline_threshold=0),
+                             ' '.join(['RENO'] * 100) + ' ')
+
+    async def test_backpressure(self):
+        """The input is read no further than the chunks in flight"""
+        consumed = []
+        codes = aphonetic_iter(produce(WORDS, consumed), chunksize=10, max_in_flight=2,
+                               inline_threshold=0)
+        self.assertEqual(await codes.__anext__(), phonetic(WORDS[0]))
+        self.assertLessEqual(len(consumed), 30)
+        rest = [code async for code in codes]
+        self.assertEqual(rest, [phonetic(word) for word in WORDS[1:]])
+
+    async def test_early_close(self):
+        """Closing a stream cancels the chunks in flight"""
+        codes = aphonetic_iter(produce(WORDS), chunksize=5, inline_threshold=0)
+        async for _ in codes:
+            break
+        await codes.aclose()
+
+    async def test_lines(self):
+        """Lines of sync or async iterables are converted with phonetic_text"""
+        lines = ["Le  ver vert", "", "python rapide "] * 30
+        expected = [phonetic_text(line) for line in lines]
+        self.assertEqual([line async for line in aphonetic_lines(lines, chunksize=8)], expected)
+        self.assertEqual([line async for line in aphonetic_lines(produce(lines))], expected)
+
+    async def test_chunksize(self):
+        """The chunk size must be positive"""
+        with self.assertRaises(ValueError):
+            await aphonetic_many(WORDS, chunksize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Unit tests for the phonetic() cache"""
+import unittest
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import phonetic, cache_info, cache_clear, set_cache_size
+from phonetic_fr.cache import (PhoneticCache, ShardedPhoneticCache, DEFAULT_CACHE_SIZE,
+                               MIN_SHARD_SIZE, new_cache)
+
+
+class TestPhoneticCache(unittest.TestCase):
+    """Unit tests for PhoneticCache"""
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = PhoneticCache(maxsize=2)
+        cache.put('A', '1')
+        cache.put('B', '2')
+        self.assertEqual(cache.get('A'), '1')
+        cache.put('C', '3')
+        self.assertIsNone(cache.get('B'))
+        self.assertEqual(cache.get('C'), '3')
+        self.assertEqual(cache.info(), (2, 1, 1, 2, 2))
+
+    def test_resize(self):
+        """Shrinking the cache evicts entries, 0 disables it"""
+        cache = PhoneticCache(maxsize=3)
+        for key in 'ABC':
+            cache.put(key, key)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('C'), 'C')
+        cache.resize(0)
+        cache.put('D', 'D')
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            cache.resize(-1)
+
+
+class TestShardedPhoneticCache(unittest.TestCase):
+    """Unit tests for ShardedPhoneticCache"""
+    def test_shards(self):
+        """Entries are spread over the shards, statistics are summed"""
+        cache = ShardedPhoneticCache(maxsize=4 * MIN_SHARD_SIZE, shards=4)
+        words = [f"MOT{index}" for index in range(8 * MIN_SHARD_SIZE)]
+        for word in words:
+            cache.put(word, word.lower())
+        self.assertEqual(len(cache), 4 * MIN_SHARD_SIZE)
+        self.assertEqual(cache.get(words[-1]), words[-1].lower())
+        self.assertIsNone(cache.get(words[0]))
+        self.assertEqual(cache.info(), (1, 1, 4 * MIN_SHARD_SIZE, 4 * MIN_SHARD_SIZE,
+                                        4 * MIN_SHARD_SIZE))
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 4 * MIN_SHARD_SIZE, 0))
+
+    def test_small(self):
+        """Small caches use a single shard, an exact LRU"""
+        cache = ShardedPhoneticCache(maxsize=2)
+        cache.put('A', '1')
+        cache.put('B', '2')
+        self.assertEqual(cache.get('A'), '1')
+        cache.put('C', '3')
+        self.assertIsNone(cache.get('B'))
+        self.assertEqual(cache.info(), (1, 1, 1, 2, 2))
+        cache.resize(0)
+        cache.put('D', 'D')
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            cache.resize(-1)
+        with self.assertRaises(ValueError):
+            ShardedPhoneticCache(shards=3)
+
+    def test_new_cache(self):
+        """Caches are sharded only without the GIL"""
+        self.assertIsInstance(new_cache(8), PhoneticCache)
+        with mock.patch('phonetic_fr.cache.gil_enabled', return_value=False):
+            self.assertIsInstance(new_cache(8), ShardedPhoneticCache)
+
+    def test_threads(self):
+        """Concurrent threads share the shards without corrupting them"""
+        cache = ShardedPhoneticCache(maxsize=2 * MIN_SHARD_SIZE)
+        words = [f"MOT{index % 3000}" for index in range(20000)]
+
+        def lookup(word):
+            code = cache.get(word)
+            if code is None:
+                code = word.lower()
+                cache.put(word, code)
+            return code
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            codes = list(executor.map(lookup, words))
+        self.assertEqual(codes, [word.lower() for word in words])
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, len(words))
+        self.assertLessEqual(len(cache), 2 * MIN_SHARD_SIZE)
+
+
+class TestPhoneticMemoization(unittest.TestCase):
+    """Unit tests for the cache in front of phonetic()"""
+    def tearDown(self):
+        set_cache_size(DEFAULT_CACHE_SIZE)
+        cache_clear()
+
+    def test_statistics(self):
+        """Words are cached once normalized"""
+        cache_clear()
+        phonetic("Gilles")
+        phonetic("GILLES")
+        phonetic("gilles,")
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_same_results(self):
+        """Cached, uncached and short words give identical codes"""
+        words = ["Gilles", "python", "a", "os", "ai", "ère", "BCD", "ha", "haie", "O", "eau", ""]
+        set_cache_size(0)
+        expected = [phonetic(word) for word in words]
+        self.assertEqual(cache_info().currsize, 0)
+        set_cache_size(4)
+        for _ in range(3):
+            self.assertEqual([phonetic(word) for word in words], expected)
+        self.assertEqual(cache_info().currsize, 4)
+
+    def test_threads(self):
+        """Concurrent threads share the cache without corrupting it"""
+        set_cache_size(16)
+        cache_clear()
+        words = [f"mot{chr(ord('a') + i % 26)}" for i in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            codes = list(executor.map(phonetic, words))
+        set_cache_size(0)
+        self.assertEqual(codes, [phonetic(word) for word in words])
+        info = cache_info()
+        self.assertEqual(info.hits + info.misses, len(words))
+
+if __name__ == '__main__':
+    unittest.main()
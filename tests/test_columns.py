@@ -0,0 +1,120 @@
+"""Unit tests for encode_column"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import phonetic, encode_column
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+WORDS = ["Gilles", None, "Jill", "python", "Gilles", "", None, "eau"]
+CODES = [None if word is None else phonetic(word) for word in WORDS]
+
+
+class TestEncodeColumn(unittest.TestCase):
+    """Unit tests for encode_column"""
+    def test_iterables(self):
+        """Lists and generators give lists, None giving None"""
+        self.assertEqual(encode_column(WORDS), CODES)
+        self.assertEqual(encode_column(word for word in WORDS), CODES)
+        self.assertEqual(encode_column([]), [])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        """NumPy arrays of objects keep their shape, NaN and None giving None"""
+        words = numpy.array(WORDS, dtype=object).reshape(2, 4)
+        words[0, 1] = float('nan')
+        codes = encode_column(words)
+        self.assertEqual(codes.shape, (2, 4))
+        self.assertEqual(codes.ravel().tolist(), CODES)
+        strings = numpy.array(["Gilles", "Jill"])
+        self.assertEqual(encode_column(strings).tolist(), ["JIL", "JIL"])
+        with self.assertRaises(TypeError):
+            encode_column(numpy.arange(3))
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_pandas(self):
+        """Series keep their index and name, whatever their dtype"""
+        for dtype in (object, 'category', 'string'):
+            series = pandas.Series(WORDS, dtype=dtype, index=range(10, 18), name='name')
+            codes = encode_column(series)
+            self.assertIsInstance(codes, pandas.Series)
+            self.assertEqual(codes.name, 'name')
+            self.assertEqual(codes.index.tolist(), list(range(10, 18)))
+            self.assertEqual([None if pandas.isna(code) else code for code in codes], CODES)
+        self.assertEqual(len(encode_column(pandas.Series([], dtype=object))), 0)
+        # les valeurs manquantes d'une colonne d'objets restent None
+        self.assertEqual(encode_column(pandas.Series(WORDS, dtype=object)).tolist(), CODES)
+
+    @unittest.skipIf(pandas is None or pyarrow is None, "pandas or pyarrow is not installed")
+    def test_pandas_arrow(self):
+        """Series stored in Arrow keep their dtype"""
+        series = pandas.Series(WORDS, dtype='string[pyarrow]')
+        codes = encode_column(series)
+        self.assertEqual(codes.dtype, series.dtype)
+        self.assertEqual([None if pandas.isna(code) else code for code in codes], CODES)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow(self):
+        """Arrays and chunked arrays keep their type, nulls and chunks"""
+        for value_type in (pyarrow.string(), pyarrow.large_string()):
+            array = pyarrow.array(WORDS, type=value_type)
+            codes = encode_column(array)
+            self.assertEqual(codes.type, value_type)
+            self.assertEqual(codes.to_pylist(), CODES)
+
+            chunked = pyarrow.chunked_array([WORDS[:3], WORDS[3:]], type=value_type)
+            codes = encode_column(chunked)
+            self.assertEqual(codes.num_chunks, 2)
+            self.assertEqual(codes.to_pylist(), CODES)
+        self.assertEqual(len(encode_column(pyarrow.chunked_array([], type=pyarrow.string()))), 0)
+        with self.assertRaises(TypeError):
+            encode_column(pyarrow.array([1, 2]))
+
+    @unittest.skipIf(pyarrow is None or not hasattr(pyarrow, 'string_view'),
+                     "pyarrow is not installed or has no string_view")
+    def test_arrow_string_view(self):
+        """string_view columns give string_view codes, or large_string dictionaries"""
+        array = pyarrow.array(WORDS, type=pyarrow.string_view())
+        codes = encode_column(array)
+        self.assertEqual(codes.type, pyarrow.string_view())
+        self.assertEqual(codes.to_pylist(), CODES)
+        chunked = pyarrow.chunked_array([array[:3], array[3:]])
+        self.assertEqual(encode_column(chunked).to_pylist(), CODES)
+        self.assertEqual(encode_column(chunked, dictionary=True).to_pylist(), CODES)
+        dictionary = array.dictionary_encode()
+        self.assertEqual(encode_column(dictionary).to_pylist(), CODES)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow_dictionary(self):
+        """Dictionary encoded inputs and outputs share the indices of the input"""
+        array = pyarrow.array(WORDS).dictionary_encode()
+        codes = encode_column(array, dictionary=True)
+        self.assertTrue(pyarrow.types.is_dictionary(codes.type))
+        self.assertEqual(codes.indices, array.indices)
+        self.assertEqual(codes.to_pylist(), CODES)
+        self.assertEqual(encode_column(array).to_pylist(), CODES)
+
+        chunked = pyarrow.chunked_array([WORDS[:3], WORDS[3:]])
+        codes = encode_column(chunked, dictionary=True)
+        self.assertTrue(pyarrow.types.is_dictionary(codes.type))
+        self.assertEqual(codes.to_pylist(), CODES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Unit tests for the selection of engines and the differential checker"""
+import unittest
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import (phonetic, check_engine, engines, get_engine, register_engine,
+                         set_engine)
+from phonetic_fr.differential import FAMILIES, generated_words, main
+from phonetic_fr.phonetic_fr import _ENGINES
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def broken_engine(french_word):
+    """An engine keeping the final S, unlike the rules"""
+    code = _ENGINES['compiled'](french_word)
+    return code + 'S' if french_word.endswith('S') else code
+
+
+class TestEngineSelection(unittest.TestCase):
+    """Unit tests for set_engine() and register_engine()"""
+    def tearDown(self):
+        set_engine('compiled')
+        _ENGINES.pop('broken', None)
+
+    def test_set_engine(self):
+        """The selected engine encodes the words, cached codes are dropped"""
+        self.assertEqual(get_engine(), 'compiled')
+        self.assertEqual(engines()[:2], ('compiled', 'reference'))
+        self.assertEqual(phonetic("Gilles"), 'JIL')
+        register_engine('broken', broken_engine)
+        set_engine('broken')
+        self.assertEqual(get_engine(), 'broken')
+        self.assertEqual(phonetic("Gilles"), 'JILS')
+        set_engine('reference')
+        self.assertEqual(phonetic("Gilles"), 'JIL')
+
+    def test_normalized_once(self):
+        """The reference engine gets words normalized once, like the compiled one"""
+        # lettres dont la majuscule ou la décomposition garde un accent combinant
+        words = ["laǰer", "ǰa", "ﬁn", "ŉa", "ẗa", "ΐa"]
+        compiled = [phonetic(word) for word in words]
+        self.assertEqual(compiled[0], 'LAJ\u030cE')
+        set_engine('reference')
+        self.assertEqual([phonetic(word) for word in words], compiled)
+        self.assertEqual(check_engine(words).mismatches, [])
+
+    def test_errors(self):
+        """Unknown engines and replacing the reference raise errors"""
+        with self.assertRaises(ValueError):
+            set_engine('nope')
+        with self.assertRaises(ValueError):
+            register_engine('reference', broken_engine)
+        with self.assertRaises(TypeError):
+            register_engine('broken', 'JIL')
+
+    def test_environment(self):
+        """PHONETIC_FR_ENGINE selects the engine at import"""
+        output = subprocess.run(
+            [sys.executable, '-c', 'import phonetic_fr; print(phonetic_fr.get_engine())'],
+            cwd=ROOT, env=dict(os.environ, PHONETIC_FR_ENGINE='reference'),
+            capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'reference')
+
+
+class TestDifferential(unittest.TestCase):
+    """Unit tests for the differential checker"""
+    def tearDown(self):
+        _ENGINES.pop('broken', None)
+
+    def test_generated_words(self):
+        """Generated words are reproducible and cover every family"""
+        words = list(generated_words(600, seed=3))
+        self.assertEqual(words, list(generated_words(600, seed=3)))
+        self.assertTrue(any('œ' in word.lower() or 'æ' in word.lower() for word in words))
+        self.assertTrue(any(len(word) == 1 for word in words))
+        self.assertEqual(len(FAMILIES), 6)
+
+    def test_compiled_engine(self):
+        """The compiled engine gives the codes of the reference engine"""
+        result = check_engine(generated_words(3000))
+        self.assertEqual(result.mismatches, [])
+        self.assertGreater(result.words, 2000)
+        self.assertGreater(result.ratio, 0)
+
+    def test_mismatches(self):
+        """Every mismatch is reported, and the command exits with status 1"""
+        register_engine('broken', broken_engine)
+        result = check_engine(["Gilles", "gilles", "Jill", "Jules"], 'broken')
+        self.assertEqual(result.words, 3)
+        self.assertEqual(result.mismatches, [('GILLES', 'JIL', 'JILS'), ('JULES', 'JUL', 'JULS')])
+        stdout = io.StringIO()
+        with mock.patch('sys.stdout', stdout), self.assertRaises(SystemExit) as context:
+            main(['--engine', 'broken', '--words', '60'])
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn('[expecting', stdout.getvalue())
+
+    def test_command(self):
+        """The command checks corpus files and rejects unknown engines"""
+        stdout = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = os.path.join(directory, 'corpus.txt')
+            with open(corpus, 'w', encoding='utf-8') as file:
+                file.write("Œdipe cœur\nbrrr a ÿ\n")
+            with mock.patch('sys.stdout', stdout):
+                main(['--words', '0', corpus])
+        self.assertIn('5/5 distinct words', stdout.getvalue())
+        self.assertIn('speed ratio', stdout.getvalue())
+        with mock.patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit) as context:
+            main(['--engine', 'nope', '--words', '1'])
+        self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Unit tests for PhoneticDocument"""
+import unittest
+import os
+import random
+import sys
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import PhoneticDocument, phonetic_text, phonetic_text_iter
+from phonetic_fr.document import _Blocks
+
+ALPHABET = "abcdeéILRST  \n\t-!"
+
+
+def random_text(rnd, length):
+    """Returns a random text of words and whitespace"""
+    return ''.join(rnd.choice(ALPHABET) for _ in range(length))
+
+
+class TestPhoneticDocument(unittest.TestCase):
+    """Unit tests for PhoneticDocument"""
+    def test_example(self):
+        """An edit returns the matching edit of the phonetic text"""
+        document = PhoneticDocument("Le ver vert")
+        self.assertEqual(document.edit(3, 6, "python"), (2, 5, 'PITON'))
+        self.assertEqual(document.text, "Le python vert")
+        self.assertEqual(document.phonetic, "L PITON VER")
+        start, end, code = document.edit(0, 0, "")
+        self.assertEqual((end - start, code), (0, ''))
+
+    def test_random_edits(self):
+        """Random edits keep the text, the phonetic text and its patched copy in sync"""
+        rnd = random.Random(0)
+        for segment_size in (8, 256):
+            with mock.patch('phonetic_fr.document.SEGMENT_SIZE', segment_size):
+                for _ in range(50):
+                    text = random_text(rnd, rnd.randint(0, 200))
+                    document = PhoneticDocument(text)
+                    copy = document.phonetic
+                    for _ in range(20):
+                        start = rnd.randint(0, len(text))
+                        end = rnd.randint(start, min(len(text), start + rnd.choice([0, 1, 40])))
+                        replacement = random_text(rnd, rnd.choice([0, 1, 3, 40]))
+                        code_start, code_end, code = document.edit(start, end, replacement)
+                        text = text[:start] + replacement + text[end:]
+                        copy = copy[:code_start] + code + copy[code_end:]
+                        self.assertEqual(document.text, text)
+                        self.assertEqual(len(document), len(text))
+                        self.assertEqual(document.phonetic, phonetic_text(text))
+                        self.assertEqual(copy, document.phonetic)
+                    self.assertEqual(list(document.words()), list(phonetic_text_iter(text)))
+
+    def test_splits_and_merges(self):
+        """Edits splitting and merging segments update their blocks without regrouping them all"""
+        rnd = random.Random(2)
+        regroup = _Blocks._regroup
+        with mock.patch('phonetic_fr.document.SEGMENT_SIZE', 8), \
+                mock.patch('phonetic_fr.document.BLOCK_SIZE', 4), \
+                mock.patch.object(_Blocks, '_regroup', autospec=True,
+                                  side_effect=regroup) as regroups:
+            text = random_text(rnd, 2000)
+            document = PhoneticDocument(text)
+            for _ in range(200):
+                start = rnd.randint(0, len(text))
+                end = rnd.randint(start, min(len(text), start + rnd.choice([0, 5, 60])))
+                replacement = random_text(rnd, rnd.choice([0, 2, 60]))
+                document.edit(start, end, replacement)
+                text = text[:start] + replacement + text[end:]
+                self.assertEqual(document.text, text)
+                self.assertEqual(document.phonetic, phonetic_text(text))
+                for offset in range(0, len(text), 97):
+                    if text[offset].isspace():
+                        self.assertEqual(document.to_phonetic(offset),
+                                         len(phonetic_text(text[:offset])))
+        # une fois à la création, puis seulement quand un bloc a doublé
+        self.assertLess(regroups.call_count, 10)
+
+    def test_offsets(self):
+        """Words map to their codes and back, whitespace maps one to one"""
+        rnd = random.Random(1)
+        with mock.patch('phonetic_fr.document.SEGMENT_SIZE', 8):
+            document = PhoneticDocument(random_text(rnd, 300))
+            document.edit(10, 20, random_text(rnd, 30))
+        code = document.phonetic
+        for start, end, _, word_code in document.words():
+            position = document.to_phonetic(start)
+            self.assertEqual(code[position:position + len(word_code)], word_code)
+            self.assertEqual(document.to_phonetic(end - 1), position)
+            self.assertEqual(document.to_phonetic(end), position + len(word_code))
+            if word_code:
+                self.assertEqual(document.to_original(position), start)
+                self.assertEqual(document.to_original(position + len(word_code)), end)
+        self.assertEqual(document.to_phonetic(len(document)), len(code))
+        self.assertEqual(document.to_original(len(code)), len(document))
+
+    def test_empty(self):
+        """Empty documents can be filled and emptied again"""
+        document = PhoneticDocument()
+        self.assertEqual((document.text, document.phonetic, len(document)), ('', '', 0))
+        self.assertEqual(document.to_phonetic(0), 0)
+        self.assertEqual(document.edit(0, 0, "Gilles  Jill"), (0, 0, 'JIL  JIL'))
+        self.assertEqual(document.edit(0, 12, ""), (0, 8, ''))
+        self.assertEqual(document.text, '')
+
+    def test_errors(self):
+        """Ranges and offsets outside of the document raise ValueError"""
+        document = PhoneticDocument("Le ver")
+        for start, end in ((-1, 2), (3, 2), (0, 7)):
+            with self.assertRaises(ValueError):
+                document.edit(start, end, "")
+        with self.assertRaises(ValueError):
+            document.to_phonetic(7)
+        with self.assertRaises(ValueError):
+            document.to_original(6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""Equivalence tests of the compiled rule engine against the reference implementation"""
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+import re
+import unicodedata
+import test_pyphonetic_fr
+from words import ALPHABET, generated_words
+from phonetic_fr import phonetic
+from phonetic_fr.phonetic_fr import (_compile_rule, _compile_rules, _end_chars, _literal_table,
+                                     _normalize, _required_literal, _trie_pattern)
+from phonetic_fr.reference import phonetic as reference_phonetic
+from phonetic_fr.rules import (PREPROCESS_RULES, REPETITION_RULES, OING_RULES, INFINITIVE_RULES,
+                               MAIN_RULES, TERMINATION_RULES)
+
+
+class TestEngine(unittest.TestCase):
+    """Compares phonetic() with the frozen reference implementation"""
+    def test_test_case_words(self):
+        """Every tenth test case word gives the reference result"""
+        test_cases = test_pyphonetic_fr.TestPhonetique.read_test_cases('tests/test_cases.txt')
+        words = list(test_cases)[::10]
+        for word in words:
+            self.assertEqual(phonetic(word), reference_phonetic(word), word)
+
+    def test_generated_words(self):
+        """Random words give the reference result"""
+        for word in generated_words(5000):
+            self.assertEqual(phonetic(word), reference_phonetic(word), word)
+
+
+class TestNormalization(unittest.TestCase):
+    """Unit tests for the normalization of words before the rules"""
+    def test_normalize(self):
+        """Only letters are kept, in upper case, whatever the script"""
+        rnd = random.Random(1)
+        alphabet = ALPHABET + "azAZ09_!?.,;:\t ßﬁĳŉΣσςЖж中Ａｚ²¼\u0301\u0327"
+        for _ in range(5000):
+            word = ''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 12)))
+            expected = ''.join(filter(str.isalpha, unicodedata.normalize('NFC', word))).upper()
+            self.assertEqual(_normalize(word), expected, word)
+
+    def test_decomposed(self):
+        """Decomposed (NFD) words give the codes of their composed form"""
+        for word in generated_words(2000):
+            self.assertEqual(phonetic(unicodedata.normalize('NFD', word)), phonetic(word), word)
+        self.assertEqual(phonetic(unicodedata.normalize('NFD', "éther")), phonetic("éther"))
+
+    def test_other_letters(self):
+        """Letters outside the accent tables fold into their base letters"""
+        for word, folded in (("Dvořák", "Dvorak"), ("Ĳsselmeer", "IJsselmeer"),
+                             ("Ｇｉｌｌｅｓ", "Gilles"), ("Šťastný", "Stastny")):
+            self.assertEqual(phonetic(word), phonetic(folded), word)
+            self.assertEqual(phonetic(word), reference_phonetic(word), word)
+
+
+class TestPrefilter(unittest.TestCase):
+    """Unit tests for the strings required by the rules"""
+    def test_required_literal(self):
+        """The longest literal run of a pattern is required"""
+        for pattern, required in [('ORCHID', 'ORCHID'), ('CC([IYE])', 'CC'), ('(C|CH)OEU', 'OEU'),
+                                  ('^GEN[TS]$', 'GEN'), ('GNO([MLTNRKG])', 'GNO'),
+                                  ('O[O]+', 'O'), (r'(.)\1', ''), ('X$|[TD]S$|[DS]$', ''),
+                                  ('[^Q]U', 'U'), ('A(B)?C', 'A')]:
+            self.assertEqual(_required_literal(pattern), required, pattern)
+
+    def test_rules_match_only_with_required(self):
+        """No rule matches a word lacking its required string"""
+        words = [word.upper() for word in generated_words(20000, seed=1)]
+        for rules in (PREPROCESS_RULES, REPETITION_RULES, OING_RULES, INFINITIVE_RULES,
+                      MAIN_RULES, TERMINATION_RULES):
+            for rule in rules:
+                if rule.literal:
+                    continue
+                required = _required_literal(rule.pattern)
+                search = re.compile(rule.pattern).search
+                for word in words:
+                    if search(word):
+                        self.assertIn(required, word, rule.pattern)
+
+
+def apply_steps(steps, word):
+    """Applies (required, step) pairs like the engine does"""
+    for required, step in steps:
+        if required in word:
+            word = step(word)
+    return word
+
+
+class TestSuffixDispatch(unittest.TestCase):
+    """Unit tests for the grouping of the rules anchored at the end of words"""
+    def test_end_chars(self):
+        """The last characters of the matches are derived from the patterns"""
+        for pattern, chars in [('TIL$', 'L'), ('L[E]?[S]?$', 'ELS'), ('R[DG]$', 'DG'),
+                               ('X$|[TD]S$|[DS]$', 'DSX'), ('([ABD-MO-Z]+)[EH]+$', 'EH'),
+                               ('(CHA|CA|E)M(P|PS)$', 'PS'), ('^GEN[TS]$', 'ST')]:
+            self.assertEqual(_end_chars(pattern), set(chars), pattern)
+        for pattern in ['^PAIEM', r'(.)\1', 'E?$', '[^R]$', 'A.$', 'A$|B']:
+            self.assertIsNone(_end_chars(pattern), pattern)
+
+    def test_sections_match_sequential_rules(self):
+        """Grouped sections give the words of the rules applied one after the other"""
+        rnd = random.Random(2)
+        words = [''.join(rnd.choice("AEIOUNTSLRCGHDPMKZXF") for _ in range(rnd.randint(0, 9)))
+                 for _ in range(20000)]
+        words += [word.upper() for word in generated_words(5000, seed=3)]
+        for rules in (MAIN_RULES, TERMINATION_RULES):
+            grouped = _compile_rules(rules)
+            self.assertLess(len(grouped), len(rules))
+            sequential = [_compile_rule(rule) for rule in rules]
+            for word in words:
+                self.assertEqual(apply_steps(grouped, word), apply_steps(sequential, word), word)
+
+
+def literal_runs(rules):
+    """Returns the runs of consecutive literal rules of a section"""
+    runs = [[]]
+    for rule in rules:
+        if rule.literal:
+            runs[-1].append(rule)
+        elif runs[-1]:
+            runs.append([])
+    return [run for run in runs if len(run) > 1]
+
+
+class TestLiteralTables(unittest.TestCase):
+    """Equivalence of fused literal tables with successive str.replace calls"""
+    def test_trie_pattern(self):
+        """The longest string starting at each position is found"""
+        trie = _trie_pattern(['GNE', 'GNES', 'GI', 'Q', 'QU'])
+        findall = re.compile('(?=(' + trie + '))').findall
+        self.assertEqual(findall('GNESQUIQ'), ['GNES', 'QU', 'Q'])
+
+    def test_tables_match_sequential_replace(self):
+        """Words made of the strings of a table give the result of str.replace in order"""
+        rnd = random.Random(4)
+        for rules in (REPETITION_RULES, MAIN_RULES, TERMINATION_RULES):
+            for run in literal_runs(rules):
+                table = _literal_table(run)
+                # les remplacements recréent parfois des chaînes de la table
+                pieces = [rule.pattern for rule in run] + [rule.replacement for rule in run]
+                for _ in range(20000):
+                    word = ''.join(rnd.choice(pieces) if rnd.random() < 0.5 else
+                                   rnd.choice("AEIOUNTSLRCGH") for _ in range(rnd.randint(0, 6)))
+                    expected = word
+                    for rule in run:
+                        expected = expected.replace(rule.pattern, rule.replacement)
+                    self.assertEqual(table(word), expected, word)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for the approximate matching of phonetic codes"""
+import unittest
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import generated_words
+from phonetic_fr import (PhoneticMatcher, PhoneticTrie, best_matches, distance_matrix,
+                         levenshtein, phonetic)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def random_codes(count, seed=0):
+    """Generates random codes over a small alphabet so that many are close"""
+    rnd = random.Random(seed)
+    return [''.join(rnd.choice("AKLNORS") for _ in range(rnd.randint(0, 6)))
+            for _ in range(count)]
+
+
+class TestLevenshtein(unittest.TestCase):
+    """Unit tests for levenshtein"""
+    def test_distance(self):
+        """Known distances, bounded or not"""
+        self.assertEqual(levenshtein("drapeau", "crapaud"), 3)
+        self.assertEqual(levenshtein(phonetic("drapeau"), phonetic("crapaud")), 1)
+        self.assertEqual(levenshtein("", "ABC"), 3)
+        self.assertEqual(levenshtein("KITTEN", "SITTING"), 3)
+        self.assertEqual(levenshtein("KITTEN", "SITTING", max_distance=1), 2)
+        self.assertEqual(levenshtein("A", "ABCDE", max_distance=2), 3)
+        self.assertEqual(levenshtein("ABC", "ABC", max_distance=0), 0)
+        # la dernière ligne peut dépasser la borne sans que son minimum ne le fasse
+        self.assertEqual(levenshtein("BCAABC", "CABCCB"), 4)
+        self.assertEqual(levenshtein("BCAABC", "CABCCB", max_distance=2), 3)
+
+
+class TestPhoneticTrie(unittest.TestCase):
+    """Unit tests for PhoneticTrie"""
+    def test_search_matches_scan(self):
+        """Searching gives the same codes as a full scan"""
+        codes = set(random_codes(500))
+        trie = PhoneticTrie(codes)
+        self.assertEqual(len(trie), len(codes))
+        for query in random_codes(50, seed=1):
+            for max_distance in (0, 1, 2):
+                expected = sorted((code, levenshtein(query, code)) for code in codes
+                                  if levenshtein(query, code) <= max_distance)
+                expected.sort(key=lambda result: result[1])
+                self.assertEqual(trie.search(query, max_distance), expected)
+
+    def test_add_remove(self):
+        """Codes can be added and removed, including the empty code"""
+        trie = PhoneticTrie()
+        self.assertTrue(trie.add("DRAPO"))
+        self.assertFalse(trie.add("DRAPO"))
+        trie.add("DRAP")
+        trie.add("")
+        self.assertEqual(trie.neighbors("crapaud"), [("DRAPO", 1)])
+        self.assertEqual(trie.search("A", 1), [("", 1)])
+        trie.remove("DRAPO")
+        self.assertNotIn("DRAPO", trie)
+        self.assertIn("DRAP", trie)
+        trie.remove("DRAP")
+        trie.remove("")
+        self.assertEqual(len(trie), 0)
+        with self.assertRaises(KeyError):
+            trie.remove("DRAPO")
+
+
+def scan_matches(query, candidates, max_distance):
+    """Returns the (index, candidate, distance) of the matching candidates by comparing them all"""
+    code = phonetic(query)
+    matches = [(index, candidate, levenshtein(code, phonetic(candidate)))
+               for index, candidate in enumerate(candidates) if code and phonetic(candidate)]
+    return sorted((match for match in matches if match[2] <= max_distance),
+                  key=lambda match: (match[2], match[0]))
+
+
+class TestPhoneticMatcher(unittest.TestCase):
+    """Unit tests for PhoneticMatcher, best_matches and distance_matrix"""
+    def setUp(self):
+        self.candidates = list(generated_words(400, seed=2))
+        self.queries = list(generated_words(40, seed=3)) + ["", "Gilles"]
+
+    def check(self, vectorized):
+        """Matches and distances of a matcher are those of a full scan"""
+        matcher = PhoneticMatcher(self.candidates, vectorized=vectorized)
+        self.assertEqual(len(matcher), len(self.candidates))
+        for max_distance in (0, 1, 2):
+            rows = matcher.distance_matrix(self.queries, max_distance)
+            for query, row in zip(self.queries, rows):
+                expected = scan_matches(query, self.candidates, max_distance)
+                self.assertEqual(matcher.best_matches(query, None, max_distance), expected)
+                self.assertEqual(matcher.best_matches(query, 3, max_distance), expected[:3])
+                distances = [max_distance + 1] * len(self.candidates)
+                for index, _, distance in expected:
+                    distances[index] = distance
+                self.assertEqual(list(row), distances)
+
+    def test_trie(self):
+        """Without NumPy, codes are searched in a trie"""
+        self.check(vectorized=False)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_vectorized(self):
+        """With NumPy, codes of each length are compared at once"""
+        self.check(vectorized=True)
+        self.assertEqual(distance_matrix(["drapeau"], ["crapaud", "123"]).shape, (1, 2))
+        # des bornes au-delà des entiers de 16 bits
+        matcher = PhoneticMatcher(["bo", "123"])
+        self.assertEqual(matcher.best_matches("ba", max_distance=40000), [(0, "bo", 1)])
+        self.assertEqual(matcher.distance_matrix(["ba"], 40000).tolist(), [[1, 40001]])
+
+    def test_functions(self):
+        """Candidates can be given as words or as a matcher reused by every query"""
+        candidates = ["Gilles", "Julie", "Paul", "Jill"]
+        self.assertEqual(best_matches("Jill", candidates, k=2),
+                         [(0, "Gilles", 0), (3, "Jill", 0)])
+        matcher = PhoneticMatcher(candidates, vectorized=False)
+        self.assertEqual(best_matches("Jules", matcher, k=2, max_distance=1),
+                         [(0, "Gilles", 1), (1, "Julie", 1)])
+        self.assertEqual(distance_matrix(["Paul", "123"], matcher, max_distance=1),
+                         [[2, 2, 0, 2], [2, 2, 2, 2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
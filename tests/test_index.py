@@ -0,0 +1,51 @@
+"""Unit tests for PhoneticIndex"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import PhoneticIndex, phonetic
+
+NAMES = [(1, "Gilles"), (2, "Jill"), (3, "Python"), ("a", "Gille"), (-4, "drapeau"),
+         (True, "piton"), (2 ** 70, "Jil")]
+
+
+class TestPhoneticIndex(unittest.TestCase):
+    """Unit tests for PhoneticIndex"""
+    def test_lookup(self):
+        """Keys of every type are found back under their code"""
+        index = PhoneticIndex(NAMES)
+        self.assertEqual(len(index), len(NAMES))
+        self.assertEqual(index.lookup("gile"), [1, 2, "a", 2 ** 70])
+        self.assertEqual(index.lookup("pitonne"), [3, True])
+        self.assertIs(index.lookup("piton")[1], True)
+        self.assertEqual(index.lookup_code(phonetic("drapo")), [-4])
+        self.assertEqual(index.lookup("inconnu"), [])
+        self.assertIn("Jile", index)
+        self.assertEqual(dict(index.items())["DRAPO"], [-4])
+        index.remove(1, "Gilles")
+        self.assertEqual(index.lookup("pitonne"), [3, True])
+
+    def test_add_remove(self):
+        """Incremental updates keep posting lists and interned keys consistent"""
+        index = PhoneticIndex()
+        index.add("x", "Gilles")
+        index.add("x", "Jill")
+        index.add(7, "Jill")
+        self.assertEqual(index.lookup("Gilles"), ["x", 7])
+        index.remove("x", "Gilles")
+        self.assertEqual(index.lookup("Gilles"), ["x", 7])
+        index.remove("x", "Jill")
+        index.remove(7, "Jill")
+        self.assertEqual(index.lookup("Gilles"), [])
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index.codes()), [])
+        for key, word in (("x", "Jill"), (7, "Gilles"), (None, "drapeau")):
+            with self.assertRaises(KeyError):
+                index.remove(key, word)
+        index.add("y", "drapeau")
+        self.assertEqual(index.lookup("drapeaux"), ["y"])
+
+if __name__ == '__main__':
+    unittest.main()
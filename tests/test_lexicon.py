@@ -0,0 +1,130 @@
+"""Unit tests for the precomputed lexicon"""
+import unittest
+import io
+import os
+import struct
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import (Lexicon, StaleIndexError, build_lexicon, cache_info, phonetic,
+                         set_lexicon, use_lexicon)
+from phonetic_fr import lexicon as lexicon_module
+
+WORDS = ["Gilles", "Jill", "Python", "piton", "drapeau", "crapaud", "Élodie", "Gilles", "l'été"]
+
+
+class TestLexicon(unittest.TestCase):
+    """Unit tests for build_lexicon and Lexicon"""
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'words.lex')
+        self.addCleanup(set_lexicon, None)
+
+    def test_lookup(self):
+        """Normalized words are found with the code of the rules, others are not"""
+        self.assertEqual(build_lexicon(WORDS, self.path), len(WORDS) - 1)
+        with Lexicon(self.path) as lexicon:
+            self.assertEqual(len(lexicon), len(WORDS) - 1)
+            for word in WORDS:
+                normalized = ''.join(filter(str.isalpha, word)).upper()
+                self.assertEqual(lexicon.get(normalized), phonetic(word))
+                self.assertIn(normalized, lexicon)
+            self.assertIsNone(lexicon.get("INCONNU"))
+            self.assertIsNone(lexicon.get("Gilles"))
+            self.assertEqual([word for word, _ in lexicon.items()],
+                             sorted({''.join(filter(str.isalpha, w)).upper() for w in WORDS}))
+            self.assertEqual(lexicon.verify(), [])
+
+    def test_many_words(self):
+        """Lookups stay exact when many words collide in the slot table"""
+        words = [f"mot{'a' * (index % 7)}{chr(0x61 + index % 26)}{chr(0x61 + index // 26 % 26)}"
+                 for index in range(3000)]
+        count = build_lexicon(words, self.path)
+        with Lexicon(self.path) as lexicon:
+            self.assertEqual(len(lexicon), count)
+            for word in words:
+                self.assertEqual(lexicon.get(word.upper()), phonetic(word))
+
+    def test_empty(self):
+        """An empty lexicon finds nothing"""
+        self.assertEqual(build_lexicon([], self.path), 0)
+        with Lexicon(self.path) as lexicon:
+            self.assertEqual(len(lexicon), 0)
+            self.assertIsNone(lexicon.get("GILLES"))
+
+    def test_phonetic_uses_lexicon(self):
+        """Hits come from the lexicon, misses fall back to the rules"""
+        build_lexicon(["Gilles"], self.path)
+        with Lexicon(self.path) as lexicon:
+            fake = mock.Mock(wraps=lexicon)
+            fake.get.side_effect = {"GILLES": "XYZ"}.get
+            set_lexicon(fake)
+            self.assertEqual(cache_info().currsize, 0)
+            self.assertEqual(phonetic("Gilles"), "XYZ")
+            self.assertEqual(phonetic("python"), "PITON")
+            set_lexicon(None)
+            self.assertEqual(phonetic("Gilles"), "JIL")
+
+    def test_use_lexicon(self):
+        """use_lexicon loads a file and None unloads it"""
+        build_lexicon(WORDS, self.path)
+        use_lexicon(self.path)
+        self.assertEqual(phonetic("drapeau"), "DRAPO")
+        use_lexicon(None)
+        self.assertEqual(phonetic("drapeau"), "DRAPO")
+
+    def test_stale(self):
+        """A lexicon built with other rules is refused unless asked otherwise"""
+        build_lexicon(WORDS, self.path)
+        with mock.patch.object(lexicon_module, '_RULES_FINGERPRINT', '0' * 64):
+            with self.assertRaises(StaleIndexError):
+                Lexicon(self.path)
+            Lexicon(self.path, check_rules=False).close()
+
+    def test_truncated(self):
+        """Files cut anywhere are refused when opened"""
+        build_lexicon(WORDS, self.path)
+        size = os.path.getsize(self.path)
+        for length in (size - 1, size - 4 * 16, size // 2, 200, 100):
+            os.truncate(self.path, length)
+            with self.assertRaises(ValueError, msg=length):
+                Lexicon(self.path)
+
+    def test_not_a_lexicon(self):
+        """Other files are refused"""
+        with open(self.path, 'wb') as file:
+            file.write(b'PHFRIDX1' + bytes(200))
+        with self.assertRaises(ValueError):
+            Lexicon(self.path)
+
+    def test_verify_command(self):
+        """The verify command reports codes which differ from the rules"""
+        words_path = os.path.join(os.path.dirname(self.path), 'words.txt')
+        with open(words_path, 'w', encoding='utf-8') as file:
+            file.write("Gilles Jill\npython\n")
+        with redirect_stdout(io.StringIO()):
+            lexicon_module.main(['build', words_path, self.path])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            lexicon_module.main(['verify', self.path])
+        self.assertIn("3/3 words match", output.getvalue())
+
+        with open(self.path, 'r+b') as file:
+            data = file.read()
+            file.seek(data.rindex(b'PITON'))
+            file.write(b'PITAN')
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(SystemExit) as context:
+            lexicon_module.main(['verify', self.path])
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("PYTHON: PITAN [expecting PITON]", output.getvalue())
+        self.assertEqual(struct.unpack_from('<8s', data)[0], lexicon_module.MAGIC)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Unit tests for the dedupe and link subcommands of the command line tool"""
+import unittest
+import csv
+import io
+import os
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr.__main__ import main
+
+NAMES = 'id,name\n1,Gilles\n2,Jill\n3,Martin\n4,"Dupont, Jean"\n5,Gilles\n6,Martine\n7,123\n' \
+        '8,Dupond Jean\n'
+OTHERS = 'name\tx\nJil\t1\nMartain\t2\nBob\t3\n'
+
+
+def run(argv, stdin=''):
+    """Runs the command line tool and returns its output, parsed as CSV or TSV"""
+    stdout = io.StringIO()
+    with mock.patch('sys.stdin', io.StringIO(stdin)), mock.patch('sys.stdout', stdout), \
+            mock.patch('sys.stderr', io.StringIO()):
+        main(argv)
+    delimiter = '\t' if '\t' in stdout.getvalue().split('\n', 1)[0] else ','
+    return list(csv.reader(io.StringIO(stdout.getvalue()), delimiter=delimiter))
+
+
+class TestLinkage(unittest.TestCase):
+    """Unit tests for the dedupe and link subcommands"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.names = self.write('names.csv', NAMES)
+        self.others = self.write('others.tsv', OTHERS)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        """Writes a file of the temporary directory, returns its path"""
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(content)
+        return path
+
+    def test_dedupe_pairs(self):
+        """Every pair of rows sharing a code is written once, rows without code are left out"""
+        rows = run(['dedupe', self.names, '--column', 'name'])
+        self.assertEqual(rows[0], ['code', 'file1', 'row1', 'value1', 'file2', 'row2', 'value2'])
+        self.assertEqual([(row[0], row[2], row[5]) for row in rows[1:]],
+                         [('DUPON JAN', '4', '8'), ('JIL', '1', '2'), ('JIL', '1', '5'),
+                          ('JIL', '2', '5'), ('MARTIN', '3', '6')])
+        self.assertEqual(rows[1][3], 'Dupont, Jean')
+
+    def test_dedupe_clusters(self):
+        """Clusters list the rows sharing a code, stdin and column numbers are accepted"""
+        rows = run(['dedupe', '-', '-c', '2', '--format', 'clusters'], NAMES)
+        self.assertEqual(rows[0], ['cluster', 'code', 'file', 'row', 'value'])
+        self.assertEqual([(row[0], row[3]) for row in rows[1:]],
+                         [('1', '4'), ('1', '8'), ('2', '1'), ('2', '2'), ('2', '5'),
+                          ('3', '3'), ('3', '6')])
+
+    def test_link(self):
+        """Pairs and clusters only join rows of the left file with rows of the right one"""
+        rows = run(['link', self.others, self.names, '-c', 'name'])
+        self.assertEqual([(row[2], row[5]) for row in rows[1:]],
+                         [('1', '1'), ('1', '2'), ('1', '5'), ('2', '3'), ('2', '6')])
+        self.assertEqual(rows[1][1], self.others)
+        rows = run(['link', self.others, self.names, '-c', 'name', '-f', 'clusters'])
+        self.assertEqual(len(rows), 1 + 4 + 3)
+
+    def test_external_sort(self):
+        """Runs spilled to disk give the same output as a single run in memory"""
+        content = 'name\n' + '\n'.join(NAMES.splitlines()[1:] * 20) + '\n'
+        names = self.write('many.csv', content)
+        expected = run(['dedupe', names, '-c', 'name', '-f', 'clusters'])
+        for buffer_size in ('1', '7', '40'):
+            self.assertEqual(run(['dedupe', names, '-c', '1', '-f', 'clusters',
+                                  '--buffer-size', buffer_size, '--no-header', '-d', ',']),
+                             expected[:1] + [row[:3] + [str(int(row[3]) + 1)] + row[4:]
+                                             for row in expected[1:]])
+
+    def test_max_block(self):
+        """Blocks above --max-block are skipped"""
+        rows = run(['dedupe', self.names, '-c', 'name', '--max-block', '2'])
+        self.assertEqual([row[0] for row in rows[1:]], ['DUPON JAN', 'MARTIN'])
+
+    def test_jobs(self):
+        """Several processes give the same output"""
+        self.assertEqual(run(['dedupe', self.names, '-c', 'name', '--jobs', '2']),
+                         run(['dedupe', self.names, '-c', 'name']))
+
+    def test_errors(self):
+        """Unknown columns and invalid options exit with an error"""
+        for argv in (['dedupe', self.names, '-c', 'nope'], ['link', self.names, '-c', 'name'],
+                     ['dedupe', self.names, '-c', 'name', '--buffer-size', '0']):
+            with self.assertRaises(SystemExit) as context:
+                run(argv)
+            self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for the command line tool"""
+import unittest
+import io
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr.__main__ import main
+
+LINES = "Le ver vert glisse vers le verre\n  Gilles\tJill \n\nDrapeau\n"
+
+
+def run(argv, stdin=''):
+    """Runs the command line tool and returns its output"""
+    stdout = io.StringIO()
+    with mock.patch('sys.stdin', io.StringIO(stdin)), mock.patch('sys.stdout', stdout):
+        main(argv)
+    return stdout.getvalue()
+
+
+class TestMain(unittest.TestCase):
+    """Unit tests for the command line tool"""
+    def test_stdin(self):
+        """Lines are converted one by one, whitespace is preserved"""
+        self.assertEqual(run([], LINES),
+                         "L VER VER GLIS VER L VER\n  JIL\tJIL \n\nDRAPO\n")
+
+    def test_files_and_formats(self):
+        """Files are read in order and every output format is supported"""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write("Gilles\r\nDrapeau")
+            self.assertEqual(run(['-f', 'tsv', filename, '-'], "Jill\n"),
+                             "Gilles\tJIL\nDrapeau\tDRAPO\nJill\tJIL\n")
+            output = run(['--format', 'jsonl', filename])
+            records = [json.loads(line) for line in output.splitlines()]
+            self.assertEqual(records, [{'input': 'Gilles', 'phonetic': 'JIL'},
+                                       {'input': 'Drapeau', 'phonetic': 'DRAPO'}])
+
+    def test_jobs(self):
+        """Several processes give the same output in the same order"""
+        self.assertEqual(run(['--jobs', '2'], LINES * 50), run([], LINES * 50))
+
+    def test_no_input(self):
+        """An empty stdin is an error"""
+        with mock.patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit):
+            run([], '')
+
+if __name__ == '__main__':
+    unittest.main()
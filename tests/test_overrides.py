@@ -0,0 +1,123 @@
+"""Unit tests for the override codes of domain words"""
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import (PhoneticIndex, StaleIndexError, build_lexicon, build_overrides,
+                         open_index, phonetic, phonetic_many, phonetic_text, rules_fingerprint,
+                         set_lexicon, use_lexicon, use_overrides)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+class TestOverrides(unittest.TestCase):
+    """Unit tests for use_overrides() and build_overrides()"""
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.addCleanup(use_overrides)
+
+    def write(self, name, content):
+        """Writes a file of the temporary directory, returns its path"""
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_codes(self):
+        """Overridden words skip the rules, in every spelling, others are unchanged"""
+        self.assertEqual(phonetic("Renault"), 'RENOLT')
+        self.assertEqual(use_overrides({"Renault": "RENO", "Citroën": "SITROEN"}), 2)
+        self.assertEqual(phonetic_many(["Renault", "renault", "RENAULT.", "Citroën"]),
+                         ['RENO', 'RENO', 'RENO', 'SITROEN'])
+        self.assertEqual(phonetic_text("Gilles Renault"), 'JIL RENO')
+        use_overrides()
+        self.assertEqual(phonetic("Renault"), 'RENOLT')
+
+    def test_keep_final_r(self):
+        """Words keeping their final R are encoded like the words of ER_R_EXCEPTIONS"""
+        self.assertEqual(phonetic("Docker"), 'DOK')
+        self.assertEqual(build_overrides(keep_final_r=["Docker", "hiver"]),
+                         {'DOCKER': 'DOKER', 'HIVER': phonetic("hiver")})
+        self.assertEqual(build_overrides({"docker": "DOKR"}, ["Docker"]), {'DOCKER': 'DOKR'})
+        use_overrides(keep_final_r=["Docker"])
+        self.assertEqual(phonetic("Docker"), 'DOKER')
+
+    def test_files(self):
+        """Codes and words are read from files, comments and blank lines are skipped"""
+        codes = self.write('codes.txt', "# marques\nRenault RENO\n\nCitroën\tSITROEN\n")
+        words = self.write('words.txt', "# anglicismes\nDocker\nSpeaker\n")
+        self.assertEqual(use_overrides(codes, words), 4)
+        self.assertEqual([phonetic(word) for word in ("renault", "docker", "speaker")],
+                         ['RENO', 'DOKER', 'SPEAKER'])
+
+    def test_errors(self):
+        """Conflicting codes, words without letters and malformed lines raise errors"""
+        with self.assertRaises(ValueError):
+            build_overrides({"Renault": "RENO", "RENAULT": "RENOLT"})
+        with self.assertRaises(ValueError):
+            build_overrides({"123": "RENO"})
+        with self.assertRaises(TypeError):
+            build_overrides({"Renault": None})
+        with self.assertRaises(ValueError):
+            build_overrides(self.write('codes.txt', "Renault RENO\nCitroën\n"))
+
+    def test_fingerprint(self):
+        """The fingerprint follows the overrides, indexes built with others are stale"""
+        fingerprint = rules_fingerprint()
+        use_overrides({"Renault": "RENO"})
+        overridden = rules_fingerprint()
+        self.assertNotEqual(overridden, fingerprint)
+        use_overrides({"Renault": "RENOL"})
+        self.assertNotIn(rules_fingerprint(), (fingerprint, overridden))
+        use_overrides({"renault": "RENO"})
+        self.assertEqual(rules_fingerprint(), overridden)
+
+        path = os.path.join(self.directory, 'names.idx')
+        PhoneticIndex([(1, "Renault")]).save(path)
+        open_index(path).close()
+        use_overrides()
+        with self.assertRaises(StaleIndexError):
+            open_index(path)
+
+    def test_before_lexicon(self):
+        """Overrides are looked up before the lexicon"""
+        path = os.path.join(self.directory, 'words.lex')
+        build_lexicon(["Renault"], path)
+        use_lexicon(path)
+        self.addCleanup(set_lexicon, None)
+        use_overrides({"Renault": "RENO"})
+        self.assertEqual(phonetic("Renault"), 'RENO')
+        # le lexique ne contient que des codes des règles, il reste valide
+        use_lexicon(path)
+        self.assertEqual(phonetic("Renault"), 'RENO')
+
+    def test_environment(self):
+        """PHONETIC_FR_OVERRIDES loads a file of codes at import"""
+        codes = self.write('codes.txt', "Renault RENO\n")
+        output = subprocess.run(
+            [sys.executable, '-c', 'import phonetic_fr; print(phonetic_fr.phonetic("Renault"))'],
+            cwd=ROOT, env=dict(os.environ, PHONETIC_FR_OVERRIDES=codes),
+            capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'RENO')
+
+    def test_environment_with_lexicon(self):
+        """PHONETIC_FR_OVERRIDES and PHONETIC_FR_LEXICON can be set together"""
+        codes = self.write('codes.txt', "Renault RENO\n")
+        path = os.path.join(self.directory, 'words.lex')
+        build_lexicon(["Renault", "python"], path)
+        output = subprocess.run(
+            [sys.executable, '-c', 'import phonetic_fr; '
+             'print(phonetic_fr.phonetic_text("Renault python"))'],
+            cwd=ROOT, env=dict(os.environ, PHONETIC_FR_OVERRIDES=codes, PHONETIC_FR_LEXICON=path),
+            capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'RENO PITON')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Unit tests for the packing of phonetic codes into integers"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import generated_words
+from phonetic_fr import phonetic_many, pack_code, unpack_code, pack_codes, unpack_codes
+from phonetic_fr.packing import MAX_PACKED_LENGTH, TRUNCATED, HASHED
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LONG_CODES = ["ABCDEFGHIJKLMNOP", "ABCDEFGHIJKLXYZ"]
+
+
+class TestPackCode(unittest.TestCase):
+    """Unit tests for pack_code and unpack_code"""
+    def test_round_trip(self):
+        """Codes of up to 12 letters are packed into 64 bits and unpacked unchanged"""
+        codes = sorted(set(phonetic_many(generated_words(2000))))
+        for code in codes:
+            if len(code) <= MAX_PACKED_LENGTH:
+                packed = pack_code(code)
+                self.assertLess(packed, 1 << 64)
+                self.assertEqual(packed & 15, len(code))
+                self.assertEqual(unpack_code(packed), code)
+
+    def test_order(self):
+        """Packed codes sort like the codes, truncated ones included"""
+        codes = sorted(set(phonetic_many(generated_words(2000)))) + ["A", "AB", "B", ""]
+        codes.sort()
+        packed = [pack_code(code) for code in codes]
+        self.assertEqual(packed, sorted(packed))
+
+    def test_truncate(self):
+        """Long codes keep their first 12 letters"""
+        first, second = (pack_code(code) for code in LONG_CODES)
+        self.assertEqual(first, second)
+        self.assertEqual(first & 15, TRUNCATED)
+        self.assertEqual(unpack_code(first), LONG_CODES[0][:MAX_PACKED_LENGTH])
+        self.assertGreater(first, pack_code(LONG_CODES[0][:MAX_PACKED_LENGTH]))
+
+    def test_hash(self):
+        """Long codes are hashed apart and cannot be unpacked"""
+        first, second = (pack_code(code, overflow='hash') for code in LONG_CODES)
+        self.assertNotEqual(first, second)
+        self.assertEqual(first & 15, HASHED)
+        self.assertEqual(first, pack_code(LONG_CODES[0], overflow='hash'))
+        self.assertEqual(pack_code("JIL", overflow='hash'), pack_code("JIL"))
+        with self.assertRaises(ValueError):
+            unpack_code(first)
+
+    def test_errors(self):
+        """Long codes with 'error', invalid codes and strategies raise ValueError"""
+        with self.assertRaises(ValueError):
+            pack_code(LONG_CODES[0], overflow='error')
+        self.assertEqual(pack_code("JIL", overflow='error'), pack_code("JIL"))
+        for code in ("jil", "J1L", "É"):
+            with self.assertRaises(ValueError):
+                pack_code(code)
+        with self.assertRaises(ValueError):
+            pack_code("JIL", overflow='wrap')
+        for packed in (15, 1 << 64, -1, 2):
+            with self.assertRaises(ValueError):
+                unpack_code(packed)
+
+    def test_unpack_codes(self):
+        """unpack_codes unpacks every value of an iterable"""
+        codes = ["JIL", "MARTIN", "JIL", ""]
+        self.assertEqual(unpack_codes(pack_code(code) for code in codes), codes)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestPackCodes(unittest.TestCase):
+    """Unit tests for pack_codes"""
+    def test_same_as_pack_code(self):
+        """Every strategy gives the values of pack_code as uint64"""
+        codes = phonetic_many(generated_words(2000)) + LONG_CODES + [""]
+        for overflow in ('truncate', 'hash'):
+            packed = pack_codes(codes, overflow=overflow)
+            self.assertEqual(packed.dtype, numpy.uint64)
+            self.assertEqual(packed.tolist(), [pack_code(code, overflow) for code in codes])
+        self.assertEqual(unpack_codes(pack_codes(codes[:50])), codes[:50])
+
+    def test_shapes(self):
+        """NumPy arrays keep their shape, empty inputs give empty arrays"""
+        codes = numpy.array([["JIL", "MARTIN"], ["", "PITON"]])
+        packed = pack_codes(codes)
+        self.assertEqual(packed.shape, (2, 2))
+        self.assertEqual(packed[1, 1], pack_code("PITON"))
+        self.assertEqual(pack_codes([]).shape, (0,))
+        self.assertEqual(pack_codes(iter(["", ""])).tolist(), [0, 0])
+
+    def test_errors(self):
+        """Long codes with 'error' and invalid codes raise ValueError"""
+        with self.assertRaises(ValueError):
+            pack_codes(["JIL"] + LONG_CODES, overflow='error')
+        self.assertEqual(pack_codes(["JIL"], overflow='error').tolist(), [pack_code("JIL")])
+        with self.assertRaises(ValueError):
+            pack_codes(["JIL", "jil"])
+        with self.assertRaises(ValueError):
+            pack_codes(["JIL"], overflow='wrap')
+
+
+if __name__ == '__main__':
+    unittest.main()
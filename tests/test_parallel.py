@@ -0,0 +1,93 @@
+"""Unit tests for the multi-core encoding"""
+import unittest
+import multiprocessing
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import WORDS
+from phonetic_fr import (build_lexicon, phonetic, phonetic_parallel, phonetic_parallel_iter,
+                         register_engine, set_engine, set_lexicon, use_lexicon, use_overrides)
+from phonetic_fr.parallel import _init_worker, _worker_state
+from phonetic_fr.phonetic_fr import _ENGINES
+
+
+def reversed_engine(french_word):
+    """Engine returning the word reversed, picklable by worker processes"""
+    return french_word[::-1]
+
+
+class TestParallel(unittest.TestCase):
+    """Unit tests for phonetic_parallel"""
+    def test_order(self):
+        """Codes are returned in input order"""
+        expected = [phonetic(word) for word in WORDS]
+        self.assertEqual(phonetic_parallel(WORDS, workers=2, chunksize=7), expected)
+
+    def test_streaming(self):
+        """The streaming variant consumes generators and reuses an executor"""
+        expected = [phonetic(word) for word in WORDS]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            codes = phonetic_parallel_iter((word for word in WORDS), chunksize=3,
+                                           executor=executor)
+            self.assertEqual(list(codes), expected)
+            self.assertEqual(list(phonetic_parallel_iter([], executor=executor)), [])
+
+    def test_chunksize(self):
+        """Invalid chunk sizes are rejected"""
+        with self.assertRaises(ValueError):
+            phonetic_parallel(WORDS, chunksize=0)
+
+
+class TestWorkerState(unittest.TestCase):
+    """Workers started by spawn encode words like the calling process"""
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(_ENGINES.pop, 'reversed', None)
+        self.addCleanup(set_engine, 'compiled')
+        self.addCleanup(set_lexicon, None)
+        self.addCleanup(use_overrides)
+        # un lexique dont le code de PYTHON diffère des règles
+        path = os.path.join(directory.name, 'words.lex')
+        build_lexicon(["python"], path)
+        with open(path, 'r+b') as file:
+            data = file.read()
+            file.seek(data.rindex(b'PITON'))
+            file.write(b'PITAN')
+        register_engine('reversed', reversed_engine)
+        set_engine('reversed')
+        use_lexicon(path)
+        use_overrides({"Renault": "RENO"})
+        self.words = ["Renault", "python", "drapeau"] * 10
+        self.expected = ['RENO', 'PITAN', 'UAEPARD'] * 10
+        self.context = multiprocessing.get_context('spawn')
+
+    def test_existing_pool(self):
+        """The state is sent with the chunks given to an existing pool"""
+        self.assertEqual(phonetic_parallel(self.words, chunksize=4), self.expected)
+        with ProcessPoolExecutor(max_workers=2, mp_context=self.context) as executor:
+            self.assertEqual(phonetic_parallel(self.words, chunksize=4, executor=executor),
+                             self.expected)
+            use_overrides()
+            self.assertEqual(phonetic_parallel(self.words, chunksize=4, executor=executor),
+                             ['TLUANER', 'PITAN', 'UAEPARD'] * 10)
+
+    def test_initializer(self):
+        """The state is given once to the workers of a new pool"""
+        with ProcessPoolExecutor(max_workers=2, mp_context=self.context,
+                                 initializer=_init_worker,
+                                 initargs=(_worker_state(),)) as executor:
+            self.assertEqual(list(executor.map(phonetic, self.words)), self.expected)
+
+    def test_unpicklable(self):
+        """Engines which cannot be sent to workers are refused"""
+        register_engine('reversed', lambda french_word: french_word[::-1])
+        with self.assertRaises(ValueError):
+            phonetic_parallel(self.words, workers=2)
+
+if __name__ == '__main__':
+    unittest.main()
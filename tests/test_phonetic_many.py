@@ -0,0 +1,43 @@
+"""Unit tests for phonetic_many"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import phonetic, phonetic_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+WORDS = ["Gilles", "Jill", "gilles", "GILLES!", "python", "", "a", "eau", "BCD", "python"]
+
+
+class TestPhoneticMany(unittest.TestCase):
+    """Unit tests for phonetic_many"""
+    def test_same_as_phonetic(self):
+        """Codes are returned in input order and match phonetic()"""
+        self.assertEqual(phonetic_many(WORDS), [phonetic(word) for word in WORDS])
+
+    def test_iterables(self):
+        """Generators, tuples and empty inputs are accepted"""
+        self.assertEqual(phonetic_many(word for word in WORDS), phonetic_many(WORDS))
+        self.assertEqual(phonetic_many(tuple(WORDS)), phonetic_many(WORDS))
+        self.assertEqual(phonetic_many([]), [])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        """NumPy arrays give NumPy arrays of the same shape"""
+        expected = [phonetic(word) for word in WORDS]
+        for dtype in (str, object):
+            words = numpy.array(WORDS, dtype=dtype).reshape(2, 5)
+            codes = phonetic_many(words)
+            self.assertIsInstance(codes, numpy.ndarray)
+            self.assertEqual(codes.shape, (2, 5))
+            self.assertEqual(codes.ravel().tolist(), expected)
+        self.assertEqual(phonetic_many(numpy.array([], dtype=str)).shape, (0,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Unit tests for phonetic_text and phonetic_text_iter"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import phonetic_text, phonetic_text_iter
+from phonetic_fr.reference import phonetic_text as reference_phonetic_text
+
+TEXTS = ["Le ver vert glisse vers le verre",
+         "  Gilles\tet Jill\n\n, drapeau crapaud  ",
+         "", " ", "mot", "l'œuf-dur !?"]
+
+
+class TestPhoneticText(unittest.TestCase):
+    """Unit tests for phonetic_text and phonetic_text_iter"""
+    def test_same_as_reference(self):
+        """Whitespace is preserved exactly like the original implementation"""
+        for text in TEXTS:
+            self.assertEqual(phonetic_text(text), reference_phonetic_text(text))
+
+    def test_offsets(self):
+        """Spans point to the original words"""
+        text = TEXTS[1]
+        spans = list(phonetic_text_iter(text))
+        self.assertEqual([span[2] for span in spans], text.split())
+        for start, end, original, _ in spans:
+            self.assertEqual(text[start:end], original)
+        self.assertEqual(spans[0], (2, 8, "Gilles", "JIL"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for the per-rule profiling of phonetic()"""
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import generated_words
+from phonetic_fr import RuleProfiler, phonetic, set_cache_size, trace
+from phonetic_fr import phonetic_fr as engine
+from phonetic_fr.cache import DEFAULT_CACHE_SIZE
+from phonetic_fr.rules import MAIN_RULES
+
+
+class TestProfiling(unittest.TestCase):
+    """Unit tests for RuleProfiler and trace"""
+    def setUp(self):
+        set_cache_size(0)
+        self.addCleanup(set_cache_size, DEFAULT_CACHE_SIZE)
+
+    def test_same_codes(self):
+        """Profiled and traced encodings give the codes of phonetic()"""
+        words = list(generated_words(500))
+        expected = [phonetic(word) for word in words]
+        with RuleProfiler():
+            self.assertEqual([phonetic(word) for word in words], expected)
+        self.assertEqual([trace(word)[-1].form for word in words], expected)
+
+    def test_restores_engine(self):
+        """The engine runs its own steps again once the profiler is stopped"""
+        steps = engine._MAIN_STEPS  # pylint: disable=protected-access
+        with RuleProfiler() as profiler:
+            self.assertIsNot(engine._MAIN_STEPS, steps)  # pylint: disable=protected-access
+            with self.assertRaises(RuntimeError):
+                RuleProfiler().start()
+        self.assertIs(engine._MAIN_STEPS, steps)  # pylint: disable=protected-access
+        profiler.stop()
+        self.assertIs(engine._MAIN_STEPS, steps)  # pylint: disable=protected-access
+
+    def test_counters(self):
+        """Rules are evaluated once per word unless the word lacks a string they require"""
+        with RuleProfiler() as profiler:
+            phonetic("python")
+            phonetic("python")
+        stats = profiler.stats()
+        main = [rule for rule in stats if rule.section == 'main']
+        self.assertEqual(len(main), len(MAIN_RULES))
+        self.assertTrue(all(rule.evaluated in (0, 2) for rule in main))
+        evaluated = {rule.pattern: rule.evaluated for rule in main}
+        self.assertEqual((evaluated['ORCHID'], evaluated['PH']), (0, 2))
+        changed = [(rule.pattern, rule.changed) for rule in stats if rule.changed]
+        self.assertEqual(changed, [('TH', 2), ('Y', 2)])
+        self.assertGreater(sum(rule.seconds for rule in stats), 0)
+        self.assertIn('TH -> T', profiler.report(sort='changed', limit=3))
+        profiler.reset()
+        self.assertFalse(any(rule.evaluated for rule in profiler.stats()))
+
+    def test_trace(self):
+        """Traces list the forms of a word with the rule which produced each"""
+        steps = trace("Gilles")
+        self.assertEqual([step.form for step in steps], ['GILLES', 'GILES', 'GILE', 'JILE', 'JIL'])
+        self.assertEqual(steps[0].section, 'input')
+        self.assertEqual((steps[1].section, steps[1].pattern), ('repetition', r'(.)\1'))
+        self.assertEqual([step.section for step in trace("Élodie")],
+                         ['input', 'accents', 'termination'])
+        self.assertEqual(trace("feu")[-1], ('result', -1, '', '', 'FE'))
+
+
+if __name__ == '__main__':
+    unittest.main()
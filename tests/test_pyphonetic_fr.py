@@ -6,6 +6,7 @@ from collections import OrderedDict
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
 # pylint: disable=import-error,wrong-import-position
+import phonetic_fr
 from phonetic_fr import phonetic
 
 class TestPhonetique(unittest.TestCase):
@@ -41,6 +42,17 @@ class TestPhonetique(unittest.TestCase):
                               f"[expecting {expected_result}]")
                         self.assertEqual(actual_result, expected_result)
 
+    def test_public_names(self):
+        """The package exposes its functions, not the modules and helpers it imports"""
+        namespace = {}
+        exec('from phonetic_fr import *', namespace)  # pylint: disable=exec-used
+        for name in ('phonetic', 'phonetic_many', 'phonetic_text', 'set_engine', 'cache_info'):
+            self.assertIn(name, namespace)
+        for name in ('os', 'sys', 'hashlib', 'partial', 'methodcaller', 'bisect_left',
+                     'new_cache', 'TYPE_CHECKING', 'MAIN_RULES', 'base_letters'):
+            self.assertNotIn(name, namespace)
+        self.assertEqual(phonetic_fr.ACCENTS['É'], 'E')
+
 def print_all_failing_cases():
     """Prints all failing tests without asserting"""
     test_cases = TestPhonetique.read_test_cases('tests/test_cases.txt')
@@ -0,0 +1,95 @@
+"""Unit tests for the on-disk phonetic index format"""
+import unittest
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from phonetic_fr import PhoneticIndex, StaleIndexError, open_index, save_index, __version__
+
+NAMES = ["Gilles", "Jill", "Python", "piton", "drapeau", "crapaud", "Gile", "Élodie"]
+
+
+class TestStorage(unittest.TestCase):
+    """Unit tests for save_index and open_index"""
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'names.idx')
+
+    def assert_same_lookups(self, index):
+        """The mapped index answers like the in-memory one"""
+        with open_index(self.path) as mapped:
+            self.assertEqual(sorted(mapped.codes()), sorted(index.codes()))
+            for word in NAMES + ["inconnu", ""]:
+                self.assertEqual(mapped.lookup(word), index.lookup(word))
+                self.assertEqual(word in mapped, word in index)
+
+    def test_integer_keys(self):
+        """Integer keys, including negative ones, are stored as is"""
+        index = PhoneticIndex(enumerate(NAMES, -3))
+        index.save(self.path)
+        self.assert_same_lookups(index)
+        with open_index(self.path) as mapped:
+            self.assertEqual(len(mapped), len(NAMES))
+
+    def test_string_keys(self):
+        """String keys are stored in a key table"""
+        index = PhoneticIndex((f"id-{name}", name) for name in NAMES)
+        index.add("id-Jill", "Gilles")
+        save_index(index, self.path)
+        self.assert_same_lookups(index)
+
+    def test_empty_and_invalid(self):
+        """Empty indexes are valid, mixed keys and foreign files are not"""
+        save_index(PhoneticIndex(), self.path)
+        with open_index(self.path) as mapped:
+            self.assertEqual(mapped.lookup("Gilles"), [])
+        with self.assertRaises(TypeError):
+            save_index(PhoneticIndex([(1, "Gilles"), ("2", "Jill")]), self.path)
+        with open(self.path, 'wb') as file:
+            file.write(b'not an index' * 20)
+        with self.assertRaises(ValueError):
+            open_index(self.path)
+
+    def test_stale(self):
+        """Files written with other rules are detected"""
+        index = PhoneticIndex([(1, "Gilles")])
+        with mock.patch('phonetic_fr.storage.rules_fingerprint', return_value='0' * 64):
+            index.save(self.path)
+        with self.assertRaises(StaleIndexError):
+            open_index(self.path)
+        with open_index(self.path, check_rules=False) as mapped:
+            self.assertEqual(mapped.fingerprint, '0' * 64)
+            self.assertEqual(mapped.version, __version__)
+            self.assertEqual(mapped.lookup("Gilles"), [1])
+
+    def test_concurrent_saves(self):
+        """Threads saving the same path leave one of their indexes, never a mix"""
+        indexes = [PhoneticIndex((number * 1000 + position, name)
+                                 for position, name in enumerate(NAMES * 50))
+                   for number in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda index: index.save(self.path), indexes * 4))
+        with open_index(self.path) as mapped:
+            self.assertIn(mapped.lookup("Gilles"), [index.lookup("Gilles") for index in indexes])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['names.idx'])
+
+    def test_truncated(self):
+        """Files cut anywhere are refused when opened"""
+        for index in (PhoneticIndex(enumerate(NAMES)),
+                      PhoneticIndex((f"id-{name}", name) for name in NAMES)):
+            index.save(self.path)
+            with open(self.path, 'rb') as file:
+                data = file.read()
+            for length in range(len(data)):
+                with open(self.path, 'wb') as file:
+                    file.write(data[:length])
+                with self.assertRaises(ValueError, msg=length):
+                    open_index(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Unit tests for the encoding in a pool of threads"""
+import unittest
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+# pylint: disable=import-error,wrong-import-position
+from words import WORDS, generated_words
+from phonetic_fr import phonetic, phonetic_threaded
+from phonetic_fr.threads import MIN_CHUNK_SIZE, _auto_chunksize
+
+
+class TestThreads(unittest.TestCase):
+    """Unit tests for phonetic_threaded"""
+    def test_order(self):
+        """Codes are returned in input order, from lists and generators"""
+        words = list(generated_words(3000))
+        expected = [phonetic(word) for word in words]
+        self.assertEqual(phonetic_threaded(words, workers=4), expected)
+        self.assertEqual(phonetic_threaded((word for word in WORDS), workers=2, chunksize=7),
+                         [phonetic(word) for word in WORDS])
+        self.assertEqual(phonetic_threaded([]), [])
+
+    def test_executor(self):
+        """An existing executor is reused and left running"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(phonetic_threaded(WORDS, chunksize=9, executor=executor),
+                             [phonetic(word) for word in WORDS])
+            self.assertEqual(executor.submit(abs, -1).result(), 1)
+
+    def test_chunksize(self):
+        """Chunks give each thread a few of them, small inputs are encoded inline"""
+        self.assertEqual(_auto_chunksize(10, 8), MIN_CHUNK_SIZE)
+        self.assertEqual(_auto_chunksize(64000, 8), 2000)
+        self.assertEqual(_auto_chunksize(10000, 4), 625)
+        with mock.patch('phonetic_fr.threads._imap_chunks') as imap_chunks:
+            phonetic_threaded(WORDS, workers=4)
+        imap_chunks.assert_not_called()
+        with self.assertRaises(ValueError):
+            phonetic_threaded(WORDS, chunksize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+"""Words shared by the unit tests"""
+import random
+
+# lettres, accents, ligatures et séparateurs des mots générés
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZÉÈÊËÀÂÄÇŒÆÔÖÛÜÏÎÑéèêàâçœæôûüïîñß -'"
+
+# mots répétés, dont un sans lettre, pour les encodages par lots
+WORDS = ["Gilles", "Jill", "python", "", "eau", "drapeau", "crapaud", "BCD"] * 25
+
+
+def generated_words(count, seed=0):
+    """Generates random words mixing letters, accents, ligatures and separators"""
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 10)))